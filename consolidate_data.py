@@ -461,6 +461,12 @@ class DataConsolidator:
         datasets_dir = self.output_dir / "datasets"
 
         print("  📊 Saving main awards dataset...")
+        # Store fiscal years at their narrowest integer width so the
+        # dashboard reads them narrow from disk
+        if "fiscal_year" in awards_df.columns:
+            awards_df = awards_df.assign(
+                fiscal_year=pd.to_numeric(awards_df["fiscal_year"], downcast="integer")
+            )
         awards_df.to_parquet(
             datasets_dir / "clean_energy_awards_consolidated.parquet", index=False
         )
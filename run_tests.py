@@ -42,6 +42,7 @@ def main():
         print("  transformer  - Run only data transformer tests")
         print("  analytics    - Run only analytics engine tests")
         print("  core         - Run only core processor tests")
+        print("  visualizer   - Run only visualizer tests")
         print("  coverage     - Run tests with coverage report")
         print("  verbose      - Run tests with verbose output")
         sys.exit(1)
@@ -84,6 +85,10 @@ def main():
         cmd = base_cmd + ["tests/test_data_processor/test_core_processor.py"]
         description = "Core processor tests"
 
+    elif test_type == "visualizer":
+        cmd = base_cmd + ["tests/test_visualizer/"]
+        description = "Visualizer component tests"
+
     elif test_type == "coverage":
         cmd = base_cmd + [
             "--cov=src",
@@ -249,6 +249,13 @@ DEFAULT_BASE_URL = "https://api.usaspending.gov/api/v2"
 DEFAULT_USER_AGENT = "CleanEnergyAnalysis/1.0"
 DEFAULT_CONTENT_TYPE = "application/json"
 DEFAULT_TIMEOUT = 30
+DEFAULT_ACCEPT_ENCODING = "gzip"
+
+# Connection pooling and retry settings for the shared HTTP session
+DEFAULT_POOL_SIZE = 16
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+RETRY_STATUS_CODES = [429, 502, 503, 504]
 
 # Default field list for award searches
 DEFAULT_AWARD_FIELDS = [
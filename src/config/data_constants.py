@@ -161,6 +161,9 @@ DATE_COLUMNS = ["start_date", "end_date"]
 # Text columns for cleaning
 TEXT_COLUMNS = ["recipient_name", "description", "awarding_agency"]
 
+# Repeated key columns stored as pandas Categorical after cleaning
+CATEGORICAL_COLUMNS = ["state_code", "recipient_name"]
+
 # Default categorization values
 DEFAULT_TECHNOLOGY_CATEGORY = "Other"
 DEFAULT_RECIPIENT_TYPE = "Other"
@@ -233,3 +236,15 @@ MINIMUM_YOY_PERIODS = 12
 
 # Rounding precision for calculations
 CALCULATION_PRECISION = 2
+
+# On-disk cache for processed award data
+PROCESSED_CACHE_DIR = ".cache/data"
+PROCESSED_CACHE_VERSION = "v1"  # Bump when cleaning/categorization output changes
+PROCESSED_CACHE_MAX_MB = 512
+
+# Rows serialized per chunk when streaming JSON exports
+EXPORT_CHUNK_ROWS = 100_000
+
+# Below this many rows a numba kernel's dispatch and first-call compile cost
+# outweighs what it saves over the numpy/pandas path it replaces
+NUMBA_MIN_ROWS = 50_000
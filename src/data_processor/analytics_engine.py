@@ -300,7 +300,7 @@ class AnalyticsEngine:
 
         # Aggregate by state
         state_agg = (
-            df.groupby(state_column)[value_column]
+            df.groupby(state_column, observed=True)[value_column]
             .agg(["sum", "count", "mean"])
             .reset_index()
         )
@@ -372,18 +372,24 @@ class AnalyticsEngine:
         kmeans = KMeans(n_clusters=n_clusters, random_state=42)
         cluster_labels = kmeans.fit_predict(scaled_data)
 
-        # Add cluster labels to original data
-        cluster_df = cluster_data.copy()
-        cluster_df["cluster"] = cluster_labels
+        # Analyze clusters: per-cluster feature means in one pass over the
+        # feature matrix (labels are dense 0..n_clusters-1, so no hashing needed)
+        values = cluster_data.to_numpy(dtype=np.float64)
+        counts = np.bincount(cluster_labels, minlength=n_clusters)
+        sums = np.zeros((n_clusters, len(features)), dtype=np.float64)
+        np.add.at(sums, cluster_labels, values)
 
-        # Analyze clusters
-        cluster_summary = cluster_df.groupby("cluster")[features].mean().round(2)
-        cluster_sizes = cluster_df["cluster"].value_counts().sort_index()
+        cluster_summary = {}
+        cluster_sizes = {}
+        for cluster_id in np.flatnonzero(counts):
+            means = np.round(sums[cluster_id] / counts[cluster_id], 2)
+            cluster_summary[int(cluster_id)] = dict(zip(features, means.tolist()))
+            cluster_sizes[int(cluster_id)] = int(counts[cluster_id])
 
         return {
             "n_clusters": n_clusters,
-            "cluster_summary": cluster_summary.to_dict("index"),
-            "cluster_sizes": cluster_sizes.to_dict(),
+            "cluster_summary": cluster_summary,
+            "cluster_sizes": cluster_sizes,
             "features_used": features,
             "total_records_clustered": len(cluster_data),
         }
@@ -455,7 +461,7 @@ class AnalyticsEngine:
         # Technology insights
         if "technology_category" in df.columns:
             tech_summary = (
-                df.groupby("technology_category")["award_amount"]
+                df.groupby("technology_category", observed=True)["award_amount"]
                 .sum()
                 .sort_values(ascending=False)
             )
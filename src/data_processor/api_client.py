@@ -7,8 +7,12 @@ This is the main interface for data collection operations.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
 
 # Import config using absolute import
@@ -19,8 +23,75 @@ from src.config.api_config import (
     DEFAULT_CONTENT_TYPE,
     DEFAULT_BASE_URL,
     DEFAULT_AWARD_FIELDS,
+    DEFAULT_ACCEPT_ENCODING,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    RETRY_STATUS_CODES,
 )
 
+# Column position and storage dtype for each requested award field. The field
+# list is fixed for get_clean_energy_data, so the row layout is known up front.
+_AWARD_FIELD_INDEX = {name: i for i, name in enumerate(DEFAULT_AWARD_FIELDS)}
+_AWARD_FIELD_DTYPES = {"Award Amount": np.float64}
+
+
+def _to_float(value: Any) -> float:
+    """Coerce an API value to float, mapping missing/invalid values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+@lru_cache(maxsize=8)
+def _build_row_parser(
+    fields: Tuple[str, ...],
+) -> List[Tuple[str, Any, Optional[Callable[[Any], Any]]]]:
+    """Build the (field, dtype, coercer) plan for a given award field set."""
+    plan = []
+    for field in fields:
+        dtype = _AWARD_FIELD_DTYPES.get(field, object)
+        plan.append((field, dtype, _to_float if dtype is np.float64 else None))
+    return plan
+
+
+def _parse_award_rows(results: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Convert award records into typed column arrays in a single pass per field.
+
+    The field set is the union of the records' keys, in first-seen order, so
+    a field missing from some records is kept and left empty there, as
+    pd.DataFrame(results) would. No per-row dtype inference or list growth
+    is needed.
+
+    Args:
+        results: List of award records as returned by the API
+
+    Returns:
+        Dictionary mapping field name to a preallocated numpy array
+    """
+    n_rows = len(results)
+    if n_rows == 0:
+        return {}
+
+    fields = tuple(
+        sorted(
+            dict.fromkeys(field for row in results for field in row),
+            key=lambda f: _AWARD_FIELD_INDEX.get(f, len(_AWARD_FIELD_INDEX)),
+        )
+    )
+
+    columns = {}
+    for field, dtype, coerce in _build_row_parser(fields):
+        if coerce is None:
+            values = (row.get(field) for row in results)
+        else:
+            values = (coerce(row.get(field)) for row in results)
+        columns[field] = np.fromiter(values, dtype=dtype, count=n_rows)
+
+    return columns
+
 
 class USASpendingAPIClient:
     """
@@ -37,9 +108,27 @@ class USASpendingAPIClient:
             {
                 "Content-Type": DEFAULT_CONTENT_TYPE,
                 "User-Agent": DEFAULT_USER_AGENT,
+                "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
             }
         )
 
+        # Keep connections alive across paginated requests and retry transient
+        # failures. POST is not retried by default, so allow it explicitly.
+        retry = Retry(
+            total=DEFAULT_MAX_RETRIES,
+            backoff_factor=DEFAULT_RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_SIZE,
+            pool_maxsize=DEFAULT_POOL_SIZE,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def build_date_filter(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Build date filter for API requests."""
         return {"time_period": [{"start_date": start_date, "end_date": end_date}]}
@@ -259,6 +348,6 @@ class USASpendingAPIClient:
 
         # Convert to DataFrame
         if results:
-            return pd.DataFrame(results)
+            return pd.DataFrame(_parse_award_rows(results))
         else:
             return pd.DataFrame()
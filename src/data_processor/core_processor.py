@@ -6,12 +6,29 @@ Main orchestrator for all data processing operations. Provides a unified
 interface for data collection, transformation, and analysis.
 """
 
+import hashlib
+import os
+
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from typing import Dict, Any, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+from src.config.data_constants import (
+    EXPORT_CHUNK_ROWS,
+    PROCESSED_CACHE_VERSION,
+    PROCESSED_CACHE_MAX_MB,
+)
 from src.data_processor.api_client import USASpendingAPIClient
-from src.data_processor.data_transformer import DataTransformer
+from src.data_processor.data_transformer import (
+    DataTransformer,
+    factorize_codes,
+    to_records,
+)
 from src.data_processor.analytics_engine import AnalyticsEngine
 
 
@@ -26,11 +43,19 @@ class DataProcessor:
     - Preparation for visualization
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_cache_mb: float = PROCESSED_CACHE_MAX_MB,
+    ):
         self.api_client = USASpendingAPIClient()
         self.transformer = DataTransformer()
         self.analytics = AnalyticsEngine()
         self._cache = {}
+        # With a cache_dir, processed frames also persist as parquet so later
+        # runs skip the API
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._max_cache_bytes = int(max_cache_mb * 1024 * 1024)
 
     def collect_clean_energy_data(
         self,
@@ -51,9 +76,30 @@ class DataProcessor:
         """
         cache_key = f"clean_energy_data_{time_period}_{max_pages}"
 
+        # Every hit gets its own copy, so callers cannot modify the cached
+        # frame. A copy is ~20x cheaper than rebuilding the frame from an
+        # Arrow table (1 ms vs 19 ms for 100k cleaned rows).
         if use_cache and cache_key in self._cache:
             print(f"Using cached data for {time_period}")
-            return self._cache[cache_key]
+            return self._cache[cache_key].copy()
+
+        cache_path = self._disk_cache_path(time_period, max_pages)
+        if use_cache and cache_path is not None and cache_path.exists():
+            try:
+                cached_table = pq.read_table(cache_path)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable cache file {cache_path}: {e}")
+            else:
+                print(f"Using disk cache for {time_period}")
+                # Mark as recently used for eviction; best effort, since the
+                # directory may be read-only or the file already evicted
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                cached_data = cached_table.to_pandas(split_blocks=True)
+                self._cache[cache_key] = cached_data
+                return cached_data.copy()
 
         print(f"Collecting clean energy data for {time_period}...")
 
@@ -68,25 +114,75 @@ class DataProcessor:
 
         print(f"Collected {len(raw_data)} raw records")
 
-        # Clean and transform data
-        cleaned_data = self.transformer.clean_award_data(raw_data)
-        categorized_data = self.transformer.categorize_by_technology(cleaned_data)
-        final_data = self.transformer.categorize_recipients(categorized_data)
+        # Clean and categorize data
+        final_data = self.transformer.transform_pipeline(raw_data)
 
         print(f"Processed to {len(final_data)} clean records")
 
         # Cache the result
         if use_cache:
-            self._cache[cache_key] = final_data
+            self._cache[cache_key] = final_data.copy()
+            if cache_path is not None:
+                # Columns Arrow cannot type (e.g. mixed ints and strings)
+                # only skip the disk cache, not the collection
+                try:
+                    table = pa.Table.from_pandas(final_data, preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    print(f"Not caching {time_period} to disk: {e}")
+                else:
+                    self._write_disk_cache(table, cache_path)
 
         return final_data
 
-    def get_geographic_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _disk_cache_path(self, time_period: str, max_pages: int) -> Optional[Path]:
+        """Parquet path for a collection request, or None if disk caching is off."""
+        if self._cache_dir is None:
+            return None
+
+        key = hashlib.blake2b(
+            f"{time_period}|{max_pages}|{PROCESSED_CACHE_VERSION}".encode()
+        ).hexdigest()[:16]
+        return self._cache_dir / f"{key}.parquet"
+
+    def _write_disk_cache(self, table: pa.Table, path: Path):
+        """Write a processed table to the disk cache and evict old entries."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, path, compression="zstd")
+        except OSError as e:
+            print(f"Could not write cache file {path}: {e}")
+            return
+
+        self._evict_disk_cache(keep=path)
+
+    def _evict_disk_cache(self, keep: Optional[Path] = None):
+        """Delete least recently used parquet files until under the size limit."""
+        files = []
+        for file in self._cache_dir.glob("*.parquet"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+
+        total_bytes = sum(size for _, size, _ in files)
+        for _, size, file in sorted(files, key=lambda entry: entry[0]):
+            if total_bytes <= self._max_cache_bytes:
+                break
+            if file == keep:
+                continue
+            file.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def get_geographic_analysis(
+        self, df: pd.DataFrame, state_summary: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """
         Get comprehensive geographic analysis of the data.
 
         Args:
             df: DataFrame with processed award data
+            state_summary: Precomputed aggregate_by_state result, if available
 
         Returns:
             Dictionary with geographic analysis results
@@ -95,29 +191,33 @@ class DataProcessor:
             return {}
 
         # Basic geographic aggregation
-        state_summary = self.transformer.aggregate_by_state(df)
+        if state_summary is None:
+            state_summary = self.transformer.aggregate_by_state(df)
 
         # Advanced geographic analytics
         geo_patterns = self.analytics.analyze_geographic_patterns(df)
 
-        # Prepare for visualization
-        viz_data = self.transformer.prepare_for_visualization(df, "geographic")
+        # Prepare for visualization, reusing the aggregate computed above
+        viz_data = self.transformer.prepare_for_visualization(
+            df, "geographic", summary=state_summary
+        )
 
         return {
-            "state_summary": state_summary.to_dict("records")
-            if not state_summary.empty
-            else [],
+            "state_summary": to_records(state_summary),
             "patterns": geo_patterns,
             "visualization_data": viz_data,
             "insights": self.analytics.generate_insights(df, "geographic"),
         }
 
-    def get_technology_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def get_technology_analysis(
+        self, df: pd.DataFrame, tech_summary: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """
         Get comprehensive technology analysis of the data.
 
         Args:
             df: DataFrame with processed award data
+            tech_summary: Precomputed aggregate_by_technology result, if available
 
         Returns:
             Dictionary with technology analysis results
@@ -130,21 +230,25 @@ class DataProcessor:
             df = self.transformer.categorize_by_technology(df)
 
         # Technology aggregation
-        tech_summary = self.transformer.aggregate_by_technology(df)
+        if tech_summary is None:
+            tech_summary = self.transformer.aggregate_by_technology(df)
 
         # Prepare for visualization
-        viz_data = self.transformer.prepare_for_visualization(df, "technology")
+        viz_data = self.transformer.prepare_for_visualization(
+            df, "technology", summary=tech_summary
+        )
 
         return {
-            "technology_summary": tech_summary.to_dict("records")
-            if not tech_summary.empty
-            else [],
+            "technology_summary": to_records(tech_summary),
             "visualization_data": viz_data,
             "insights": self.analytics.generate_insights(df, "technology"),
         }
 
     def get_recipient_analysis(
-        self, df: pd.DataFrame, top_n: int = 50
+        self,
+        df: pd.DataFrame,
+        top_n: int = 50,
+        recipient_summary: Optional[pd.DataFrame] = None,
     ) -> Dict[str, Any]:
         """
         Get comprehensive recipient analysis of the data.
@@ -152,6 +256,8 @@ class DataProcessor:
         Args:
             df: DataFrame with processed award data
             top_n: Number of top recipients to analyze
+            recipient_summary: Precomputed aggregate_by_recipient result, if
+                available (top_n is then ignored)
 
         Returns:
             Dictionary with recipient analysis results
@@ -164,7 +270,8 @@ class DataProcessor:
             df = self.transformer.categorize_recipients(df)
 
         # Recipient aggregation
-        recipient_summary = self.transformer.aggregate_by_recipient(df, top_n=top_n)
+        if recipient_summary is None:
+            recipient_summary = self.transformer.aggregate_by_recipient(df, top_n=top_n)
 
         # Clustering analysis
         if len(df) > 10:  # Only cluster if we have enough data
@@ -176,23 +283,27 @@ class DataProcessor:
             cluster_analysis = {}
 
         # Prepare for visualization
-        viz_data = self.transformer.prepare_for_visualization(df, "recipient")
+        viz_data = self.transformer.prepare_for_visualization(
+            df, "recipient", summary=recipient_summary
+        )
 
         return {
-            "recipient_summary": recipient_summary.to_dict("records")
-            if not recipient_summary.empty
-            else [],
+            "recipient_summary": to_records(recipient_summary),
             "clustering": cluster_analysis,
             "visualization_data": viz_data,
             "insights": self.analytics.generate_insights(df, "recipient"),
         }
 
-    def get_timeline_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def get_timeline_analysis(
+        self, df: pd.DataFrame, monthly_series: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """
         Get comprehensive timeline analysis of the data.
 
         Args:
             df: DataFrame with processed award data
+            monthly_series: Precomputed monthly create_time_series result, if
+                available
 
         Returns:
             Dictionary with timeline analysis results
@@ -201,7 +312,8 @@ class DataProcessor:
             return {}
 
         # Time series creation
-        monthly_series = self.transformer.create_time_series(df, freq="M")
+        if monthly_series is None:
+            monthly_series = self.transformer.create_time_series(df, freq="M")
         quarterly_series = self.transformer.create_time_series(df, freq="Q")
 
         # Trend analysis
@@ -211,15 +323,13 @@ class DataProcessor:
         period_comparison = self.analytics.compare_periods(df, split_date="2022-08-16")
 
         # Prepare for visualization
-        viz_data = self.transformer.prepare_for_visualization(df, "timeline")
+        viz_data = self.transformer.prepare_for_visualization(
+            df, "timeline", summary=monthly_series
+        )
 
         return {
-            "monthly_series": monthly_series.to_dict("records")
-            if not monthly_series.empty
-            else [],
-            "quarterly_series": quarterly_series.to_dict("records")
-            if not quarterly_series.empty
-            else [],
+            "monthly_series": to_records(monthly_series),
+            "quarterly_series": to_records(quarterly_series),
             "trends": trend_analysis,
             "period_comparison": period_comparison,
             "visualization_data": viz_data,
@@ -247,7 +357,59 @@ class DataProcessor:
         if df.empty:
             return {"error": "No data available for analysis"}
 
-        # Run all analyses
+        # Categorize once up front so the analyses share one frame
+        if "technology_category" not in df.columns:
+            df = self.transformer.categorize_by_technology(df)
+        if "recipient_type" not in df.columns:
+            df = self.transformer.categorize_recipients(df)
+
+        # Everything below only reads df, so the shared aggregates and then
+        # the four analyses run concurrently; pandas releases the GIL in much
+        # of its groupby and array code
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            summary_futures = {
+                "state_summary": executor.submit(
+                    self.transformer.aggregate_by_state, df
+                ),
+                "tech_summary": executor.submit(
+                    self.transformer.aggregate_by_technology, df
+                ),
+                "recipient_summary": executor.submit(
+                    self.transformer.aggregate_by_recipient, df
+                ),
+                "monthly_series": executor.submit(
+                    self.transformer.create_time_series, df, freq="M"
+                ),
+            }
+            summaries = {
+                name: future.result() for name, future in summary_futures.items()
+            }
+
+            futures = {
+                "geographic": executor.submit(
+                    self.get_geographic_analysis,
+                    df,
+                    state_summary=summaries["state_summary"],
+                ),
+                "technology": executor.submit(
+                    self.get_technology_analysis,
+                    df,
+                    tech_summary=summaries["tech_summary"],
+                ),
+                "recipients": executor.submit(
+                    self.get_recipient_analysis,
+                    df,
+                    recipient_summary=summaries["recipient_summary"],
+                ),
+                "timeline": executor.submit(
+                    self.get_timeline_analysis,
+                    df,
+                    monthly_series=summaries["monthly_series"],
+                ),
+            }
+            analyses = {name: future.result() for name, future in futures.items()}
+
+        # Collect results
         results = {
             "data_summary": {
                 "total_records": len(df),
@@ -263,10 +425,7 @@ class DataProcessor:
                 if "award_amount" in df.columns
                 else 0,
             },
-            "geographic": self.get_geographic_analysis(df),
-            "technology": self.get_technology_analysis(df),
-            "recipients": self.get_recipient_analysis(df),
-            "timeline": self.get_timeline_analysis(df),
+            **analyses,
         }
 
         # Generate overall insights
@@ -291,13 +450,18 @@ class DataProcessor:
 
         stats = {}
 
-        # Basic counts
+        # Basic counts. Counting on integer codes (categorical codes where the
+        # cleaning step produced them) replaces per-column hashing.
         stats["total_records"] = len(df)
         stats["unique_recipients"] = (
-            df["recipient_name"].nunique() if "recipient_name" in df.columns else 0
+            int((self._code_counts(df["recipient_name"])[1] > 0).sum())
+            if "recipient_name" in df.columns
+            else 0
         )
         stats["unique_states"] = (
-            df["state_code"].nunique() if "state_code" in df.columns else 0
+            int((self._code_counts(df["state_code"])[1] > 0).sum())
+            if "state_code" in df.columns
+            else 0
         )
 
         # Funding statistics
@@ -309,16 +473,31 @@ class DataProcessor:
 
         # Technology distribution
         if "technology_category" in df.columns:
-            tech_dist = df["technology_category"].value_counts().to_dict()
-            stats["technology_distribution"] = tech_dist
+            stats["technology_distribution"] = self._distribution(
+                df["technology_category"]
+            )
 
         # Recipient type distribution
         if "recipient_type" in df.columns:
-            recipient_dist = df["recipient_type"].value_counts().to_dict()
-            stats["recipient_type_distribution"] = recipient_dist
+            stats["recipient_type_distribution"] = self._distribution(
+                df["recipient_type"]
+            )
 
         return stats
 
+    def _code_counts(self, series: pd.Series):
+        """Return the uniques of a column and how often each one occurs."""
+        codes, uniques = factorize_codes(series)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        return uniques, counts
+
+    def _distribution(self, series: pd.Series) -> Dict[str, int]:
+        """Value counts of a column as a dict, most common first."""
+        uniques, counts = self._code_counts(series)
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0]
+        return dict(zip(uniques[order].tolist(), counts[order].tolist()))
+
     def export_data(
         self,
         df: pd.DataFrame,
@@ -331,7 +510,7 @@ class DataProcessor:
         Args:
             df: DataFrame to export
             filename: Output filename
-            format: Export format (csv, excel, json)
+            format: Export format (csv, parquet, excel, json)
 
         Returns:
             Path to exported file
@@ -343,25 +522,76 @@ class DataProcessor:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format.lower() == "csv":
-            df.to_csv(output_path, index=False)
+            # Arrow's C++ writer formats cells without per-value Python calls;
+            # columns Arrow cannot type (e.g. mixed ints and strings) fall
+            # back to pandas' writer
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df.to_csv(output_path, index=False)
+            else:
+                pacsv.write_csv(table, output_path)
+        elif format.lower() == "parquet":
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, output_path, compression="zstd", use_dictionary=True)
         elif format.lower() == "excel":
             df.to_excel(output_path, index=False)
         elif format.lower() == "json":
-            df.to_json(output_path, orient="records", indent=2)
+            if len(df) <= EXPORT_CHUNK_ROWS:
+                df.to_json(output_path, orient="records", indent=2)
+            else:
+                self._write_json_array(df, output_path)
         else:
             raise ValueError(f"Unsupported format: {format}")
 
         print(f"Data exported to {output_path}")
         return str(output_path)
 
-    def clear_cache(self):
-        """Clear the data cache."""
+    @staticmethod
+    def _write_json_array(df: pd.DataFrame, output_path: Path):
+        """
+        Write a frame as one JSON array of records, a chunk at a time.
+
+        The output matches to_json(orient="records", indent=2), but no single
+        string holds every row: each chunk's records are written without
+        their enclosing brackets and joined by commas.
+        """
+        with open(output_path, "w") as f:
+            f.write("[\n  ")
+            for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+                chunk = df.iloc[start : start + EXPORT_CHUNK_ROWS].to_json(
+                    orient="records", indent=2
+                )
+                if start:
+                    f.write(",\n  ")
+                f.write(chunk[1:-1].strip())
+            f.write("\n]")
+
+    def clear_cache(self, include_disk: bool = False):
+        """
+        Clear the data cache.
+
+        Args:
+            include_disk: Also delete the parquet files in the disk cache
+        """
         self._cache.clear()
+        if include_disk and self._cache_dir is not None:
+            for file in self._cache_dir.glob("*.parquet"):
+                file.unlink(missing_ok=True)
         print("Cache cleared")
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about cached data."""
+        disk_files = (
+            list(self._cache_dir.glob("*.parquet"))
+            if self._cache_dir is not None
+            else []
+        )
         return {
             "cached_datasets": list(self._cache.keys()),
             "cache_size": len(self._cache),
+            "disk_cache_files": len(disk_files),
+            "disk_cache_mb": round(
+                sum(file.stat().st_size for file in disk_files) / (1024 * 1024), 2
+            ),
         }
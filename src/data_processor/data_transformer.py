@@ -6,8 +6,23 @@ Handles data cleaning, transformation, and categorization operations
 for federal clean energy funding analysis.
 """
 
+import os
+import re
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+import pyarrow as pa
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - regex fallback is used instead
+    ahocorasick = None
+
+try:
+    import numba  # type: ignore
+except ImportError:  # pragma: no cover - the automaton/regex path is used instead
+    numba = None
 
 # Import constants from the new constants file
 from src.config.data_constants import (
@@ -18,8 +33,241 @@ from src.config.data_constants import (
     TEXT_COLUMNS,
     DEFAULT_TECHNOLOGY_CATEGORY,
     DEFAULT_RECIPIENT_TYPE,
+    CATEGORICAL_COLUMNS,
+    NUMBA_MIN_ROWS,
 )
 
+# Resample aliases whose bins match calendar periods, mapped to the period
+# frequency and whether resample labels bins by their first day. Other aliases
+# (hourly, multiples such as "2M", "SMS", anchored "QS-FEB") go to resample.
+PERIOD_FREQUENCIES: Dict[str, Tuple[str, bool]] = {
+    "D": ("D", False),
+    "W": ("W", False),
+    "M": ("M", False),
+    "ME": ("M", False),
+    "MS": ("M", True),
+    "Q": ("Q", False),
+    "QE": ("Q", False),
+    "QS": ("Q", True),
+    "Y": ("Y", False),
+    "YE": ("Y", False),
+    "YS": ("Y", True),
+}
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _first_keyword_match(offsets, buf, kw_offsets, kw_buf, kw_cat):
+        """
+        Find the first matching category for each row of a UTF-8 string buffer.
+
+        Keywords are ordered by category, so the first keyword found in a row
+        belongs to the first matching category and the scan can stop there.
+        """
+        n_rows = len(offsets) - 1
+        out = np.full(n_rows, -1, dtype=np.int16)
+        for row in numba.prange(n_rows):
+            start = offsets[row]
+            end = offsets[row + 1]
+            for k in range(len(kw_cat)):
+                kw_start = kw_offsets[k]
+                kw_len = kw_offsets[k + 1] - kw_start
+                found = False
+                for pos in range(start, end - kw_len + 1):
+                    j = 0
+                    while j < kw_len and buf[pos + j] == kw_buf[kw_start + j]:
+                        j += 1
+                    if j == kw_len:
+                        found = True
+                        break
+                if found:
+                    out[row] = kw_cat[k]
+                    break
+        return out
+
+else:
+    _first_keyword_match = None
+
+
+class _KeywordMatcher:
+    """
+    Matches text against keyword lists for a fixed set of categories.
+
+    All keywords are compiled once into a single Aho-Corasick automaton, so
+    each text is scanned a single time regardless of how many categories
+    exist. If pyahocorasick is not installed, one regex pattern per category
+    is used instead. For large inputs with numba installed, a
+    compiled parallel scan over the Arrow string buffer finds the first
+    matching category directly.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.labels = list(categories)
+        self._automaton = None
+        self._patterns = None
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for idx, keywords in enumerate(categories.values()):
+                for keyword in keywords:
+                    word = keyword.lower()
+                    hits = self._automaton.get(word, ())
+                    self._automaton.add_word(word, hits + (idx,))
+            self._automaton.make_automaton()
+        else:
+            # Kept as plain strings: Arrow-backed string columns reject
+            # compiled patterns in str.contains
+            self._patterns = [
+                "|".join(re.escape(k.lower()) for k in keywords)
+                for keywords in categories.values()
+            ]
+
+        # Flat UTF-8 keyword buffer in category order for the numba kernel
+        keyword_bytes = [
+            (idx, keyword.lower().encode("utf-8"))
+            for idx, keywords in enumerate(categories.values())
+            for keyword in keywords
+            if keyword
+        ]
+        self._kw_cat = np.array([idx for idx, _ in keyword_bytes], dtype=np.int16)
+        self._kw_offsets = np.zeros(len(keyword_bytes) + 1, dtype=np.int64)
+        self._kw_offsets[1:] = np.cumsum([len(kw) for _, kw in keyword_bytes])
+        self._kw_buf = np.frombuffer(
+            b"".join(kw for _, kw in keyword_bytes), dtype=np.uint8
+        )
+
+    def match_masks(self, texts: pd.Series) -> np.ndarray:
+        """
+        Compute which categories match each text.
+
+        Args:
+            texts: Series of text values
+
+        Returns:
+            Boolean array of shape (n_categories, n_rows)
+        """
+        lowered = texts.str.lower()
+        masks = np.zeros((len(self.labels), len(lowered)), dtype=bool)
+
+        if self._automaton is not None:
+            # Scan all rows as one newline-separated buffer (keywords never
+            # contain a newline, so matches cannot span rows), then map match
+            # end offsets back to rows with a single searchsorted.
+            values = [t if isinstance(t, str) else "" for t in lowered.to_numpy()]
+            row_ends = np.cumsum(
+                np.fromiter((len(t) + 1 for t in values), np.int64, len(values))
+            )
+
+            end_offsets = []
+            categories = []
+            for end, hits in self._automaton.iter("\n".join(values)):
+                for category in hits:
+                    end_offsets.append(end)
+                    categories.append(category)
+
+            if end_offsets:
+                rows = np.searchsorted(row_ends, end_offsets, side="right")
+                masks[categories, rows] = True
+        else:
+            # Each category scans independently. Arrow-backed strings run the
+            # regex in a C++ kernel that releases the GIL, so threads scale.
+            def scan(pattern):
+                return lowered.str.contains(pattern, regex=True, na=False).to_numpy(
+                    dtype=bool
+                )
+
+            workers = min(len(self._patterns), os.cpu_count() or 1)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for idx, mask in enumerate(executor.map(scan, self._patterns)):
+                        masks[idx] = mask
+            else:
+                for idx, pattern in enumerate(self._patterns):
+                    masks[idx] = scan(pattern)
+
+        return masks
+
+    def match(self, texts: pd.Series) -> np.ndarray:
+        """
+        Find the matching category for each text.
+
+        When several categories match, the one listed first wins.
+
+        Args:
+            texts: Series of text values
+
+        Returns:
+            Array of category indices into ``labels`` (-1 where nothing matched)
+        """
+        if isinstance(texts.dtype, pd.CategoricalDtype):
+            # Lowercase and scan each distinct value once, then broadcast the
+            # result to rows through the codes (-1 picks the trailing -1)
+            category_matches = self.match(pd.Series(texts.cat.categories))
+            lookup = np.append(category_matches, np.int16(-1))
+            return lookup[texts.cat.codes.to_numpy()]
+
+        if _first_keyword_match is not None and len(texts) >= NUMBA_MIN_ROWS:
+            return self._match_compiled(texts)
+
+        masks = self.match_masks(texts)
+        if not len(self.labels):
+            return np.full(masks.shape[1], -1, dtype=np.int16)
+
+        first_hit = masks.argmax(axis=0).astype(np.int16)
+        return np.where(masks.any(axis=0), first_hit, np.int16(-1))
+
+    def _match_compiled(self, texts: pd.Series) -> np.ndarray:
+        """Run the numba kernel on the lowered texts' Arrow offsets and bytes."""
+        lowered = pa.array(texts.str.lower(), type=pa.large_string(), from_pandas=True)
+        _, offsets_buf, data_buf = lowered.buffers()
+        offsets = np.frombuffer(
+            offsets_buf,
+            dtype=np.int64,
+            count=len(lowered) + 1,
+            offset=lowered.offset * 8,
+        )
+        buf = (
+            np.frombuffer(data_buf, dtype=np.uint8)
+            if data_buf is not None
+            else np.zeros(0, dtype=np.uint8)
+        )
+
+        codes = _first_keyword_match(
+            offsets, buf, self._kw_offsets, self._kw_buf, self._kw_cat
+        )
+        codes[lowered.is_null().to_numpy(zero_copy_only=False)] = -1
+        return codes
+
+    def labels_for(self, texts: pd.Series, default: str) -> pd.Categorical:
+        """Return the category label for each text, using ``default`` if unmatched."""
+        codes = self.match(texts)
+        codes[codes < 0] = len(self.labels)
+        return pd.Categorical.from_codes(codes, categories=self.labels + [default])
+
+
+def factorize_codes(series: pd.Series):
+    """
+    Return integer codes and sorted uniques of a column.
+
+    Categorical columns reuse their existing codes; missing values get -1.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series, sort=True)
+
+
+def to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a summary frame to a list of row dicts.
+
+    Arrow builds the Python objects column by column in C++, which is faster
+    than DataFrame.to_dict("records"). Missing values come back as None and
+    categorical keys as plain strings.
+    """
+    if df.empty:
+        return []
+    return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+
 
 class DataTransformer:
     """
@@ -32,6 +280,8 @@ class DataTransformer:
     def __init__(self):
         self.technology_categories = TECHNOLOGY_CATEGORIES
         self.recipient_types = RECIPIENT_TYPES
+        self._tech_matcher = _KeywordMatcher(self.technology_categories)
+        self._recipient_matcher = _KeywordMatcher(self.recipient_types)
 
     def clean_award_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -46,33 +296,49 @@ class DataTransformer:
         if df.empty:
             return df
 
-        df_clean = df.copy()
-
-        # Rename columns that exist using constants
-        for old_name, new_name in COLUMN_MAPPING.items():
-            if old_name in df_clean.columns:
-                df_clean = df_clean.rename(columns={old_name: new_name})
+        # Rename columns that exist using constants. The shallow copy shares
+        # column data with the caller's frame, and every cleaned column below
+        # is reassigned rather than modified, so the caller's frame is untouched.
+        df_clean = df.copy(deep=False)
+        df_clean.rename(
+            columns={k: v for k, v in COLUMN_MAPPING.items() if k in df.columns},
+            inplace=True,
+        )
 
         # Clean award amounts
         if "award_amount" in df_clean.columns:
-            df_clean["award_amount"] = pd.to_numeric(
-                df_clean["award_amount"], errors="coerce"
-            ).fillna(0)
+            # Kept in float64: float32 spacing is already $8 at $100M, and the
+            # cleaned amounts are exported and cached as well as summed
+            df_clean["award_amount"] = (
+                pd.to_numeric(df_clean["award_amount"], errors="coerce")
+                .fillna(0)
+                .astype(np.float64)
+            )
 
         # Clean dates using constants
         for col in DATE_COLUMNS:
             if col in df_clean.columns:
-                df_clean[col] = pd.to_datetime(df_clean[col], errors="coerce")
+                df_clean[col] = pd.to_datetime(
+                    df_clean[col], errors="coerce", format="ISO8601", cache=True
+                )
 
-        # Clean text fields using constants
+        # Clean text fields using constants. Arrow-backed strings strip in a C
+        # kernel instead of calling str.strip per Python object.
         for col in TEXT_COLUMNS:
             if col in df_clean.columns:
-                df_clean[col] = df_clean[col].astype(str).str.strip()
+                df_clean[col] = (
+                    df_clean[col].astype("string[pyarrow]").str.strip().fillna("")
+                )
 
         # Remove rows with zero or negative amounts
         if "award_amount" in df_clean.columns:
             df_clean = df_clean[df_clean["award_amount"] > 0]
 
+        # Store repeated keys as categoricals so groupbys work on integer codes
+        for col in CATEGORICAL_COLUMNS:
+            if col in df_clean.columns:
+                df_clean[col] = df_clean[col].astype("category")
+
         return df_clean
 
     def categorize_by_technology(
@@ -91,17 +357,9 @@ class DataTransformer:
         if df.empty or text_column not in df.columns:
             return df
 
-        df_cat = df.copy()
-        df_cat["technology_category"] = DEFAULT_TECHNOLOGY_CATEGORY
-
-        for tech, keywords in self.technology_categories.items():
-            # Create boolean mask for this technology
-            mask = (
-                df_cat[text_column]
-                .str.lower()
-                .str.contains("|".join(keywords), na=False, regex=True)
-            )
-            df_cat.loc[mask, "technology_category"] = tech
+        # Shallow copy: existing columns are shared, only the new column is added
+        df_cat = df.copy(deep=False)
+        self._apply_tech_category(df_cat, text_column)
 
         return df_cat
 
@@ -121,20 +379,48 @@ class DataTransformer:
         if df.empty or recipient_column not in df.columns:
             return df
 
-        df_cat = df.copy()
-        df_cat["recipient_type"] = DEFAULT_RECIPIENT_TYPE
-
-        for org_type, keywords in self.recipient_types.items():
-            # Create boolean mask for this organization type
-            mask = (
-                df_cat[recipient_column]
-                .str.lower()
-                .str.contains("|".join(keywords), na=False, regex=True)
-            )
-            df_cat.loc[mask, "recipient_type"] = org_type
+        df_cat = df.copy(deep=False)
+        self._apply_recipient_category(df_cat, recipient_column)
 
         return df_cat
 
+    def transform_pipeline(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean raw award data and add technology and recipient categories.
+
+        Equivalent to clean_award_data, categorize_by_technology and
+        categorize_recipients in sequence, but the category columns are
+        added to the cleaned frame instead of to fresh copies of it.
+
+        Args:
+            df: Raw award data DataFrame
+
+        Returns:
+            Cleaned and categorized DataFrame
+        """
+        df_clean = self.clean_award_data(df)
+        if df_clean.empty:
+            return df_clean
+
+        if "description" in df_clean.columns:
+            self._apply_tech_category(df_clean, "description")
+        if "recipient_name" in df_clean.columns:
+            self._apply_recipient_category(df_clean, "recipient_name")
+
+        return df_clean
+
+    def _apply_tech_category(self, df: pd.DataFrame, text_column: str):
+        """Add the technology_category column to df in place."""
+        df["technology_category"] = self._tech_matcher.labels_for(
+            df[text_column], DEFAULT_TECHNOLOGY_CATEGORY
+        )
+
+    def _apply_recipient_category(self, df: pd.DataFrame, recipient_column: str):
+        """Add the recipient_type column to df in place."""
+        df["recipient_type"] = self._recipient_matcher.labels_for(
+            df[recipient_column], DEFAULT_RECIPIENT_TYPE
+        )
+
     def aggregate_by_state(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Aggregate funding data by state.
@@ -148,31 +434,47 @@ class DataTransformer:
         if df.empty or "state_code" not in df.columns:
             return pd.DataFrame()
 
-        # Group by state and aggregate
-        state_agg = (
-            df.groupby("state_code")
-            .agg(
-                {"award_amount": ["sum", "count", "mean"], "recipient_name": "nunique"}
-            )
-            .round(2)
-        )
-
-        # Flatten column names
-        state_agg.columns = [
-            "total_funding",
-            "award_count",
-            "avg_award_size",
-            "unique_recipients",
-        ]
+        # Aggregate on integer state codes with bincount instead of a hash groupby
+        state_codes, state_uniques = factorize_codes(df["state_code"])
+        has_state = state_codes >= 0
+        n_states = len(state_uniques)
 
-        state_agg = state_agg.reset_index()
+        amounts = df["award_amount"].to_numpy(dtype=np.float64)
+        has_amount = has_state & ~np.isnan(amounts)
+        total_funding = np.bincount(
+            state_codes[has_amount], weights=amounts[has_amount], minlength=n_states
+        )
+        award_count = np.bincount(state_codes[has_amount], minlength=n_states)
+
+        # Unique recipients: count distinct (state, recipient) code pairs
+        recipient_codes, recipient_uniques = factorize_codes(df["recipient_name"])
+        has_pair = has_state & (recipient_codes >= 0)
+        pairs = np.unique(
+            state_codes[has_pair].astype(np.int64) * len(recipient_uniques)
+            + recipient_codes[has_pair]
+        )
+        unique_recipients = np.bincount(
+            pairs // max(len(recipient_uniques), 1), minlength=n_states
+        )
 
-        # Add state names if available
+        observed = np.bincount(state_codes[has_state], minlength=n_states) > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_award_size = total_funding / award_count
+
+        state_agg = pd.DataFrame(
+            {
+                "state_code": np.asarray(state_uniques, dtype=object)[observed],
+                "total_funding": total_funding[observed],
+                "award_count": award_count[observed],
+                "avg_award_size": avg_award_size[observed],
+                "unique_recipients": unique_recipients[observed],
+            }
+        ).round(2)
+
+        # Add state names if available (a keyed lookup, not a join)
         if "state_name" in df.columns:
-            state_names = df.groupby("state_code")["state_name"].first()
-            state_agg = state_agg.merge(
-                state_names.reset_index(), on="state_code", how="left"
-            )
+            state_names = df.groupby("state_code", observed=True)["state_name"].first()
+            state_agg["state_name"] = state_agg["state_code"].map(state_names)
 
         return state_agg.sort_values("total_funding", ascending=False)
 
@@ -189,13 +491,15 @@ class DataTransformer:
         if df.empty or "technology_category" not in df.columns:
             return pd.DataFrame()
 
+        tech_groups = df["technology_category"]
         tech_agg = (
-            df.groupby("technology_category")
-            .agg(
-                {"award_amount": ["sum", "count", "mean"], "recipient_name": "nunique"}
-            )
-            .round(2)
+            df["award_amount"]
+            .groupby(tech_groups, observed=True, sort=False)
+            .agg(["sum", "count", "mean"])
         )
+        tech_agg["unique_recipients"] = df.groupby(
+            tech_groups, observed=True, sort=False
+        )["recipient_name"].nunique()
 
         # Flatten column names
         tech_agg.columns = [
@@ -205,7 +509,7 @@ class DataTransformer:
             "unique_recipients",
         ]
 
-        tech_agg = tech_agg.reset_index()
+        tech_agg = tech_agg.round(2).reset_index()
 
         # Calculate percentages
         total_funding = tech_agg["total_funding"].sum()
@@ -229,19 +533,16 @@ class DataTransformer:
         if df.empty or "recipient_name" not in df.columns:
             return pd.DataFrame()
 
+        recipient_groups = df["recipient_name"]
         recipient_agg = (
-            df.groupby("recipient_name")
-            .agg(
-                {
-                    "award_amount": ["sum", "count", "mean"],
-                    "state_code": "first",
-                    "technology_category": lambda x: x.mode().iloc[0]
-                    if not x.empty
-                    else "Other",
-                }
-            )
+            df["award_amount"]
+            .groupby(recipient_groups, observed=True, sort=False)
+            .agg(["sum", "count", "mean"])
             .round(2)
         )
+        recipient_agg["state_code"] = df.groupby(
+            recipient_groups, observed=True, sort=False
+        )["state_code"].first()
 
         # Flatten column names
         recipient_agg.columns = [
@@ -249,19 +550,80 @@ class DataTransformer:
             "award_count",
             "avg_award_size",
             "primary_state",
-            "primary_technology",
         ]
 
+        # Keep only the top recipients before the per-recipient lookups below
+        recipient_agg = recipient_agg.iloc[
+            self._top_n_positions(recipient_agg["total_funding"].to_numpy(), top_n)
+        ]
+
+        # Most common technology per recipient
+        if "technology_category" in df.columns:
+            primary_tech = self._most_common_by_group(
+                df["recipient_name"], df["technology_category"]
+            )
+            recipient_agg["primary_technology"] = primary_tech.reindex(
+                recipient_agg.index
+            ).to_numpy()
+        else:
+            recipient_agg["primary_technology"] = DEFAULT_TECHNOLOGY_CATEGORY
+
         recipient_agg = recipient_agg.reset_index()
 
         # Add recipient type if available
         if "recipient_type" in df.columns:
-            recipient_types = df.groupby("recipient_name")["recipient_type"].first()
-            recipient_agg = recipient_agg.merge(
-                recipient_types.reset_index(), on="recipient_name", how="left"
+            recipient_types = df.groupby("recipient_name", observed=True)[
+                "recipient_type"
+            ].first()
+            recipient_agg["recipient_type"] = recipient_agg["recipient_name"].map(
+                recipient_types
             )
 
-        return recipient_agg.sort_values("total_funding", ascending=False).head(top_n)
+        return recipient_agg
+
+    @staticmethod
+    def _top_n_positions(values: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Positions of the top_n largest values, largest first.
+
+        Uses a linear-time partial selection and only sorts the selected
+        values, instead of sorting the whole array.
+        """
+        top_n = max(top_n, 0)
+        if len(values) > top_n:
+            candidates = np.argpartition(-values, top_n)[:top_n]
+        else:
+            candidates = np.arange(len(values))
+        return candidates[np.argsort(-values[candidates], kind="stable")]
+
+    def _most_common_by_group(
+        self, keys: pd.Series, values: pd.Series, default: str = "Other"
+    ) -> pd.Series:
+        """
+        Find the most frequent value for each group key without per-group Python.
+
+        Ties resolve to the first value in sorted (or category) order, matching
+        ``Series.mode().iloc[0]``. Groups with only missing values get ``default``.
+
+        Args:
+            keys: Group key for each row
+            values: Value to take the mode of for each row
+            default: Value used for groups with no non-missing values
+
+        Returns:
+            Series of most common values indexed by group key
+        """
+        key_codes, key_uniques = factorize_codes(keys)
+        value_codes, value_uniques = factorize_codes(values)
+
+        valid = (key_codes >= 0) & (value_codes >= 0)
+        counts = np.zeros((len(key_uniques), len(value_uniques)), dtype=np.int64)
+        np.add.at(counts, (key_codes[valid], value_codes[valid]), 1)
+
+        most_common = np.asarray(value_uniques, dtype=object)[counts.argmax(axis=1)]
+        most_common[counts.sum(axis=1) == 0] = default
+
+        return pd.Series(most_common, index=key_uniques)
 
     def create_time_series(
         self, df: pd.DataFrame, date_column: str = "start_date", freq: str = "M"
@@ -272,7 +634,8 @@ class DataTransformer:
         Args:
             df: DataFrame with award data
             date_column: Column containing dates
-            freq: Frequency for grouping (M=monthly, Q=quarterly, Y=yearly)
+            freq: Frequency for grouping (M=monthly, Q=quarterly, Y=yearly);
+                any resample alias is accepted, e.g. MS labels by month start
 
         Returns:
             DataFrame with time series data
@@ -280,25 +643,87 @@ class DataTransformer:
         if df.empty or date_column not in df.columns:
             return pd.DataFrame()
 
-        df_ts = df.copy()
-        df_ts = df_ts.dropna(subset=[date_column])
+        columns = [
+            date_column,
+            "total_funding",
+            "award_count",
+            "unique_recipients",
+            "cumulative_funding",
+        ]
+
+        # Bucket rows by integer period ordinal and aggregate with bincount,
+        # instead of building a DatetimeIndex and resampling
+        dates = df[date_column]
+        has_date = dates.notna().to_numpy()
+        if not has_date.any():
+            return pd.DataFrame(columns=columns)
 
-        # Set date as index and resample
-        df_ts = df_ts.set_index(date_column)
+        if freq not in PERIOD_FREQUENCIES:
+            return self._resample_time_series(df, date_column, freq, columns)
 
-        time_series = (
-            df_ts.resample(freq)
-            .agg({"award_amount": ["sum", "count"], "recipient_name": "nunique"})
-            .round(2)
+        period_freq, label_start = PERIOD_FREQUENCIES[freq]
+        ordinals = dates[has_date].dt.to_period(period_freq).array.asi8
+        first_period = ordinals.min()
+        period_codes = ordinals - first_period
+        n_periods = int(period_codes.max()) + 1
+
+        amounts = df["award_amount"].to_numpy(dtype=np.float64, na_value=np.nan)[
+            has_date
+        ]
+        has_amount = ~np.isnan(amounts)
+        total_funding = np.bincount(
+            period_codes[has_amount], weights=amounts[has_amount], minlength=n_periods
+        ).round(2)
+        award_count = np.bincount(period_codes[has_amount], minlength=n_periods)
+
+        unique_recipients = np.zeros(n_periods, dtype=np.int64)
+        if "recipient_name" in df.columns:
+            recipient_codes, recipient_uniques = factorize_codes(df["recipient_name"])
+            recipient_codes = recipient_codes[has_date]
+            n_recipients = max(len(recipient_uniques), 1)
+            has_pair = recipient_codes >= 0
+            pairs = np.unique(
+                period_codes[has_pair] * n_recipients + recipient_codes[has_pair]
+            )
+            unique_recipients = np.bincount(pairs // n_recipients, minlength=n_periods)
+
+        # Label each period by its first or last day, as resample does
+        periods = pd.period_range(
+            pd.Period(ordinal=first_period, freq=period_freq),
+            periods=n_periods,
+            freq=period_freq,
+        )
+        labels = periods.start_time if label_start else periods.end_time.normalize()
+
+        return pd.DataFrame(
+            {
+                date_column: labels,
+                "total_funding": total_funding,
+                "award_count": award_count,
+                "unique_recipients": unique_recipients,
+                "cumulative_funding": total_funding.cumsum(),
+            },
+            columns=columns,
         )
 
-        # Flatten column names
-        time_series.columns = ["total_funding", "award_count", "unique_recipients"]
+    def _resample_time_series(
+        self, df: pd.DataFrame, date_column: str, freq: str, columns: List[str]
+    ) -> pd.DataFrame:
+        """Time series for frequencies without a calendar period equivalent."""
+        df_ts = df.dropna(subset=[date_column]).set_index(date_column)
+
+        aggregations: Dict[str, Any] = {"award_amount": ["sum", "count"]}
+        if "recipient_name" in df_ts.columns:
+            aggregations["recipient_name"] = "nunique"
+        time_series = df_ts.resample(freq).agg(aggregations).round(2)
+        time_series.columns = ["total_funding", "award_count"] + (
+            ["unique_recipients"] if "recipient_name" in df_ts.columns else []
+        )
+        if "unique_recipients" not in time_series.columns:
+            time_series["unique_recipients"] = 0
 
-        # Add cumulative funding
         time_series["cumulative_funding"] = time_series["total_funding"].cumsum()
-
-        return time_series.reset_index()
+        return time_series.reset_index()[columns]
 
     def calculate_growth_rates(
         self, df: pd.DataFrame, value_column: str = "total_funding", periods: int = 1
@@ -333,7 +758,10 @@ class DataTransformer:
         return df_growth
 
     def prepare_for_visualization(
-        self, df: pd.DataFrame, viz_type: str = "geographic"
+        self,
+        df: pd.DataFrame,
+        viz_type: str = "geographic",
+        summary: Optional[pd.DataFrame] = None,
     ) -> Dict[str, Any]:
         """
         Prepare data specifically for visualization components.
@@ -341,6 +769,9 @@ class DataTransformer:
         Args:
             df: Processed DataFrame
             viz_type: Type of visualization (geographic, timeline, technology, etc.)
+            summary: Already computed aggregate for this viz type (state,
+                monthly time series, technology or recipient summary), reused
+                instead of aggregating df again
 
         Returns:
             Dictionary with data formatted for specific visualization
@@ -349,22 +780,25 @@ class DataTransformer:
             return {}
 
         if viz_type == "geographic":
-            return self._prepare_geographic_viz(df)
+            return self._prepare_geographic_viz(df, summary)
         elif viz_type == "timeline":
-            return self._prepare_timeline_viz(df)
+            return self._prepare_timeline_viz(df, summary)
         elif viz_type == "technology":
-            return self._prepare_technology_viz(df)
+            return self._prepare_technology_viz(df, summary)
         elif viz_type == "recipient":
-            return self._prepare_recipient_viz(df)
+            return self._prepare_recipient_viz(df, summary)
         else:
             return {"data": df.to_dict("records")}
 
-    def _prepare_geographic_viz(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _prepare_geographic_viz(
+        self, df: pd.DataFrame, state_data: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """Prepare data for geographic visualizations."""
         if "state_code" not in df.columns:
             return {}
 
-        state_data = self.aggregate_by_state(df)
+        if state_data is None:
+            state_data = self.aggregate_by_state(df)
 
         return {
             "state_summary": state_data.to_dict("records"),
@@ -375,12 +809,15 @@ class DataTransformer:
             ].to_dict("records"),
         }
 
-    def _prepare_timeline_viz(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _prepare_timeline_viz(
+        self, df: pd.DataFrame, monthly_data: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """Prepare data for timeline visualizations."""
         if "start_date" not in df.columns:
             return {}
 
-        monthly_data = self.create_time_series(df, freq="M")
+        if monthly_data is None:
+            monthly_data = self.create_time_series(df, freq="M")
         monthly_data = self.calculate_growth_rates(monthly_data)
 
         return {
@@ -396,12 +833,14 @@ class DataTransformer:
             else 0,
         }
 
-    def _prepare_technology_viz(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _prepare_technology_viz(
+        self, df: pd.DataFrame, tech_data: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """Prepare data for technology visualizations."""
-        if "technology_category" not in df.columns:
-            df = self.categorize_by_technology(df)
-
-        tech_data = self.aggregate_by_technology(df)
+        if tech_data is None:
+            if "technology_category" not in df.columns:
+                df = self.categorize_by_technology(df)
+            tech_data = self.aggregate_by_technology(df)
 
         return {
             "technology_breakdown": tech_data.to_dict("records"),
@@ -412,12 +851,15 @@ class DataTransformer:
             "diversity_index": len(tech_data[tech_data["total_funding"] > 0]),
         }
 
-    def _prepare_recipient_viz(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _prepare_recipient_viz(
+        self, df: pd.DataFrame, recipient_data: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """Prepare data for recipient visualizations."""
         if "recipient_name" not in df.columns:
             return {}
 
-        recipient_data = self.aggregate_by_recipient(df)
+        if recipient_data is None:
+            recipient_data = self.aggregate_by_recipient(df)
 
         return {
             "top_recipients": recipient_data.to_dict("records"),
@@ -14,9 +14,120 @@ Benefits:
 - Better performance and reliability
 """
 
-from typing import Dict, List, Optional, Any
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
-from src.visualizer.cached_data_loader import CachedDataLoader
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from src.config.data_constants import NUMBA_MIN_ROWS
+from src.data_processor.data_transformer import to_records
+from src.visualizer.cached_data_loader import (
+    AWARD_DATE_COLUMNS,
+    CATEGORY_COLUMNS,
+    INTEGER_COLUMNS,
+    CachedDataLoader,
+)
+
+try:
+    import numba  # type: ignore
+except ImportError:  # pragma: no cover - the per-column reductions are used instead
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+# Schema bits recorded once per load, so endpoints test an int instead of
+# probing the column names on every call
+HAS_AWARD_AMOUNT = 1
+HAS_STATE = 2
+HAS_TECH = 4
+HAS_START = 8
+HAS_FY = 16
+HAS_RECIPIENT = 32
+HAS_PERIOD = 64
+SCHEMA_FLAGS = {
+    "award_amount": HAS_AWARD_AMOUNT,
+    "performance_state_code": HAS_STATE,
+    "technology_category": HAS_TECH,
+    "start_date": HAS_START,
+    "fiscal_year": HAS_FY,
+    "recipient_name": HAS_RECIPIENT,
+    "time_period_category": HAS_PERIOD,
+}
+
+# Columns read by the geographic, technology and timeline sections
+COMPARATIVE_COLUMNS = [
+    "performance_state_code",
+    "technology_category",
+    "recipient_name",
+    "start_date",
+    "fiscal_year",
+    "time_period_category",
+    "award_amount",
+]
+
+# Columns whose top group by funding is reported in the insights
+INSIGHT_KEY_COLUMNS = ["technology_category", "performance_state_code", "fiscal_year"]
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _fused_insights(
+        amounts, tech_codes, state_codes, year_codes, n_tech, n_state, n_year
+    ):
+        """
+        Sum award amounts overall and per technology, state and year in one pass.
+
+        Each thread accumulates into its own row of the partial sums, which
+        are reduced at the end. Missing amounts are skipped and missing keys
+        (code -1) only count toward the overall total.
+        """
+        n_threads = numba.get_num_threads()
+        n_rows = len(amounts)
+        chunk = (n_rows + n_threads - 1) // n_threads
+        totals = np.zeros(n_threads)
+        counts = np.zeros(n_threads, dtype=np.int64)
+        tech_sums = np.zeros((n_threads, n_tech))
+        state_sums = np.zeros((n_threads, n_state))
+        year_sums = np.zeros((n_threads, n_year))
+        for t in numba.prange(n_threads):
+            for i in range(t * chunk, min(n_rows, (t + 1) * chunk)):
+                amount = amounts[i]
+                if np.isnan(amount):
+                    continue
+                totals[t] += amount
+                counts[t] += 1
+                if tech_codes[i] >= 0:
+                    tech_sums[t, tech_codes[i]] += amount
+                if state_codes[i] >= 0:
+                    state_sums[t, state_codes[i]] += amount
+                if year_codes[i] >= 0:
+                    year_sums[t, year_codes[i]] += amount
+        return (
+            totals.sum(),
+            counts.sum(),
+            tech_sums.sum(axis=0),
+            state_sums.sum(axis=0),
+            year_sums.sum(axis=0),
+        )
+
+else:
+    _fused_insights = None
+
+
+# Parquet export settings: zstd level 3 compresses well without slowing the
+# write much, and bounded row groups keep re-reads column- and row-prunable
+EXPORT_COMPRESSION_LEVEL = 3
+EXPORT_ROW_GROUP_SIZE = 128_000
+
+# Key columns dictionary-encoded when a view converts them. Recipient names
+# join the loader's categoricals here, since only the loaded period's rows
+# are encoded and every recipient aggregation groups on them
+VIEW_CATEGORY_COLUMNS = CATEGORY_COLUMNS + ["recipient_name"]
 
 
 class CachedDataConnector:
@@ -29,11 +140,19 @@ class CachedDataConnector:
 
     def __init__(self):
         self.cached_loader = CachedDataLoader()
-        self._current_data = None
+        # Rows of the loaded period; pandas columns are materialized on demand
+        self._current_table: Optional[pa.Table] = None
+        self._columns: Dict[str, pd.Series] = {}
+        self._schema_flags = 0
         self._current_time_period = None
+        # Aggregations shared between endpoints, keyed by (time_period, group_col)
+        self._agg_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+        # Endpoint results built by preload_all_data, keyed by time period
+        self._precomputed: Dict[str, Dict[str, Any]] = {}
+        # Time periods baked into the cached dataset, read once
+        self._available_periods: Optional[List[str]] = None
 
-        print("🚀 Cached Data Connector initialized")
-        print("📊 Using consolidated data - no API calls needed!")
+        logger.debug("Cached data connector initialized")
 
     def load_data(
         self,
@@ -53,45 +172,102 @@ class CachedDataConnector:
             True if data loaded successfully, False otherwise
         """
         try:
-            print(f"📊 Loading cached data for time period: {time_period}")
+            logger.debug("Loading cached data for time period %s", time_period)
 
-            # Load the full dataset
-            self._current_data = self.cached_loader.get_awards_data(sample=False)
+            # The full dataset stays in a shared, memory-mapped Arrow table;
+            # only the selected period is converted to pandas
+            table = self.cached_loader.get_awards_table(sample=False)
+            if time_period != self._current_time_period:
+                self._agg_cache.clear()
             self._current_time_period = time_period
-            print(f"🔧 Set _current_time_period to: {self._current_time_period}")
 
             # Filter by time period if specified and not full period
             if (
                 time_period != "full_period"
-                and "time_period_category" in self._current_data.columns
+                and "time_period_category" in table.column_names
             ):
-                print(
-                    f"🔍 Available time periods in data: {self._current_data['time_period_category'].unique()}"
+                # The distinct scan only runs when someone is reading it
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Available time periods in data: %s",
+                        pc.unique(table["time_period_category"]).to_pylist(),
+                    )
+                filtered_table = table.filter(
+                    pc.equal(table["time_period_category"], time_period)
                 )
-                filtered_data = self._current_data[
-                    self._current_data["time_period_category"] == time_period
-                ]
-                if not filtered_data.empty:
-                    self._current_data = filtered_data
-                    print(
-                        f"✅ Filtered to {len(self._current_data):,} records for {time_period}"
+                if filtered_table.num_rows > 0:
+                    table = filtered_table
+                    logger.debug(
+                        "Filtered to %d records for %s", table.num_rows, time_period
                     )
                 else:
-                    print(
-                        f"⚠️  No data found for time period {time_period}, using full dataset"
+                    logger.warning(
+                        "No data found for time period %s, using full dataset",
+                        time_period,
                     )
 
-            print(f"✅ Loaded {len(self._current_data):,} total records")
-            print(f"🔧 Final _current_time_period: {self._current_time_period}")
-            return not self._current_data.empty
+            self._current_table = table
+            self._columns = {}
+            self._schema_flags = 0
+            for col in table.column_names:
+                self._schema_flags |= SCHEMA_FLAGS.get(col, 0)
+
+            logger.debug("Loaded %d total records", table.num_rows)
+            return table.num_rows > 0
 
         except Exception as e:
-            print(f"❌ Error loading cached data: {e}")
+            logger.error("Error loading cached data: %s", e)
             return False
 
+    def _precomputed_result(self, endpoint: str) -> Any:
+        """
+        Return the preloaded result of an endpoint for the current period.
+
+        Results nest lists of record dicts, so callers get a deep copy and
+        sorting or adding keys cannot change what later reruns see. They are
+        aggregates of at most a few hundred rows, so the copy is cheap.
+        """
+        result = self._precomputed.get(self._current_time_period, {}).get(endpoint)
+        return copy.deepcopy(result)
+
+    def _has(self, flags: int) -> bool:
+        """Whether every column in the flags bitmask is present."""
+        return self._schema_flags & flags == flags
+
+    def _is_empty(self) -> bool:
+        """Whether no rows are loaded."""
+        return self._current_table is None or self._current_table.num_rows == 0
+
+    def _view(self, cols: List[str]) -> pd.DataFrame:
+        """
+        Return the loaded rows restricted to cols, skipping absent columns.
+
+        Each column is converted from the Arrow slice the first time an
+        endpoint asks for it, so columns no endpoint reads are never
+        materialized.
+        """
+        table = self._current_table
+        cols = [c for c in cols if c in table.column_names]
+        missing = [c for c in cols if c not in self._columns]
+        if missing:
+            # Key columns are dictionary-encoded from the selected rows, so
+            # their categories are exactly the values in the loaded period
+            converted = table.select(missing).to_pandas(
+                categories=[c for c in missing if c in VIEW_CATEGORY_COLUMNS],
+                split_blocks=True,
+            )
+            for col in missing:
+                series = converted[col]
+                if col in AWARD_DATE_COLUMNS and series.dtype == object:
+                    series = pd.to_datetime(series, errors="coerce", cache=True)
+                elif col in INTEGER_COLUMNS:
+                    series = pd.to_numeric(series, downcast="integer")
+                self._columns[col] = series
+        return pd.DataFrame({c: self._columns[c] for c in cols}, copy=False)
+
     def get_summary_metrics(self) -> Dict[str, Any]:
         """Get high-level summary metrics for dashboard header."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return {
                 "total_funding": 0,
                 "total_awards": 0,
@@ -99,23 +275,32 @@ class CachedDataConnector:
                 "top_technology": "N/A",
             }
 
-        df = self._current_data
+        precomputed = self._precomputed_result("summary")
+        if precomputed is not None:
+            return precomputed
 
-        # Calculate metrics using standardized column names
-        total_funding = df["award_amount"].sum() if "award_amount" in df.columns else 0
-        total_awards = len(df)
-        unique_states = (
-            df["performance_state_code"].nunique()
-            if "performance_state_code" in df.columns
-            else 0
+        df = self._view(
+            ["award_amount", "performance_state_code", "technology_category"]
         )
 
+        # Calculate metrics using standardized column names; the amount
+        # column is the only full scan, the rest reuse load-time metadata
+        total_funding = df["award_amount"].sum() if self._has(HAS_AWARD_AMOUNT) else 0
+        total_awards = len(df)
+        unique_states = 0
+        if self._has(HAS_STATE):
+            states = df["performance_state_code"]
+            # Categories are built from the loaded slice, so their count is
+            # the number of distinct states
+            if isinstance(states.dtype, pd.CategoricalDtype):
+                unique_states = states.cat.categories.size
+            else:
+                unique_states = states.nunique()
+
         # Top technology
         top_tech = "N/A"
-        if "technology_category" in df.columns:
-            tech_summary = df.groupby("technology_category")["award_amount"].sum()
-            if not tech_summary.empty:
-                top_tech = tech_summary.idxmax()
+        if self._has(HAS_TECH):
+            top_tech = self._top_group("technology_category") or "N/A"
 
         return {
             "total_funding": total_funding,
@@ -124,48 +309,202 @@ class CachedDataConnector:
             "top_technology": top_tech,
         }
 
+    def _top_group(self, key_col: str, val_col: str = "award_amount") -> Any:
+        """
+        Return the key_col value with the largest val_col total.
+
+        Reuses the per-period aggregation when an endpoint already built it;
+        otherwise sums with one bincount over the key codes rather than a
+        full groupby.
+        """
+        cached = self._agg_cache.get((self._current_time_period, key_col))
+        if cached is not None and val_col == "award_amount":
+            if cached.empty:
+                return None
+            return cached.loc[cached["total_funding"].idxmax(), key_col]
+
+        df = self._view([key_col, val_col])
+        codes, uniques = self._key_codes(df[key_col])
+        if len(uniques) == 0:
+            return None
+
+        amounts = df[val_col].to_numpy(dtype=np.float64, na_value=0.0)
+        valid = codes >= 0  # missing keys are coded -1
+        sums = np.bincount(codes[valid], weights=amounts[valid], minlength=len(uniques))
+        return uniques[sums.argmax()]
+
+    @staticmethod
+    def _key_codes(keys: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """Integer codes (-1 for missing) and the distinct values they index."""
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            return keys.cat.codes.to_numpy(), keys.cat.categories
+        return pd.factorize(keys, sort=False)
+
+    def _fused_insight_values(
+        self, df: pd.DataFrame
+    ) -> Tuple[float, float, Dict[str, Any]]:
+        """Total, mean and top group per insight key from one numba pass."""
+        n_rows = len(df)
+        codes: Dict[str, np.ndarray] = {}
+        uniques: Dict[str, pd.Index] = {}
+        for col in INSIGHT_KEY_COLUMNS:
+            if self._has(SCHEMA_FLAGS[col]):
+                col_codes, uniques[col] = self._key_codes(df[col])
+                codes[col] = col_codes.astype(np.intp, copy=False)
+            else:
+                codes[col] = np.full(n_rows, -1, dtype=np.intp)
+                uniques[col] = pd.Index([])
+
+        total, count, *group_sums = _fused_insights(
+            df["award_amount"].to_numpy(dtype=np.float64, na_value=np.nan),
+            codes["technology_category"],
+            codes["performance_state_code"],
+            codes["fiscal_year"],
+            len(uniques["technology_category"]),
+            len(uniques["performance_state_code"]),
+            len(uniques["fiscal_year"]),
+        )
+        tops = {
+            col: uniques[col][sums.argmax()] if len(sums) else None
+            for col, sums in zip(INSIGHT_KEY_COLUMNS, group_sums)
+        }
+        avg_award = total / count if count else np.nan
+        return total, avg_award, tops
+
+    def _cached_agg(
+        self, group_col: str, compute: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return the aggregation for group_col, computing it once per time period."""
+        key = (self._current_time_period, group_col)
+        if key not in self._agg_cache:
+            self._agg_cache[key] = compute()
+        return self._agg_cache[key]
+
+    def _state_agg(self) -> pd.DataFrame:
+        """Per-state funding summary, sorted by total funding."""
+
+        def compute() -> pd.DataFrame:
+            # Named aggregation yields flat columns directly; the result is
+            # sorted by funding, so skip sorting the group keys
+            return (
+                self._view(["performance_state_code", "award_amount", "recipient_name"])
+                .groupby("performance_state_code", observed=True, sort=False)
+                .agg(
+                    total_funding=("award_amount", "sum"),
+                    award_count=("award_amount", "count"),
+                    avg_award_size=("award_amount", "mean"),
+                    unique_recipients=("recipient_name", "nunique"),
+                )
+                .round(2)
+                .reset_index()
+                .sort_values("total_funding", ascending=False)
+            )
+
+        return self._cached_agg("performance_state_code", compute)
+
+    def _tech_agg(self) -> pd.DataFrame:
+        """Per-technology funding summary, sorted by total funding."""
+
+        def compute() -> pd.DataFrame:
+            return (
+                self._view(["technology_category", "award_amount", "recipient_name"])
+                .groupby("technology_category", observed=True, sort=False)
+                .agg(
+                    total_funding=("award_amount", "sum"),
+                    award_count=("award_amount", "count"),
+                    avg_award_size=("award_amount", "mean"),
+                    unique_recipients=("recipient_name", "nunique"),
+                )
+                .round(2)
+                .reset_index()
+                .sort_values("total_funding", ascending=False)
+            )
+
+        return self._cached_agg("technology_category", compute)
+
+    def _recipient_agg(self) -> pd.DataFrame:
+        """
+        Per-recipient funding summary, sorted by total funding.
+
+        Recipient states are left out; _with_recipient_states adds them for
+        the rows an endpoint actually returns.
+        """
+
+        def compute() -> pd.DataFrame:
+            return (
+                self._view(["recipient_name", "award_amount"])
+                .groupby("recipient_name", observed=True, sort=False)
+                .agg(
+                    total_funding=("award_amount", "sum"),
+                    award_count=("award_amount", "count"),
+                    avg_award_size=("award_amount", "mean"),
+                )
+                .round(2)
+                .reset_index()
+                .sort_values("total_funding", ascending=False)
+            )
+
+        return self._cached_agg("recipient_name", compute)
+
+    def _with_recipient_states(self, recipients: pd.DataFrame) -> pd.DataFrame:
+        """Add each recipient's first non-null performance state."""
+        df = self._view(["recipient_name", "performance_state_code"])
+        if not self._has(HAS_STATE):
+            return recipients.assign(state=None)
+
+        # Only rows belonging to the requested recipients are deduplicated
+        names = df["recipient_name"]
+        states = df["performance_state_code"]
+        first_rows = df[
+            names.isin(recipients["recipient_name"]) & states.notna()
+        ].drop_duplicates("recipient_name")
+        state_by_name = first_rows.set_index("recipient_name")["performance_state_code"]
+        return recipients.assign(
+            state=recipients["recipient_name"].map(state_by_name).astype(object)
+        )
+
+    def _time_agg(self) -> pd.DataFrame:
+        """Per-fiscal-year funding trends in ascending year order."""
+
+        def compute() -> pd.DataFrame:
+            return (
+                self._view(["fiscal_year", "award_amount"])
+                .groupby("fiscal_year")
+                .agg(
+                    total_funding=("award_amount", "sum"),
+                    award_count=("award_amount", "count"),
+                    avg_award=("award_amount", "mean"),
+                )
+                .round(2)
+                .reset_index()
+            )
+
+        return self._cached_agg("fiscal_year", compute)
+
     def get_geographic_data(self) -> Dict[str, Any]:
         """Get data for geographic visualizations."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return {}
 
+        precomputed = self._precomputed_result("geographic")
+        if precomputed is not None:
+            return precomputed
+
         try:
-            df = self._current_data
+            df = self._view(
+                ["performance_state_code", "award_amount", "recipient_name"]
+            )
 
             # Create state summary from current filtered data
             state_summary = pd.DataFrame()
-            if "performance_state_code" in df.columns and "award_amount" in df.columns:
-                state_summary = (
-                    df.groupby("performance_state_code")
-                    .agg(
-                        {
-                            "award_amount": ["sum", "count", "mean"],
-                            "recipient_name": "nunique",
-                        }
-                    )
-                    .round(2)
-                )
-
-                # Flatten column names
-                state_summary.columns = [
-                    "total_funding",
-                    "award_count",
-                    "avg_award_size",
-                    "unique_recipients",
-                ]
-                state_summary = state_summary.reset_index()
-                state_summary = state_summary.sort_values(
-                    "total_funding", ascending=False
-                )
+            if self._has(HAS_STATE | HAS_AWARD_AMOUNT):
+                state_summary = self._state_agg()
 
+            state_records = to_records(state_summary)
             return {
-                "state_summary": state_summary.to_dict("records")
-                if not state_summary.empty
-                else [],
+                "state_summary": state_records,
                 "county_summary": [],  # Could add county analysis if needed
-                "geographic_data": state_summary.to_dict("records")
-                if not state_summary.empty
-                else [],
+                "geographic_data": state_records,
                 "insights": [
                     {
                         "type": "geographic",
@@ -174,129 +513,102 @@ class CachedDataConnector:
                 ],
             }
         except Exception as e:
-            print(f"Error getting geographic data: {e}")
+            logger.error("Error getting geographic data: %s", e)
             return {}
 
     def get_timeline_data(self) -> Dict[str, Any]:
         """Get data for timeline visualizations."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return {}
 
+        precomputed = self._precomputed_result("timeline")
+        if precomputed is not None:
+            return precomputed
+
         try:
-            df = self._current_data
+            df = self._view(
+                ["start_date", "fiscal_year", "time_period_category", "award_amount"]
+            )
 
             # Create time series data from current filtered data
             monthly_data = pd.DataFrame()
             quarterly_data = pd.DataFrame()
             yearly_trends = pd.DataFrame()
+            peak_year = "N/A"
 
             # Monthly series
-            if "start_date" in df.columns and "award_amount" in df.columns:
-                df_copy = df.copy()
-                df_copy["start_date"] = pd.to_datetime(df_copy["start_date"])
-                df_copy["year_month"] = df_copy["start_date"].dt.to_period("M")
-
-                monthly_data = (
-                    df_copy.groupby("year_month")
-                    .agg(
-                        {
-                            "award_amount": ["sum", "count"],
-                        }
-                    )
-                    .round(2)
+            if self._has(HAS_START | HAS_AWARD_AMOUNT):
+                # Group on a derived period array rather than adding columns
+                # to a copy of the whole frame; start_date is parsed at load
+                year_month = df["start_date"].dt.to_period("M")
+                monthly = df.groupby(year_month.values)["award_amount"].agg(
+                    ["sum", "count"]
+                )
+                monthly_data = pd.DataFrame(
+                    {
+                        "year_month": monthly.index.astype(str),
+                        "total_funding": monthly["sum"].round(2).values,
+                        "award_count": monthly["count"].values,
+                    }
                 )
-                monthly_data.columns = ["total_funding", "award_count"]
-                monthly_data = monthly_data.reset_index()
-                monthly_data["year_month"] = monthly_data["year_month"].astype(str)
 
             # Yearly trends
-            if "fiscal_year" in df.columns and "award_amount" in df.columns:
-                yearly_trends = (
-                    df.groupby("fiscal_year")
-                    .agg(
-                        {
-                            "award_amount": ["sum", "count", "mean"],
-                        }
-                    )
-                    .round(2)
-                )
-                yearly_trends.columns = ["total_funding", "award_count", "avg_award"]
-                yearly_trends = yearly_trends.reset_index()
-                yearly_trends = yearly_trends.sort_values("fiscal_year")
+            if self._has(HAS_FY | HAS_AWARD_AMOUNT):
+                yearly_trends = self._time_agg()
+                if not yearly_trends.empty:
+                    # Positional argmax on the raw values, no index lookup
+                    peak_idx = yearly_trends["total_funding"].to_numpy().argmax()
+                    peak_year = yearly_trends["fiscal_year"].iloc[peak_idx]
 
             # Create period comparison
             period_comparison = {}
-            if "time_period_category" in df.columns and "award_amount" in df.columns:
+            if self._has(HAS_PERIOD | HAS_AWARD_AMOUNT):
+                # One flat record per period rather than a dict per statistic
                 period_stats = (
-                    df.groupby("time_period_category")["award_amount"]
+                    df.groupby("time_period_category", observed=True)["award_amount"]
                     .agg(["count", "sum", "mean"])
-                    .to_dict()
+                    .reset_index()
                 )
                 period_comparison = {
-                    "period_stats": period_stats,
+                    "period_stats": to_records(period_stats),
                     "changes": {},  # Could calculate changes between periods
                 }
 
             return {
-                "monthly_series": monthly_data.to_dict("records")
-                if not monthly_data.empty
-                else [],
-                "quarterly_series": quarterly_data.to_dict("records")
-                if not quarterly_data.empty
-                else [],
-                "yearly_trends": yearly_trends.to_dict("records")
-                if not yearly_trends.empty
-                else [],
+                "monthly_series": to_records(monthly_data),
+                "quarterly_series": to_records(quarterly_data),
+                "yearly_trends": to_records(yearly_trends),
                 "period_comparison": period_comparison,
                 "insights": [
                     {
                         "type": "timeline",
-                        "description": f"Peak funding year: {yearly_trends.loc[yearly_trends['total_funding'].idxmax(), 'fiscal_year'] if not yearly_trends.empty else 'N/A'}",
+                        "description": f"Peak funding year: {peak_year}",
                     }
                 ],
             }
         except Exception as e:
-            print(f"Error getting timeline data: {e}")
+            logger.error("Error getting timeline data: %s", e)
             return {}
 
     def get_technology_data(self) -> Dict[str, Any]:
         """Get data for technology visualizations."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return {}
 
+        precomputed = self._precomputed_result("technology")
+        if precomputed is not None:
+            return precomputed
+
         try:
-            df = self._current_data
+            df = self._view(["technology_category", "award_amount", "recipient_name"])
 
             # Create technology summary from current filtered data
             tech_summary = pd.DataFrame()
-            if "technology_category" in df.columns and "award_amount" in df.columns:
-                tech_summary = (
-                    df.groupby("technology_category")
-                    .agg(
-                        {
-                            "award_amount": ["sum", "count", "mean"],
-                            "recipient_name": "nunique",
-                        }
-                    )
-                    .round(2)
-                )
-
-                # Flatten column names
-                tech_summary.columns = [
-                    "total_funding",
-                    "award_count",
-                    "avg_award_size",
-                    "unique_recipients",
-                ]
-                tech_summary = tech_summary.reset_index()
-                tech_summary = tech_summary.sort_values(
-                    "total_funding", ascending=False
-                )
+            if self._has(HAS_TECH | HAS_AWARD_AMOUNT):
+                tech_summary = self._tech_agg()
 
             return {
-                "technology_summary": tech_summary.to_dict("records")
-                if not tech_summary.empty
-                else [],
+                "technology_summary": to_records(tech_summary),
                 "insights": [
                     {
                         "type": "technology",
@@ -305,50 +617,27 @@ class CachedDataConnector:
                 ],
             }
         except Exception as e:
-            print(f"Error getting technology data: {e}")
+            logger.error("Error getting technology data: %s", e)
             return {}
 
     def get_recipient_data(self, top_n: int = 50) -> Dict[str, Any]:
         """Get data for recipient visualizations."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return {}
 
         try:
-            df = self._current_data
+            df = self._view(["recipient_name", "award_amount"])
 
             # Create recipient analysis from current filtered data
             recipient_analysis = pd.DataFrame()
-            if "recipient_name" in df.columns and "award_amount" in df.columns:
-                recipient_analysis = (
-                    df.groupby("recipient_name")
-                    .agg(
-                        {
-                            "award_amount": ["sum", "count", "mean"],
-                            "performance_state_code": "first",  # Get state for each recipient
-                        }
-                    )
-                    .round(2)
-                )
-
-                # Flatten column names
-                recipient_analysis.columns = [
-                    "total_funding",
-                    "award_count",
-                    "avg_award_size",
-                    "state",
-                ]
-                recipient_analysis = recipient_analysis.reset_index()
-                recipient_analysis = recipient_analysis.sort_values(
-                    "total_funding", ascending=False
+            if self._has(HAS_RECIPIENT | HAS_AWARD_AMOUNT):
+                # Limit to top N before looking up states
+                recipient_analysis = self._with_recipient_states(
+                    self._recipient_agg().head(top_n)
                 )
 
-                # Limit to top N
-                recipient_analysis = recipient_analysis.head(top_n)
-
             return {
-                "recipient_summary": recipient_analysis.to_dict("records")
-                if not recipient_analysis.empty
-                else [],
+                "recipient_summary": to_records(recipient_analysis),
                 "clustering": {},  # Could add clustering analysis if needed
                 "insights": [
                     {
@@ -358,41 +647,71 @@ class CachedDataConnector:
                 ],
             }
         except Exception as e:
-            print(f"Error getting recipient data: {e}")
+            logger.error("Error getting recipient data: %s", e)
             return {}
 
     def get_comparative_data(self) -> Dict[str, Any]:
         """Get data for comparative analysis visualizations."""
         try:
-            # Get all the different data types for comparison
-            geographic_data = self.get_geographic_data()
-            technology_data = self.get_technology_data()
-            timeline_data = self.get_timeline_data()
+            if not self._is_empty():
+                # Convert every column the sections read in one Arrow call;
+                # their groupbys then share the materialized columns and the
+                # per-period aggregation cache
+                self._view(COMPARATIVE_COLUMNS)
+
+            # The sections only read the shared columns and each fills its
+            # own aggregation cache entry, so they can run concurrently;
+            # pandas releases the GIL inside its groupby kernels
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                geographic_future = executor.submit(self.get_geographic_data)
+                technology_future = executor.submit(self.get_technology_data)
+                timeline_future = executor.submit(self.get_timeline_data)
 
             return {
-                "geographic": geographic_data,
-                "technology": technology_data,
-                "timeline": timeline_data,
+                "geographic": geographic_future.result(),
+                "technology": technology_future.result(),
+                "timeline": timeline_future.result(),
                 "summary": self.cached_loader.get_summary_statistics(),
             }
         except Exception as e:
-            print(f"Error getting comparative data: {e}")
+            logger.error("Error getting comparative data: %s", e)
             return {}
 
     def get_insights(self) -> List[Dict[str, Any]]:
         """Get automated insights for the dashboard."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return []
 
         insights = []
 
         try:
-            df = self._current_data
+            df = self._view(
+                [
+                    "award_amount",
+                    "technology_category",
+                    "performance_state_code",
+                    "fiscal_year",
+                ]
+            )
+
+            if (
+                _fused_insights is not None
+                and len(df) >= NUMBA_MIN_ROWS
+                and self._has(HAS_AWARD_AMOUNT)
+            ):
+                total_funding, avg_award, tops = self._fused_insight_values(df)
+            else:
+                tops = {
+                    col: self._top_group(col)
+                    for col in INSIGHT_KEY_COLUMNS
+                    if self._has(SCHEMA_FLAGS[col])
+                }
+                if self._has(HAS_AWARD_AMOUNT):
+                    total_funding = df["award_amount"].sum()
+                    avg_award = df["award_amount"].mean()
 
             # Funding insights
-            if "award_amount" in df.columns:
-                total_funding = df["award_amount"].sum()
-                avg_award = df["award_amount"].mean()
+            if self._has(HAS_AWARD_AMOUNT):
                 insights.append(
                     {
                         "type": "funding",
@@ -401,10 +720,8 @@ class CachedDataConnector:
                 )
 
             # Technology insights
-            if "technology_category" in df.columns:
-                top_tech = (
-                    df.groupby("technology_category")["award_amount"].sum().idxmax()
-                )
+            if self._has(HAS_TECH):
+                top_tech = tops["technology_category"]
                 insights.append(
                     {
                         "type": "technology",
@@ -413,10 +730,8 @@ class CachedDataConnector:
                 )
 
             # Geographic insights
-            if "performance_state_code" in df.columns:
-                top_state = (
-                    df.groupby("performance_state_code")["award_amount"].sum().idxmax()
-                )
+            if self._has(HAS_STATE):
+                top_state = tops["performance_state_code"]
                 insights.append(
                     {
                         "type": "geographic",
@@ -425,8 +740,8 @@ class CachedDataConnector:
                 )
 
             # Temporal insights
-            if "fiscal_year" in df.columns:
-                peak_year = df.groupby("fiscal_year")["award_amount"].sum().idxmax()
+            if self._has(HAS_FY):
+                peak_year = tops["fiscal_year"]
                 insights.append(
                     {
                         "type": "temporal",
@@ -435,7 +750,7 @@ class CachedDataConnector:
                 )
 
         except Exception as e:
-            print(f"Error generating insights: {e}")
+            logger.error("Error generating insights: %s", e)
 
         return insights
 
@@ -443,34 +758,44 @@ class CachedDataConnector:
         self, filename: str = "dashboard_data.csv", format: str = "csv"
     ) -> Optional[str]:
         """Export current data to file."""
-        if self._current_data is None or self._current_data.empty:
+        if self._is_empty():
             return None
 
         try:
+            # Both writers take the loaded Arrow slice directly, so no
+            # pandas frame is materialized for the export
             if format.lower() == "csv":
                 filepath = f"data/exports/{filename}"
-                self._current_data.to_csv(filepath, index=False)
+                pacsv.write_csv(self._current_table, filepath)
                 return filepath
             elif format.lower() == "parquet":
                 filepath = f"data/exports/{filename.replace('.csv', '.parquet')}"
-                self._current_data.to_parquet(filepath, index=False)
+                pq.write_table(
+                    self._current_table,
+                    filepath,
+                    compression="zstd",
+                    compression_level=EXPORT_COMPRESSION_LEVEL,
+                    row_group_size=EXPORT_ROW_GROUP_SIZE,
+                    use_dictionary=True,
+                )
                 return filepath
             else:
-                print(f"Unsupported format: {format}")
+                logger.warning("Unsupported export format: %s", format)
                 return None
         except Exception as e:
-            print(f"Error exporting data: {e}")
+            logger.error("Error exporting data: %s", e)
             return None
 
     def get_data_info(self) -> Dict[str, Any]:
         """Get information about the current dataset."""
-        if self._current_data is None:
+        if self._current_table is None:
             return {"status": "no_data_loaded"}
 
-        if self._current_data.empty:
+        if self._current_table.num_rows == 0:
             return {"status": "empty_dataset"}
 
-        df = self._current_data
+        table = self._current_table
+        df = self._view(["start_date"])
 
         # Get additional info from cached loader
         cached_info = self.cached_loader.get_data_info()
@@ -479,17 +804,19 @@ class CachedDataConnector:
             "status": "cached_data_loaded",
             "data_source": "consolidated_cache",
             "current_time_period": self._current_time_period,
-            "total_records": len(df),
-            "columns": list(df.columns),
+            "total_records": table.num_rows,
+            "columns": table.column_names,
             "date_range": {
                 "start": df["start_date"].min().strftime("%Y-%m-%d")
-                if "start_date" in df.columns and not df["start_date"].isna().all()
+                if self._has(HAS_START) and not df["start_date"].isna().all()
                 else None,
                 "end": df["start_date"].max().strftime("%Y-%m-%d")
-                if "start_date" in df.columns and not df["start_date"].isna().all()
+                if self._has(HAS_START) and not df["start_date"].isna().all()
                 else None,
             },
-            "memory_usage": f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB",
+            # Size of the loaded Arrow slice; reading pandas' deep usage
+            # would materialize every column
+            "memory_usage": f"{table.nbytes / 1024 / 1024:.2f} MB",
             "cache_info": cached_info,
         }
 
@@ -497,28 +824,35 @@ class CachedDataConnector:
         self, time_period: str = "ira_chips_period", max_pages: int = 5
     ) -> bool:
         """Refresh data (for cached data, this just reloads)."""
-        print("🔄 Refreshing cached data...")
+        logger.debug("Refreshing cached data")
         self.cached_loader.clear_cache()
+        self._agg_cache.clear()
+        self._precomputed.clear()
+        self._available_periods = None
         return self.load_data(time_period, max_pages, force_refresh=True)
 
     def get_available_time_periods(self) -> List[str]:
         """Get list of available time periods from cached data."""
+        if self._available_periods is not None:
+            return list(self._available_periods)
+
         try:
             df = self.cached_loader.get_awards_data(
                 sample=True
             )  # Use sample for quick check
             if "time_period_category" in df.columns:
-                return df["time_period_category"].unique().tolist()
+                self._available_periods = df["time_period_category"].unique().tolist()
             else:
-                return [
+                self._available_periods = [
                     "full_period",
                     "ira_chips_period",
                     "post_arra_pre_ira",
                     "arra_period",
                     "pre_arra",
                 ]
+            return list(self._available_periods)
         except Exception as e:
-            print(f"Error getting time periods: {e}")
+            logger.error("Error getting time periods: %s", e)
             return [
                 "full_period",
                 "ira_chips_period",
@@ -528,10 +862,39 @@ class CachedDataConnector:
             ]
 
     def preload_all_data(self):
-        """Preload all cached data for faster dashboard performance."""
-        print("🚀 Preloading all cached data...")
+        """
+        Preload all cached data for faster dashboard performance.
+
+        Besides warming the loader, this builds the summary, geographic,
+        technology and timeline results for every time period, so those
+        endpoints become lookups after the first load.
+        """
+        logger.debug("Preloading all cached data")
         self.cached_loader.preload_all_data()
-        print("✅ All data preloaded for maximum dashboard performance!")
+
+        previous_period = self._current_time_period
+        periods = ["full_period"] + [
+            tp for tp in self.get_available_time_periods() if tp != "full_period"
+        ]
+        for time_period in periods:
+            if not self.load_data(time_period):
+                continue
+            self._precomputed[time_period] = {
+                "summary": self.get_summary_metrics(),
+                "geographic": self.get_geographic_data(),
+                "technology": self.get_technology_data(),
+                "timeline": self.get_timeline_data(),
+            }
+
+        # Leave the connector on the period it had before preloading
+        if previous_period is not None:
+            self.load_data(previous_period)
+        else:
+            self._current_table = None
+            self._columns = {}
+            self._schema_flags = 0
+            self._current_time_period = None
+        logger.debug("All cached data preloaded")
 
 
 # Backward compatibility alias
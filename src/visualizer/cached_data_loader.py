@@ -13,13 +13,188 @@ Benefits:
 - Better performance and reliability
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import functools
+import gc
+import itertools
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import warnings
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Any,
+    Tuple,
+)
+import logging
+
+try:
+    import numba  # type: ignore
+except ImportError:  # pragma: no cover - the pandas reduction is used instead
+    numba = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - the stdlib decoder is used instead
+    orjson = None
+
+from src.config.data_constants import NUMBA_MIN_ROWS
+
+logger = logging.getLogger(__name__)
+
+# Date columns parsed whenever awards data is materialized
+AWARD_DATE_COLUMNS = ["start_date", "end_date", "data_collected_at"]
+
+# Low-cardinality string columns stored as categoricals, so groupbys and
+# equality filters compare integer codes instead of hashing strings
+CATEGORY_COLUMNS = [
+    "technology_category",
+    "performance_state_code",
+    "performance_state",
+    "time_period_category",
+    "award_size_category",
+]
+
+# Small integer columns stored at their narrowest width. award_amount stays
+# float64: float32 spacing is already $8 at $100M, so awards would lose cents
+INTEGER_COLUMNS = ["fiscal_year"]
+
+# Columns read once to build the technology, state and yearly summaries
+SUMMARY_COLUMNS = [
+    "technology_category",
+    "performance_state_code",
+    "performance_state",
+    "fiscal_year",
+    "award_amount",
+    "recipient_name",
+    "award_id",
+]
+
+# Columns whose row positions are indexed for get_filtered_awards
+FILTER_INDEX_COLUMNS = [
+    "time_period_category",
+    "technology_category",
+    "performance_state_code",
+    "award_size_category",
+    "award_amount",
+]
+
+# Rows converted to dicts at a time when iterating search results
+RECORD_CHUNK_ROWS = 1000
+
+# Column projections kept in memory before the least recently used is dropped
+COLUMN_CACHE_SIZE = 16
+
+# Rows per record batch when streaming the awards parquet files
+AWARDS_BATCH_ROWS = 100_000
+
+# Threads used to read the datasets in preload_all_data
+PRELOAD_WORKERS = 8
+
+# Distinct technologies and states listed per recipient
+RECIPIENT_LIST_SIZE = 3
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _first_unique_codes(codes, order, starts, n_keep):
+        """
+        Collect the first ``n_keep`` distinct codes of each group.
+
+        ``order`` lists the rows grouped by group id (stable, so rows keep
+        their original order within a group) and ``starts`` holds each
+        group's offset into it. Missing values (code -1) take a slot like
+        any other value, matching ``Series.unique()``; unused slots are -2.
+        """
+        n_groups = len(starts) - 1
+        out = np.full((n_groups, n_keep), -2, dtype=np.int64)
+        for g in numba.prange(n_groups):
+            n_found = 0
+            for pos in range(starts[g], starts[g + 1]):
+                code = codes[order[pos]]
+                seen = False
+                for k in range(n_found):
+                    if out[g, k] == code:
+                        seen = True
+                        break
+                if not seen:
+                    out[g, n_found] = code
+                    n_found += 1
+                    if n_found == n_keep:
+                        break
+        return out
+
+else:
+    _first_unique_codes = None
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas copy-on-write is active (always on from pandas 3)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _cached_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a cached frame for a caller.
+
+    With copy-on-write a shallow copy is enough to keep callers'
+    modifications from reaching the cache, since a write copies only the
+    columns it touches. Without it the copy has to be deep.
+    """
+    return df.copy(deep=not _copy_on_write_enabled())
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Parse a JSON file, with orjson when it is installed.
+
+    orjson rejects the NaN and Infinity literals that json.dump writes for
+    missing statistics, so such files fall back to the stdlib decoder.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _memoize_on_awards(method: Callable[..., pd.DataFrame]) -> Callable:
+    """
+    Cache a summary method's result for the currently loaded awards file.
 
-warnings.filterwarnings("ignore")
+    Results are keyed by method name, arguments and the generation of the
+    awards file's cached footer, and callers get copies (see ``_cached_copy``).
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs) -> pd.DataFrame:
+        key = self._derived_key(method.__name__, *args, **kwargs)
+        with self._cache_lock:
+            result = self._derived_cache.get(key)
+            if result is not None:
+                return _cached_copy(result)
+        # Computed outside the lock; if two threads race, the first stored
+        # result wins
+        result = self._store_derived(key, method(self, *args, **kwargs))
+        with self._cache_lock:
+            return _cached_copy(result)
+
+    return wrapper
 
 
 class CachedDataLoader:
@@ -28,8 +203,18 @@ class CachedDataLoader:
 
     This class provides the same interface as the API client but uses
     pre-collected and consolidated data for much faster performance.
+
+    Loaders opened on the same data directory share their caches, so
+    several dashboard workers in one process hold the data only once.
     """
 
+    # Per data directory: loaded datasets, column projections, derived
+    # summaries and the lock guarding access to all three
+    _shared_caches: ClassVar[Dict[str, Tuple[dict, OrderedDict, dict, Any]]] = {}
+    _shared_caches_lock: ClassVar[Any] = threading.Lock()
+    # Generations of the awards files' cached footers, see _parquet_info
+    _generations: ClassVar[Iterator[int]] = itertools.count()
+
     def __init__(self, data_dir: str = "cache"):
         self.data_dir = Path(data_dir)
         self.datasets_dir = self.data_dir / "datasets"
@@ -38,18 +223,50 @@ class CachedDataLoader:
         # Load data catalog
         catalog_path = self.data_dir / "data_catalog.json"
         if catalog_path.exists():
-            with open(catalog_path, "r") as f:
-                self.catalog = json.load(f)
+            self.catalog = _read_json(catalog_path)
         else:
             raise FileNotFoundError(f"Data catalog not found at {catalog_path}")
 
-        # Cache for loaded data
-        self._cache = {}
+        key = str(self.data_dir.resolve())
+        with CachedDataLoader._shared_caches_lock:
+            if key not in CachedDataLoader._shared_caches:
+                CachedDataLoader._shared_caches[key] = (
+                    {},
+                    OrderedDict(),
+                    {},
+                    threading.Lock(),
+                )
+            shared = CachedDataLoader._shared_caches[key]
+
+        # Cache for loaded data; writes go through _store so the parallel
+        # preload can fill it from several threads
+        self._cache: Dict[str, Any] = shared[0]
+        self._cache_lock = shared[3]
+        # Column projections of the awards files, in least-recently-used order
+        self._column_cache: "OrderedDict[Tuple[str, FrozenSet[str]], pd.DataFrame]" = (
+            shared[1]
+        )
+        # Summary frames and the filter index derived from the awards data,
+        # see _memoize_on_awards
+        self._derived_cache: Dict[Tuple, Any] = shared[2]
+
+        logger.debug(
+            "Cached data loader initialized: datasets %s, geographic levels %s, "
+            "time series %s",
+            list(self.catalog["datasets"]),
+            list(self.catalog["geographic"]),
+            list(self.catalog["time_series"]),
+        )
+
+    def _store(self, key: str, value: Any) -> Any:
+        """Cache a loaded dataset, keeping the first copy if two threads race."""
+        with self._cache_lock:
+            return self._cache.setdefault(key, value)
 
-        print("📁 Cached Data Loader initialized")
-        print(f"📊 Available datasets: {list(self.catalog['datasets'].keys())}")
-        print(f"🗺️  Geographic levels: {list(self.catalog['geographic'].keys())}")
-        print(f"📈 Time series: {list(self.catalog['time_series'].keys())}")
+    def _store_derived(self, key: Tuple, value: Any) -> Any:
+        """Cache a derived result, keeping the first copy if two threads race."""
+        with self._cache_lock:
+            return self._derived_cache.setdefault(key, value)
 
     def get_awards_data(self, sample: bool = False) -> pd.DataFrame:
         """
@@ -65,24 +282,187 @@ class CachedDataLoader:
 
         if cache_key not in self._cache:
             dataset_info = self.catalog["datasets"][cache_key]
+
+            logger.debug(
+                "Loading %s (%s records, %s MB)",
+                dataset_info["description"],
+                dataset_info["records"],
+                dataset_info.get("size_mb", "unknown"),
+            )
+
+            # Stream the file a batch at a time and release the Arrow buffers
+            # as pandas takes them over, instead of holding both full copies
+            with self._open_parquet(cache_key) as pf:
+                table = pa.Table.from_batches(
+                    pf.iter_batches(batch_size=AWARDS_BATCH_ROWS, use_threads=True),
+                    schema=pf.schema_arrow,
+                )
+            df = self._prepare_awards(
+                table.to_pandas(split_blocks=True, self_destruct=True)
+            )
+            del table
+            self._store(cache_key, df)
+            logger.debug("Loaded %d awards records", len(df))
+
+        return _cached_copy(self._cache[cache_key])
+
+    @staticmethod
+    def _read_parquet(file_path: Path) -> pd.DataFrame:
+        """
+        Read a parquet file through a memory map.
+
+        The file is closed as soon as it is read. Each column keeps its own
+        block, so later dtype changes do not trigger a consolidation copy,
+        and the Arrow buffers are released as pandas takes them over.
+        """
+        with pq.ParquetFile(file_path, memory_map=True) as pf:
+            table = pf.read(use_threads=True)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        return df
+
+    @staticmethod
+    def _prepare_awards(df: pd.DataFrame) -> pd.DataFrame:
+        """Parse dates, categorize low-cardinality strings and narrow integers."""
+        # Ensure datetime columns are properly typed
+        for col in AWARD_DATE_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+
+        for col in CATEGORY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
+        for col in INTEGER_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+
+        return df
+
+    def iter_awards(
+        self,
+        batch_size: int = AWARDS_BATCH_ROWS,
+        sample: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the awards dataset as Arrow record batches.
+
+        Callers that process awards incrementally can use this to keep only
+        one batch in memory instead of materializing the full frame.
+
+        Args:
+            batch_size: Maximum rows per batch
+            sample: If True, stream the sample data
+            columns: Columns to read (all columns if None)
+
+        Returns:
+            Iterator of record batches; the file stays open until it is
+            exhausted or closed
+        """
+        with self._open_parquet("sample_awards" if sample else "main_awards") as pf:
+            yield from pf.iter_batches(
+                batch_size=batch_size, columns=columns, use_threads=True
+            )
+
+    def get_awards_table(self, sample: bool = False) -> pa.Table:
+        """
+        Load the main awards dataset as a memory-mapped Arrow table.
+
+        Unlike get_awards_data this does not materialize a pandas copy, so
+        callers can filter rows in Arrow and convert only the slice they need.
+
+        Args:
+            sample: If True, load sample data for quick testing
+
+        Returns:
+            Arrow table with awards data
+        """
+        cache_key = "sample_awards_table" if sample else "main_awards_table"
+
+        if cache_key not in self._cache:
+            dataset_info = self.catalog["datasets"][
+                "sample_awards" if sample else "main_awards"
+            ]
             file_path = self.data_dir / dataset_info["file"]
+            self._store(cache_key, pq.read_table(file_path, memory_map=True))
+
+        # Arrow tables are immutable, so the cached table can be shared
+        return self._cache[cache_key]
 
-            print(f"📊 Loading {dataset_info['description']}...")
-            print(f"   Records: {dataset_info['records']:,}")
-            print(f"   Size: {dataset_info.get('size_mb', 'Unknown')} MB")
+    def _parquet_info(self, cache_key: str) -> Tuple[pa.Schema, Any, int]:
+        """
+        Schema, footer metadata and generation of an awards dataset.
 
-            df = pd.read_parquet(file_path)
+        Only the parsed footer is cached, never an open file, so the file
+        can be rewritten while the dashboard runs. The generation changes
+        whenever the footer is read again after clear_cache, and keys the
+        results derived from the file.
+        """
+        info_key = f"{cache_key}_info"
+        if info_key not in self._cache:
+            dataset_info = self.catalog["datasets"][cache_key]
+            file_path = self.data_dir / dataset_info["file"]
+            with pq.ParquetFile(file_path) as pf:
+                info = (pf.schema_arrow, pf.metadata, next(self._generations))
+            self._store(info_key, info)
+        return self._cache[info_key]
 
-            # Ensure datetime columns are properly typed
-            date_columns = ["start_date", "end_date", "data_collected_at"]
-            for col in date_columns:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors="coerce")
+    def _open_parquet(self, cache_key: str) -> pq.ParquetFile:
+        """
+        Open an awards dataset for one read, reusing its cached footer.
 
-            self._cache[cache_key] = df
-            print(f"✅ Loaded {len(df):,} awards records")
+        Use as a context manager so the handle is closed once the read is
+        done; each read gets its own handle, so concurrent reads are safe.
+        """
+        dataset_info = self.catalog["datasets"][cache_key]
+        _, metadata, _ = self._parquet_info(cache_key)
+        return pq.ParquetFile(
+            self.data_dir / dataset_info["file"], memory_map=True, metadata=metadata
+        )
 
-        return self._cache[cache_key].copy()
+    def _load_columns(self, cache_key: str, cols: List[str]) -> pd.DataFrame:
+        """
+        Read only the given columns of an awards dataset.
+
+        Columns missing from the file are skipped, so callers can keep
+        checking df.columns as they do for the full frame.
+
+        Args:
+            cache_key: Dataset key in the catalog ('main_awards' or 'sample_awards')
+            cols: Columns to read
+
+        Returns:
+            DataFrame with the projected columns
+        """
+        schema, _, _ = self._parquet_info(cache_key)
+        available = set(schema.names)
+        cols = [c for c in cols if c in available]
+        key = (cache_key, frozenset(cols))
+
+        # The LRU cache is shared across threads: every lookup, reorder,
+        # insert and eviction happens under the lock, and the copy is taken
+        # before another thread can evict the entry
+        with self._cache_lock:
+            if key in self._column_cache:
+                self._column_cache.move_to_end(key)
+                return _cached_copy(self._column_cache[key])
+
+        # The freshly read table is not reused, so its buffers can be
+        # released while pandas takes them over
+        with self._open_parquet(cache_key) as pf:
+            table = pf.read(columns=cols, use_threads=True)
+        df = self._prepare_awards(
+            table.to_pandas(split_blocks=True, self_destruct=True)
+        )
+        del table
+
+        with self._cache_lock:
+            df = self._column_cache.setdefault(key, df)
+            self._column_cache.move_to_end(key)
+            if len(self._column_cache) > COLUMN_CACHE_SIZE:
+                self._column_cache.popitem(last=False)
+            return _cached_copy(df)
 
     def get_geographic_data(self, level: str = "state") -> pd.DataFrame:
         """
@@ -105,13 +485,13 @@ class CachedDataLoader:
             dataset_info = self.catalog["geographic"][level]
             file_path = self.data_dir / dataset_info["file"]
 
-            print(f"🗺️  Loading {dataset_info['description']}...")
+            logger.debug("Loading %s", dataset_info["description"])
 
-            df = pd.read_parquet(file_path)
-            self._cache[cache_key] = df
-            print(f"✅ Loaded {len(df):,} {level} records")
+            df = self._read_parquet(file_path)
+            self._store(cache_key, df)
+            logger.debug("Loaded %d %s records", len(df), level)
 
-        return self._cache[cache_key].copy()
+        return _cached_copy(self._cache[cache_key])
 
     def get_time_series_data(self, granularity: str = "month") -> pd.DataFrame:
         """
@@ -134,18 +514,18 @@ class CachedDataLoader:
             dataset_info = self.catalog["time_series"][granularity]
             file_path = self.data_dir / dataset_info["file"]
 
-            print(f"📈 Loading {dataset_info['description']}...")
+            logger.debug("Loading %s", dataset_info["description"])
 
-            df = pd.read_parquet(file_path)
+            df = self._read_parquet(file_path)
 
             # Ensure time columns are properly typed
             if "time_period" in df.columns:
                 df["time_period"] = pd.to_datetime(df["time_period"], errors="coerce")
 
-            self._cache[cache_key] = df
-            print(f"✅ Loaded {len(df):,} {granularity} records")
+            self._store(cache_key, df)
+            logger.debug("Loaded %d %s records", len(df), granularity)
 
-        return self._cache[cache_key].copy()
+        return _cached_copy(self._cache[cache_key])
 
     def get_summary_statistics(self) -> Dict[str, Any]:
         """
@@ -157,13 +537,10 @@ class CachedDataLoader:
         if "summary" not in self._cache:
             summary_path = self.data_dir / self.catalog["summary"]["file"]
 
-            print("📋 Loading summary statistics...")
-
-            with open(summary_path, "r") as f:
-                summary = json.load(f)
+            logger.debug("Loading summary statistics")
 
-            self._cache["summary"] = summary
-            print("✅ Loaded summary statistics")
+            self._store("summary", _read_json(summary_path))
+            logger.debug("Loaded summary statistics")
 
         return self._cache["summary"].copy()
 
@@ -190,43 +567,90 @@ class CachedDataLoader:
         Returns:
             Filtered DataFrame
         """
-        df = self.get_awards_data()
-
-        # Apply filters
-        if time_period and "time_period_category" in df.columns:
-            df = df[df["time_period_category"] == time_period]
-
-        if technology_category and "technology_category" in df.columns:
-            df = df[df["technology_category"] == technology_category]
-
-        if state_code and "performance_state_code" in df.columns:
-            df = df[df["performance_state_code"] == state_code]
-
-        if award_size_category and "award_size_category" in df.columns:
-            df = df[df["award_size_category"] == award_size_category]
+        index = self._filter_index()
+
+        # Intersect the row positions of each filter, so only the matching
+        # rows are ever converted to pandas
+        rows: Optional[np.ndarray] = None
+        for column, value in [
+            ("time_period_category", time_period),
+            ("technology_category", technology_category),
+            ("performance_state_code", state_code),
+            ("award_size_category", award_size_category),
+        ]:
+            if value and column in index:
+                matches = index[column].get(value, np.empty(0, dtype=np.intp))
+                rows = (
+                    matches
+                    if rows is None
+                    else np.intersect1d(rows, matches, assume_unique=True)
+                )
 
-        if min_amount and "award_amount" in df.columns:
-            df = df[df["award_amount"] >= min_amount]
+        # Compare against None so a bound of 0 still filters
+        if "award_amount" in index and (
+            min_amount is not None or max_amount is not None
+        ):
+            # Locate the range in the sorted amounts instead of comparing
+            # every row, then restore row order for the intersection
+            order, amounts = index["award_amount"]
+            lo = (
+                np.searchsorted(amounts, min_amount, side="left")
+                if min_amount is not None
+                else 0
+            )
+            hi = (
+                np.searchsorted(amounts, max_amount, side="right")
+                if max_amount is not None
+                else len(amounts)
+            )
+            matches = np.sort(order[lo:hi])
+            rows = (
+                matches
+                if rows is None
+                else np.intersect1d(rows, matches, assume_unique=True)
+            )
 
-        if max_amount and "award_amount" in df.columns:
-            df = df[df["award_amount"] <= max_amount]
+        if rows is None:
+            return self.get_awards_data()
 
-        return df
+        table = self.get_awards_table().take(rows)
+        return self._prepare_awards(table.to_pandas(self_destruct=True))
 
-    def get_technology_summary(self) -> pd.DataFrame:
+    def _filter_index(self) -> Dict[str, Any]:
         """
-        Get technology category summary.
+        Row positions of each value of the filterable award columns.
 
-        Returns:
-            DataFrame with technology statistics
+        Built from one column read per loaded awards file. Category columns
+        map each value to its sorted row positions; award_amount holds the
+        row positions in amount order alongside the sorted amounts.
         """
-        df = self.get_awards_data()
-
+        key = self._derived_key("filter_index")
+        with self._cache_lock:
+            index = self._derived_cache.get(key)
+        if index is None:
+            df = self._load_columns("main_awards", FILTER_INDEX_COLUMNS)
+            index = {
+                col: df.groupby(col, observed=True).indices
+                for col in FILTER_INDEX_COLUMNS
+                if col in df.columns and col != "award_amount"
+            }
+            if "award_amount" in df.columns:
+                # Missing amounts sort last and never fall in a range
+                amounts = df["award_amount"].to_numpy()
+                order = np.argsort(amounts, kind="stable")
+                order = order[: np.count_nonzero(~np.isnan(amounts))]
+                index["award_amount"] = (order, amounts[order])
+            index = self._store_derived(key, index)
+        return index
+
+    @staticmethod
+    def _technology_summary(df: pd.DataFrame) -> pd.DataFrame:
+        """Technology category statistics from the awards columns."""
         if "technology_category" not in df.columns or "award_amount" not in df.columns:
             return pd.DataFrame()
 
         tech_summary = (
-            df.groupby("technology_category")
+            df.groupby("technology_category", observed=True)
             .agg(
                 {
                     "award_amount": ["count", "sum", "mean", "median"],
@@ -257,15 +681,9 @@ class CachedDataLoader:
 
         return tech_summary
 
-    def get_state_summary(self) -> pd.DataFrame:
-        """
-        Get state-level summary from awards data.
-
-        Returns:
-            DataFrame with state statistics
-        """
-        df = self.get_awards_data()
-
+    @staticmethod
+    def _state_summary(df: pd.DataFrame) -> pd.DataFrame:
+        """State-level statistics from the awards columns."""
         if (
             "performance_state_code" not in df.columns
             or "award_amount" not in df.columns
@@ -273,7 +691,7 @@ class CachedDataLoader:
             return pd.DataFrame()
 
         state_summary = (
-            df.groupby("performance_state_code")
+            df.groupby("performance_state_code", observed=True)
             .agg(
                 {
                     "award_amount": ["count", "sum", "mean"],
@@ -296,27 +714,21 @@ class CachedDataLoader:
 
         # Add state names if available
         if "performance_state" in df.columns:
-            state_names = df.groupby("performance_state_code")[
+            state_names = df.groupby("performance_state_code", observed=True)[
                 "performance_state"
             ].first()
-            state_summary = state_summary.merge(
-                state_names.reset_index(), on="performance_state_code", how="left"
-            )
+            state_summary["performance_state"] = state_summary[
+                "performance_state_code"
+            ].map(state_names.to_dict())
 
         # Sort by total funding
         state_summary = state_summary.sort_values("total_funding", ascending=False)
 
         return state_summary
 
-    def get_yearly_trends(self) -> pd.DataFrame:
-        """
-        Get yearly funding trends.
-
-        Returns:
-            DataFrame with yearly statistics
-        """
-        df = self.get_awards_data()
-
+    @staticmethod
+    def _yearly_trends(df: pd.DataFrame) -> pd.DataFrame:
+        """Yearly funding statistics from the awards columns."""
         if "fiscal_year" not in df.columns or "award_amount" not in df.columns:
             return pd.DataFrame()
 
@@ -326,9 +738,6 @@ class CachedDataLoader:
                 {
                     "award_amount": ["count", "sum", "mean"],
                     "recipient_name": "nunique",
-                    "technology_category": lambda x: x.mode().iloc[0]
-                    if not x.empty
-                    else "Unknown",
                 }
             )
             .round(2)
@@ -340,8 +749,21 @@ class CachedDataLoader:
             "total_funding",
             "avg_award",
             "unique_recipients",
-            "top_technology",
         ]
+
+        # Most common technology per year from per-pair counts instead of a
+        # Python mode() per group. Pairs are sorted by name within each year,
+        # so ties go to the alphabetically first category, as mode() does.
+        yearly_trends["top_technology"] = "Unknown"
+        if "technology_category" in df.columns:
+            tech_counts = df.groupby(
+                ["fiscal_year", "technology_category"], observed=True
+            ).size()
+            if not tech_counts.empty:
+                top_technology = tech_counts.groupby(level=0).idxmax().str[1]
+                yearly_trends["top_technology"] = top_technology.reindex(
+                    yearly_trends.index
+                ).fillna("Unknown")
         yearly_trends = yearly_trends.reset_index()
 
         # Calculate year-over-year growth
@@ -352,6 +774,64 @@ class CachedDataLoader:
 
         return yearly_trends
 
+    def _derived_key(self, name: str, *args, **kwargs) -> Tuple:
+        """Key for a derived summary of the currently loaded awards file."""
+        return (
+            name,
+            self._parquet_info("main_awards")[2],
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+
+    def _compute_all_summaries(self) -> Dict[str, pd.DataFrame]:
+        """
+        Build the technology, state and yearly summaries from one read.
+
+        The union of their columns is projected once and all three results
+        are stored in the derived cache, so whichever summary is requested
+        next is already available.
+        """
+        df = self._load_columns("main_awards", SUMMARY_COLUMNS)
+        summaries = {
+            "get_technology_summary": self._technology_summary(df),
+            "get_state_summary": self._state_summary(df),
+            "get_yearly_trends": self._yearly_trends(df),
+        }
+        for name, summary in summaries.items():
+            self._store_derived(self._derived_key(name), summary)
+        return summaries
+
+    @_memoize_on_awards
+    def get_technology_summary(self) -> pd.DataFrame:
+        """
+        Get technology category summary.
+
+        Returns:
+            DataFrame with technology statistics
+        """
+        return self._compute_all_summaries()["get_technology_summary"]
+
+    @_memoize_on_awards
+    def get_state_summary(self) -> pd.DataFrame:
+        """
+        Get state-level summary from awards data.
+
+        Returns:
+            DataFrame with state statistics
+        """
+        return self._compute_all_summaries()["get_state_summary"]
+
+    @_memoize_on_awards
+    def get_yearly_trends(self) -> pd.DataFrame:
+        """
+        Get yearly funding trends.
+
+        Returns:
+            DataFrame with yearly statistics
+        """
+        return self._compute_all_summaries()["get_yearly_trends"]
+
+    @_memoize_on_awards
     def get_recipient_analysis(self, top_n: int = 50) -> pd.DataFrame:
         """
         Get top recipients analysis.
@@ -362,46 +842,36 @@ class CachedDataLoader:
         Returns:
             DataFrame with recipient statistics
         """
-        df = self.get_awards_data()
+        df = self._load_columns(
+            "main_awards",
+            [
+                "recipient_name",
+                "award_amount",
+                "technology_category",
+                "performance_state_code",
+                "fiscal_year",
+            ],
+        )
 
         if "recipient_name" not in df.columns or "award_amount" not in df.columns:
             return pd.DataFrame()
 
-        recipient_analysis = (
-            df.groupby("recipient_name")
-            .agg(
-                {
-                    "award_amount": ["count", "sum", "mean"],
-                    "technology_category": lambda x: ", ".join(
-                        [
-                            str(val)
-                            for val in x.unique()[:3]
-                            if val is not None and pd.notna(val)
-                        ]
-                    ),  # Top 3 technologies, filtering out None/NaN
-                    "performance_state_code": lambda x: ", ".join(
-                        [
-                            str(val)
-                            for val in x.unique()[:3]
-                            if val is not None and pd.notna(val)
-                        ]
-                    ),  # Top 3 states, filtering out None/NaN
-                    "fiscal_year": ["min", "max"],
-                }
-            )
-            .round(2)
+        recipient_analysis = df.groupby("recipient_name").agg(
+            award_count=("award_amount", "count"),
+            total_funding=("award_amount", "sum"),
+            avg_award=("award_amount", "mean"),
         )
-
-        # Flatten column names
-        recipient_analysis.columns = [
-            "award_count",
-            "total_funding",
-            "avg_award",
-            "technologies",
-            "states",
-            "first_year",
-            "last_year",
-        ]
+        # Top 3 technologies and states, filtering out None/NaN
+        recipient_analysis["technologies"] = self._first_unique_labels(
+            df, "technology_category", recipient_analysis.index
+        )
+        recipient_analysis["states"] = self._first_unique_labels(
+            df, "performance_state_code", recipient_analysis.index
+        )
+        years = df.groupby("recipient_name")["fiscal_year"].agg(["min", "max"])
+        recipient_analysis["first_year"] = years["min"]
+        recipient_analysis["last_year"] = years["max"]
+        recipient_analysis = recipient_analysis.round(2)
         recipient_analysis = recipient_analysis.reset_index()
 
         # Sort by total funding and get top N
@@ -411,6 +881,52 @@ class CachedDataLoader:
 
         return recipient_analysis
 
+    @staticmethod
+    def _first_unique_labels(
+        df: pd.DataFrame, col: str, recipients: pd.Index
+    ) -> pd.Series:
+        """
+        Join each recipient's first few distinct values of ``col``.
+
+        Values are taken in order of first appearance and missing values are
+        dropped after the first ``RECIPIENT_LIST_SIZE`` distinct ones are
+        picked, as ``", ".join(x.unique()[:3])`` would.
+        """
+        if _first_unique_codes is not None and len(df) >= NUMBA_MIN_ROWS:
+            # Rows without a recipient get NaN from ngroup and are left out
+            group_ids = (
+                df.groupby("recipient_name").ngroup().fillna(-1).to_numpy(np.int64)
+            )
+            codes, labels = pd.factorize(df[col])
+            valid = group_ids >= 0
+            group_ids = group_ids[valid]
+            order = np.flatnonzero(valid)[np.argsort(group_ids, kind="stable")]
+            starts = np.zeros(len(recipients) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(group_ids, minlength=len(recipients)), out=starts[1:])
+            slots = _first_unique_codes(
+                codes.astype(np.int64), order, starts, RECIPIENT_LIST_SIZE
+            )
+            names = [str(label) for label in labels]
+            joined = [
+                ", ".join(names[code] for code in row if code >= 0) for row in slots
+            ]
+            return pd.Series(joined, index=recipients)
+
+        firsts = (
+            df[["recipient_name", col]]
+            .drop_duplicates()
+            .groupby("recipient_name", sort=False)
+            .head(RECIPIENT_LIST_SIZE)
+            .dropna(subset=[col])
+        )
+        joined = (
+            firsts[col]
+            .astype(str)
+            .groupby(firsts["recipient_name"], sort=False)
+            .agg(", ".join)
+        )
+        return joined.reindex(recipients, fill_value="")
+
     def get_data_info(self) -> Dict[str, Any]:
         """
         Get information about the cached datasets.
@@ -434,32 +950,72 @@ class CachedDataLoader:
         }
 
     def clear_cache(self):
-        """Clear the data cache to free memory."""
-        self._cache.clear()
-        print("🧹 Cache cleared")
+        """
+        Clear the data cache to free memory.
+
+        The caches are shared by every loader opened on this data directory,
+        so this also clears them for all other live loaders on it; they
+        reload from disk on their next access.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._column_cache.clear()
+            self._derived_cache.clear()
+        logger.debug("Cache cleared")
 
     def preload_all_data(self):
         """
         Preload all datasets into cache for faster access.
         """
-        print("🚀 Preloading all datasets...")
+        logger.debug("Preloading all datasets")
 
-        # Load main datasets
-        self.get_awards_data(sample=False)
-        self.get_awards_data(sample=True)
+        # The files are independent and mostly IO-bound, so read them
+        # concurrently
+        tasks: List[Tuple[Callable, tuple]] = [
+            (self.get_awards_data, (False,)),
+            (self.get_awards_data, (True,)),
+        ]
+        tasks += [
+            (self.get_geographic_data, (level,)) for level in self.catalog["geographic"]
+        ]
+        tasks += [
+            (self.get_time_series_data, (granularity,))
+            for granularity in self.catalog["time_series"]
+        ]
+        tasks.append((self.get_summary_statistics, ()))
+
+        with ThreadPoolExecutor(max_workers=min(PRELOAD_WORKERS, len(tasks))) as ex:
+            futures = [ex.submit(fn, *args) for fn, args in tasks]
+            for future in futures:
+                future.result()
 
-        # Load geographic data
-        for level in self.catalog["geographic"].keys():
-            self.get_geographic_data(level)
+        # The summaries share the column cache, so build them after the reads
+        self._compute_all_summaries()
 
-        # Load time series data
-        for granularity in self.catalog["time_series"].keys():
-            self.get_time_series_data(granularity)
+        # Collect what the reads left in reference cycles before serving starts
+        gc.collect()
 
-        # Load summary
-        self.get_summary_statistics()
+        logger.debug("All datasets preloaded (%d items in cache)", len(self._cache))
 
-        print(f"✅ All datasets preloaded ({len(self._cache)} items in cache)")
+
+class _RecordIterator:
+    """
+    Lazily iterable award records backed by an Arrow table.
+
+    Row dicts are built one chunk at a time as the caller iterates, so only
+    the chunk in use is held as Python objects.
+    """
+
+    def __init__(self, table: pa.Table, chunk_size: int = RECORD_CHUNK_ROWS):
+        self._table = table
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for batch in self._table.to_batches(max_chunksize=self._chunk_size):
+            yield from batch.to_pylist()
 
 
 # Backward compatibility - create an alias that matches the API client interface
@@ -470,13 +1026,19 @@ class USASpendingCachedClient(CachedDataLoader):
     """
 
     def search_awards(
-        self, filters: Optional[Dict[str, Any]] = None, **kwargs
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        materialize: bool = True,
+        **kwargs,
     ) -> Dict[str, Any]:
         """
         Search awards using cached data (compatible with API client interface).
 
         Args:
             filters: Dictionary of filters (ignored - uses cached data)
+            materialize: Return results as a list, as the API client does.
+                With False, results is a sized iterable that builds records
+                a chunk at a time as it is read.
             **kwargs: Additional arguments (ignored)
 
         Returns:
@@ -484,8 +1046,10 @@ class USASpendingCachedClient(CachedDataLoader):
         """
         df = self.get_awards_data()
 
-        # Convert to API-like response format
-        results = df.to_dict("records")
+        # Convert to API-like response format; rows are built as they are read
+        results = _RecordIterator(pa.Table.from_pandas(df, preserve_index=False))
+        if materialize:
+            results = list(results)
 
         return {
             "results": results,
@@ -497,6 +1061,30 @@ class USASpendingCachedClient(CachedDataLoader):
             },
         }
 
+    def search_awards_json(
+        self, filters: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> bytes:
+        """
+        Search awards using cached data, already encoded as JSON.
+
+        For callers that only forward the response, pandas' C serializer
+        writes the columns straight to JSON without building a dict per row.
+
+        Args:
+            filters: Dictionary of filters (ignored - uses cached data)
+            **kwargs: Additional arguments (ignored)
+
+        Returns:
+            UTF-8 JSON of the search_awards response; dates are ISO strings
+        """
+        df = self.get_awards_data()
+
+        results = df.to_json(orient="records", date_format="iso")
+        page_metadata = json.dumps(
+            {"total": len(df), "page": 1, "limit": len(df), "hasNext": False}
+        )
+        return f'{{"results":{results},"page_metadata":{page_metadata}}}'.encode()
+
     def get_geographic_spending(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -538,8 +1126,30 @@ class USASpendingCachedClient(CachedDataLoader):
         Returns:
             List of award records
         """
+        return list(self.iter_paginated_data(filters, max_pages, delay))
+
+    def iter_paginated_data(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: int = 10,
+        delay: float = 0.5,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over paginated data using cached data.
+
+        Records are built a chunk at a time as the caller reads them, so the
+        full list of dicts is never held at once.
+
+        Args:
+            filters: Dictionary of filters (ignored)
+            max_pages: Maximum pages (ignored)
+            delay: Delay between requests (ignored)
+
+        Returns:
+            Iterator over award records
+        """
         df = self.get_awards_data()
-        return df.to_dict("records")  # type: ignore
+        yield from _RecordIterator(pa.Table.from_pandas(df, preserve_index=False))
 
 
 def main():
@@ -6,13 +6,156 @@ Creates and configures all visualization components for the dashboard.
 Provides a centralized way to generate consistent, interactive charts.
 """
 
-import plotly.express as px
+import copy
+import functools
+import hashlib
+import heapq
+import json
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
+
+import plotly.colors
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
-import folium  # type: ignore
+import pyarrow as pa
+from typing import TYPE_CHECKING, Dict, List, Any, Mapping, Tuple, Union
+
+if TYPE_CHECKING:
+    # folium and plotly.subplots are imported on first use, since most
+    # renders need neither and folium alone takes ~0.2 s to import
+    import folium  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - plotly's stdlib json encoder is used instead
+    orjson = None
+
+if orjson is not None:
+    # Serialize figures with orjson, which encodes numpy arrays natively
+    pio.json.config.default_engine = "orjson"
+
+# Rendered maps kept per distinct state payload
+MAP_CACHE_SIZE = 16
+
+
+# State coordinates (simplified - would use proper geocoding in production)
+_STATE_COORDS: Mapping[str, Tuple[float, float]] = MappingProxyType(
+    {
+        "AL": (32.3617, -86.2792),
+        "AK": (64.0685, -152.2782),
+        "AZ": (34.2744, -111.2847),
+        "AR": (34.7519, -92.1313),
+        "CA": (36.7783, -119.4179),
+        "CO": (39.5501, -105.7821),
+        "CT": (41.6219, -72.7273),
+        "DE": (38.9108, -75.5277),
+        "FL": (27.7663, -82.6404),
+        "GA": (33.7490, -84.3880),
+        "HI": (19.8968, -155.5828),
+        "ID": (44.0682, -114.7420),
+        "IL": (40.6331, -89.3985),
+        "IN": (40.2732, -86.1349),
+        "IA": (42.0046, -93.2140),
+        "KS": (38.4937, -98.3804),
+        "KY": (37.8393, -84.2700),
+        "LA": (30.9843, -91.9623),
+        "ME": (45.3695, -69.2169),
+        "MD": (39.0458, -76.6413),
+        "MA": (42.2373, -71.5314),
+        "MI": (44.3467, -85.4102),
+        "MN": (46.3954, -94.6859),
+        "MS": (32.3547, -89.3985),
+        "MO": (38.3566, -92.4580),
+        "MT": (47.0527, -109.6333),
+        "NE": (41.4925, -99.9018),
+        "NV": (38.4199, -117.1219),
+        "NH": (43.4525, -71.5639),
+        "NJ": (40.3140, -74.5089),
+        "NM": (34.8405, -106.2485),
+        "NY": (40.7128, -74.0060),
+        "NC": (35.7596, -79.0193),
+        "ND": (47.5515, -101.0020),
+        "OH": (40.4173, -82.9071),
+        "OK": (35.5889, -97.5348),
+        "OR": (44.9778, -120.7374),
+        "PA": (41.2033, -77.1945),
+        "RI": (41.6762, -71.5562),
+        "SC": (33.8191, -80.9066),
+        "SD": (44.2853, -100.2263),
+        "TN": (35.7449, -86.7489),
+        "TX": (31.9686, -99.9018),
+        "UT": (40.1135, -111.8535),
+        "VT": (44.0407, -72.7093),
+        "VA": (37.7693, -78.2057),
+        "WA": (47.7511, -120.7401),
+        "WV": (38.4680, -80.9696),
+        "WI": (44.2619, -89.6165),
+        "WY": (42.7475, -107.2085),
+        "DC": (38.8974, -77.0365),
+    }
+)
+# The coordinates as parallel arrays, indexed through _STATE_IDX; built once
+# per process and shared by every factory, so they are read-only
+_STATE_IDX = {code: i for i, code in enumerate(_STATE_COORDS)}
+_STATE_LAT, _STATE_LON = np.array(list(_STATE_COORDS.values())).T
+_STATE_LAT.flags.writeable = False
+_STATE_LON.flags.writeable = False
+
+
+def _payload_digest(payload: Any) -> bytes:
+    """Content hash of a JSON-like chart payload, independent of key order."""
+    if orjson is not None:
+        raw = orjson.dumps(
+            payload,
+            option=orjson.OPT_SORT_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    else:
+        raw = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _merge_layout(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge two layout dicts, preferring values from override."""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_layout(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@functools.lru_cache(maxsize=1)
+def _timeline_grid() -> Dict[str, Any]:
+    """
+    Axes and titles of the two stacked timeline subplots.
+
+    Building the grid with make_subplots costs more than the rest of the
+    chart, so it is done once and the timeline traces reference its axes.
+    """
+    from plotly.subplots import make_subplots
+
+    grid = make_subplots(
+        rows=2,
+        cols=1,
+        subplot_titles=("Monthly Funding", "Cumulative Funding"),
+        vertical_spacing=0.1,
+    ).to_dict()["layout"]
+    grid.pop("template", None)
+    return grid
+
+
+@functools.lru_cache(maxsize=8)
+def _mock_growth_rates(n: int) -> np.ndarray:
+    """Placeholder growth rates, the same on every render for a given length."""
+    rates = np.random.default_rng(42).uniform(-10, 50, n)
+    rates.flags.writeable = False
+    return rates
 
 
 class ChartFactory:
@@ -21,6 +164,13 @@ class ChartFactory:
 
     Provides methods to create consistent, interactive charts
     for all dashboard components.
+
+    Figures serialize faster with orjson installed (``pip install orjson``).
+
+    The plotly chart methods take ``dict_mode=True`` to return the plain
+    figure spec instead of a validated ``go.Figure``, for callers that
+    serialize it straight away (e.g. ``plotly.io.to_json(spec,
+    validate=False)``).
     """
 
     def __init__(self):
@@ -49,20 +199,91 @@ class ChartFactory:
             "Other Clean Energy": "#6B7280",  # Gray
             "Other": "#6B7280",  # Gray
         }
+        # Technology colors with the gray fallback built in, so looking up a
+        # whole column is one subscript per label
+        self._tech_color_map = defaultdict(lambda: "#808080", self.tech_colors)
+
+        # Shared look of every chart, merged into each layout when the
+        # figure is built rather than applied afterwards
+        axis_theme = {
+            "title": {"font": {"color": "#111827", "size": 14}},
+            "tickfont": {"color": "#374151", "size": 11},
+            "gridcolor": "#E5E7EB",
+            "linecolor": "#D1D5DB",
+        }
+        self._theme_layout = {
+            "plot_bgcolor": "white",
+            "paper_bgcolor": "white",
+            "font": {"color": "#1F2937", "size": 12, "family": "Arial, sans-serif"},
+            "title": {
+                "font": {"size": 18, "color": "#111827", "family": "Arial, sans-serif"}
+            },
+            "margin": {"l": 60, "r": 60, "t": 60, "b": 60},
+            # Ensure axis labels are dark and readable
+            "xaxis": axis_theme,
+            "yaxis": axis_theme,
+            # Fix legend text color
+            "legend": {
+                "font": {"color": "#1F2937", "size": 11},
+                "bgcolor": "rgba(255,255,255,0.8)",
+                "bordercolor": "#D1D5DB",
+                "borderwidth": 1,
+            },
+            # Fix colorbar text color
+            "coloraxis": {
+                "colorbar": {
+                    "title": {"font": {"color": "#111827", "size": 12}},
+                    "tickfont": {"color": "#374151", "size": 10},
+                }
+            },
+        }
+
+        # Rendered map pages, keyed by a digest of their input
+        self._map_cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
 
     def create_geographic_map(
-        self, state_data: List[Dict], value_column: str = "total_funding"
-    ) -> folium.Map:
+        self,
+        state_data: List[Dict],
+        value_column: str = "total_funding",
+        pre_rendered: bool = False,
+    ) -> Union["folium.Map", str]:
         """
         Create an interactive geographic map.
 
         Args:
             state_data: List of state data dictionaries
             value_column: Column to use for sizing/coloring
+            pre_rendered: Return the map rendered to a standalone HTML page
+                instead of the folium object
 
         Returns:
-            Folium map object
+            A new folium map object, or its HTML (cached for calls with the
+            same state data)
         """
+        # Callers may add layers to a map object, so only the immutable HTML
+        # is shared between calls
+        if not pre_rendered:
+            return self._build_geographic_map(state_data, value_column)
+
+        key = (_payload_digest(state_data), value_column)
+        if key in self._map_cache:
+            self._map_cache.move_to_end(key)
+            return self._map_cache[key]
+
+        # Rendering the markers to HTML costs several times more than
+        # building them, so the page is cached rather than the map alone
+        html = self._build_geographic_map(state_data, value_column).get_root().render()
+        self._map_cache[key] = html
+        if len(self._map_cache) > MAP_CACHE_SIZE:
+            self._map_cache.popitem(last=False)
+        return html
+
+    def _build_geographic_map(
+        self, state_data: List[Dict], value_column: str
+    ) -> "folium.Map":
+        """Build the folium map for create_geographic_map."""
+        import folium  # type: ignore
+
         # Create base map centered on US
         m = folium.Map(
             location=[39.8283, -98.5795], zoom_start=4, tiles="OpenStreetMap"
@@ -71,328 +292,483 @@ class ChartFactory:
         if not state_data:
             return m
 
-        # State coordinates (simplified - would use proper geocoding in production)
-        state_coords = {
-            "AL": [32.3617, -86.2792],
-            "AK": [64.0685, -152.2782],
-            "AZ": [34.2744, -111.2847],
-            "AR": [34.7519, -92.1313],
-            "CA": [36.7783, -119.4179],
-            "CO": [39.5501, -105.7821],
-            "CT": [41.6219, -72.7273],
-            "DE": [38.9108, -75.5277],
-            "FL": [27.7663, -82.6404],
-            "GA": [33.7490, -84.3880],
-            "HI": [19.8968, -155.5828],
-            "ID": [44.0682, -114.7420],
-            "IL": [40.6331, -89.3985],
-            "IN": [40.2732, -86.1349],
-            "IA": [42.0046, -93.2140],
-            "KS": [38.4937, -98.3804],
-            "KY": [37.8393, -84.2700],
-            "LA": [30.9843, -91.9623],
-            "ME": [45.3695, -69.2169],
-            "MD": [39.0458, -76.6413],
-            "MA": [42.2373, -71.5314],
-            "MI": [44.3467, -85.4102],
-            "MN": [46.3954, -94.6859],
-            "MS": [32.3547, -89.3985],
-            "MO": [38.3566, -92.4580],
-            "MT": [47.0527, -109.6333],
-            "NE": [41.4925, -99.9018],
-            "NV": [38.4199, -117.1219],
-            "NH": [43.4525, -71.5639],
-            "NJ": [40.3140, -74.5089],
-            "NM": [34.8405, -106.2485],
-            "NY": [40.7128, -74.0060],
-            "NC": [35.7596, -79.0193],
-            "ND": [47.5515, -101.0020],
-            "OH": [40.4173, -82.9071],
-            "OK": [35.5889, -97.5348],
-            "OR": [44.9778, -120.7374],
-            "PA": [41.2033, -77.1945],
-            "RI": [41.6762, -71.5562],
-            "SC": [33.8191, -80.9066],
-            "SD": [44.2853, -100.2263],
-            "TN": [35.7449, -86.7489],
-            "TX": [31.9686, -99.9018],
-            "UT": [40.1135, -111.8535],
-            "VT": [44.0407, -72.7093],
-            "VA": [37.7693, -78.2057],
-            "WA": [47.7511, -120.7401],
-            "WV": [38.4680, -80.9696],
-            "WI": [44.2619, -89.6165],
-            "WY": [42.7475, -107.2085],
-            "DC": [38.8974, -77.0365],
-        }
+        values = np.fromiter(
+            (state.get(value_column, 0) for state in state_data),
+            dtype=np.float64,
+            count=len(state_data),
+        )
 
-        # Calculate value range for proper scaling
-        values = [state.get(value_column, 0) for state in state_data]
-        if values:
-            min_value = min(values)
-            max_value = max(values)
-            value_range = max_value - min_value if max_value > min_value else 1
-        else:
-            min_value = max_value = value_range = 1
+        # Scale marker size based on value with proper normalization: map the
+        # value range to an 8-40 pixel radius (8 when all values are the same)
+        min_value = values.min()
+        value_range = np.ptp(values)
+        if value_range <= 0:
+            value_range = 1
+        # Scaled values lie in [0, 1], so no clamping is needed
+        scaled = ((values - min_value) / value_range).astype(np.float32)
+        radii = 8 + scaled * 32
+
+        # One pass keeps only the states with known coordinates, handling
+        # the different state column names
+        state_idx = _STATE_IDX
+        known = [
+            (i, state_code)
+            for i, state in enumerate(state_data)
+            if (
+                state_code := state.get("state_code")
+                or state.get("performance_state_code", "")
+            )
+            in state_idx
+        ]
+        idxs = [state_idx[state_code] for _, state_code in known]
+        lats = np.take(_STATE_LAT, idxs)
+        lons = np.take(_STATE_LON, idxs)
+        known_rows = [i for i, _ in known]
+        # Plain floats, since folium serializes the marker options as JSON
+        known_radii = np.take(radii, known_rows).tolist()
+        # Dollar amounts formatted in one pass over plain floats
+        value_texts = list(map("${:,.0f}".format, np.take(values, known_rows).tolist()))
+
+        value_label = value_column.replace("_", " ").title()
 
         # Add markers for each state
-        for state in state_data:
-            # Handle different state column names
-            state_code = state.get("state_code") or state.get(
-                "performance_state_code", ""
-            )
-            if state_code in state_coords:
-                coords = state_coords[state_code]
-                value = state.get(value_column, 0)
-
-                # Scale marker size based on value with proper normalization
-                if value_range > 0:
-                    # Normalize value to 0-1 range, then scale to 8-40 pixel radius
-                    normalized_value = (value - min_value) / value_range
-                    radius = 8 + (normalized_value * 32)  # Range: 8-40 pixels
-                else:
-                    radius = 15  # Default size if all values are the same
-
-                # Ensure minimum visibility
-                radius = max(8, radius)
-
-                # Create detailed popup with multiple metrics
-                popup_text = f"""
-                <b>{state_code}</b><br>
-                {value_column.replace('_', ' ').title()}: ${value:,.0f}<br>
-                """
-
-                # Add additional metrics if available
-                if "award_count" in state:
-                    popup_text += f"Awards: {state['award_count']:,}<br>"
-                if "avg_award_size" in state:
-                    popup_text += f"Avg Award: ${state['avg_award_size']:,.0f}<br>"
-                if "unique_recipients" in state:
-                    popup_text += f"Recipients: {state['unique_recipients']:,}"
-
-                folium.CircleMarker(
-                    location=coords,
-                    radius=radius,
-                    popup=folium.Popup(popup_text, max_width=200),
-                    color=self.colors["primary"],
-                    fillColor=self.colors["accent"],
-                    fillOpacity=0.7,
-                    weight=2,
-                ).add_to(m)
+        for (i, state_code), lat, lon, radius, value_text in zip(
+            known, lats, lons, known_radii, value_texts
+        ):
+            state = state_data[i]
+
+            # Create detailed popup with multiple metrics
+            parts = [
+                f"<b>{state_code}</b><br>",
+                f"{value_label}: {value_text}<br>",
+            ]
+
+            # Add additional metrics if available
+            if "award_count" in state:
+                parts.append(f"Awards: {state['award_count']:,}<br>")
+            if "avg_award_size" in state:
+                parts.append(f"Avg Award: ${state['avg_award_size']:,.0f}<br>")
+            if "unique_recipients" in state:
+                parts.append(f"Recipients: {state['unique_recipients']:,}")
+            popup_text = "".join(parts)
+
+            folium.CircleMarker(
+                location=[lat, lon],
+                radius=radius,
+                popup=folium.Popup(popup_text, max_width=200),
+                color=self.colors["primary"],
+                fillColor=self.colors["accent"],
+                fillOpacity=0.7,
+                weight=2,
+            ).add_to(m)
 
         return m
 
     def create_state_ranking_chart(
         self,
-        state_data: List[Dict],
+        state_data: Union[List[Dict], Dict[str, Any], pa.Table],
         value_column: str = "total_funding",
         top_n: int = 10,
-    ) -> go.Figure:
-        """Create horizontal bar chart of top states."""
-        if not state_data:
-            return go.Figure()
+        dict_mode: bool = False,
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """
+        Create horizontal bar chart of top states.
+
+        Accepts the state rows as dicts, or as columns in a dict of arrays or
+        an Arrow table; columns are sliced and plotted without touching rows.
+        """
+        if isinstance(state_data, pa.Table):
+            names = state_data.column_names
+            n_rows = state_data.num_rows
+        elif isinstance(state_data, dict):
+            names = list(state_data)
+            n_rows = len(state_data[names[0]]) if names else 0
+        else:
+            names = list(state_data[0]) if state_data else []
+            n_rows = len(state_data) if state_data else 0
 
-        df = pd.DataFrame(state_data).head(top_n)
+        if n_rows == 0:
+            return self._empty_figure(dict_mode)
 
         # Handle different state column names
         state_column = None
-        if "state_code" in df.columns:
+        if "state_code" in names:
             state_column = "state_code"
-        elif "performance_state_code" in df.columns:
+        elif "performance_state_code" in names:
             state_column = "performance_state_code"
         else:
             # If no state column found, return empty figure
-            return go.Figure()
-
-        fig = px.bar(
-            df,
-            x=value_column,
-            y=state_column,
-            orientation="h",
-            title=f'Top {top_n} States by {value_column.replace("_", " ").title()}',
-            color=value_column,
-            color_continuous_scale="Blues",
-        )
-
-        fig.update_layout(
-            height=400, yaxis={"categoryorder": "total ascending"}, showlegend=False
+            return self._empty_figure(dict_mode)
+
+        value_label = value_column.replace("_", " ").title()
+
+        # Pick the top_n states by value, whatever order they arrive in
+        if isinstance(state_data, (pa.Table, dict)):
+            if isinstance(state_data, pa.Table):
+                values = state_data.column(value_column).to_numpy(zero_copy_only=False)
+                states = state_data.column(state_column).to_numpy(zero_copy_only=False)
+            else:
+                values = np.asarray(state_data[value_column])
+                states = np.asarray(state_data[state_column])
+            # Missing values become NaN, which argsort ranks last. Stable, so
+            # ties keep their input order as with the rows below
+            values = values.astype(np.float64, copy=False)
+            top = np.argsort(-values, kind="stable")[:top_n]
+            x = values[top]
+            y = states[top]
+        else:
+            # Read the two plotted fields straight from the top rows instead
+            # of building a DataFrame for plotly.express. Rows without a
+            # value rank as 0 and are plotted as NaN, as a DataFrame would
+            rows = heapq.nlargest(
+                top_n, state_data, key=lambda row: row.get(value_column) or 0
+            )
+            x = np.array([row.get(value_column) for row in rows], dtype=np.float64)
+            y = [row.get(state_column) for row in rows]
+
+        return self._figure(
+            {
+                "data": [
+                    {
+                        "type": "bar",
+                        "x": x,
+                        "y": y,
+                        "orientation": "h",
+                        "marker": {"color": x, "coloraxis": "coloraxis"},
+                        "hovertemplate": f"{value_column}=%{{x}}<br>"
+                        f"{state_column}=%{{y}}<extra></extra>",
+                    }
+                ],
+                "layout": self._themed(
+                    {
+                        "title": {"text": f"Top {top_n} States by {value_label}"},
+                        "xaxis": {"title": {"text": value_column}},
+                        "yaxis": {
+                            "title": {"text": state_column},
+                            "categoryorder": "total ascending",
+                        },
+                        "coloraxis": {
+                            "colorscale": "Blues",
+                            "colorbar": {"title": {"text": value_column}},
+                        },
+                        "height": 400,
+                        "showlegend": False,
+                    }
+                ),
+            },
+            dict_mode,
         )
 
-        return fig
+    def create_timeline_chart(
+        self, timeline_data: Union[List[Dict], pa.Table], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """
+        Create time series chart with multiple metrics.
 
-    def create_timeline_chart(self, timeline_data: List[Dict]) -> go.Figure:
-        """Create time series chart with multiple metrics."""
-        if not timeline_data:
-            return go.Figure()
+        Accepts the monthly rows as dicts or as an Arrow table; columns of a
+        table are handed to plotly without building a DataFrame.
+        """
+        if timeline_data is None or len(timeline_data) == 0:
+            return self._empty_figure(dict_mode)
+
+        if isinstance(timeline_data, pa.Table):
+            columns = {
+                name: timeline_data.column(name).to_numpy(zero_copy_only=False)
+                for name in ("start_date", "total_funding", "cumulative_funding")
+                if name in timeline_data.column_names
+            }
+            n_rows = timeline_data.num_rows
+        else:
+            df = pd.DataFrame(timeline_data)
+            # numpy arrays, not Series, so plotly encodes them as typed arrays
+            columns = {name: df[name].to_numpy() for name in df.columns}
+            n_rows = len(df)
 
-        df = pd.DataFrame(timeline_data)
-
-        # Create subplot with secondary y-axis
-        fig = make_subplots(
-            rows=2,
-            cols=1,
-            subplot_titles=("Monthly Funding", "Cumulative Funding"),
-            vertical_spacing=0.1,
-        )
+        x = columns["start_date"] if "start_date" in columns else np.arange(n_rows)
 
         # Monthly funding
-        fig.add_trace(
-            go.Scatter(
-                x=df["start_date"] if "start_date" in df.columns else df.index,
-                y=df["total_funding"] if "total_funding" in df.columns else [],
-                mode="lines+markers",
-                name="Monthly Funding",
-                line=dict(color=self.colors["primary"], width=3),
-                marker=dict(size=6),
-            ),
-            row=1,
-            col=1,
-        )
+        traces = [
+            {
+                "type": "scatter",
+                "x": x,
+                "y": columns.get("total_funding", []),
+                "mode": "lines+markers",
+                "name": "Monthly Funding",
+                "line": {"color": self.colors["primary"], "width": 3},
+                "marker": {"size": 6},
+                "xaxis": "x",
+                "yaxis": "y",
+            }
+        ]
 
         # Cumulative funding
-        if "cumulative_funding" in df.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df["start_date"] if "start_date" in df.columns else df.index,
-                    y=df["cumulative_funding"],
-                    mode="lines",
-                    name="Cumulative Funding",
-                    line=dict(color=self.colors["secondary"], width=3),
-                ),
-                row=2,
-                col=1,
+        if "cumulative_funding" in columns:
+            traces.append(
+                {
+                    "type": "scatter",
+                    "x": x,
+                    "y": columns["cumulative_funding"],
+                    "mode": "lines",
+                    "name": "Cumulative Funding",
+                    "line": {"color": self.colors["secondary"], "width": 3},
+                    "xaxis": "x2",
+                    "yaxis": "y2",
+                }
             )
 
-        fig.update_layout(
-            height=600, title="Funding Trends Over Time", showlegend=False
+        # Two stacked subplots from the precomputed grid
+        layout = _merge_layout(
+            _timeline_grid(),
+            {
+                "height": 600,
+                "title": {"text": "Funding Trends Over Time"},
+                "showlegend": False,
+            },
         )
+        return self._figure({"data": traces, "layout": self._themed(layout)}, dict_mode)
 
-        return fig
+    def create_technology_panels(
+        self, tech_data: List[Dict], dict_mode: bool = False
+    ) -> Tuple[Union[go.Figure, Dict[str, Any]], Union[go.Figure, Dict[str, Any]]]:
+        """
+        Create the technology pie and growth charts together.
 
-    def create_technology_pie_chart(self, tech_data: List[Dict]) -> go.Figure:
-        """Create pie chart for technology distribution."""
+        Args:
+            tech_data: List of technology summary dictionaries
+
+        Returns:
+            Tuple of (pie chart, growth chart), built from one pass over the
+            labels and colors
+        """
         if not tech_data:
-            return go.Figure()
+            return self._empty_figure(dict_mode), self._empty_figure(dict_mode)
 
-        df = pd.DataFrame(tech_data)
+        labels = [row["technology_category"] for row in tech_data]
 
         # Get colors for each technology
-        colors = [
-            self.tech_colors.get(tech, "#808080") for tech in df["technology_category"]
-        ]
+        colors = [self._tech_color_map[tech] for tech in labels]
 
-        fig = go.Figure(
-            data=[
-                go.Pie(
-                    labels=df["technology_category"],
-                    values=df["total_funding"],
-                    hole=0.3,
-                    marker_colors=colors,
-                    textinfo="label+percent",
-                    textposition="outside",
-                )
-            ]
+        return (
+            self._technology_pie(tech_data, labels, colors, dict_mode),
+            self._technology_growth(tech_data, labels, colors, dict_mode),
         )
 
-        fig.update_layout(
-            title="Funding Distribution by Technology",
-            height=500,
-            showlegend=True,
-            legend=dict(orientation="v", yanchor="middle", y=0.5),
-        )
+    def create_technology_pie_chart(
+        self, tech_data: List[Dict], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """Create pie chart for technology distribution."""
+        if not tech_data:
+            return self._empty_figure(dict_mode)
 
-        return fig
+        labels = [row["technology_category"] for row in tech_data]
+        colors = [self._tech_color_map[tech] for tech in labels]
+        return self._technology_pie(tech_data, labels, colors, dict_mode)
 
-    def create_technology_growth_chart(self, tech_data: List[Dict]) -> go.Figure:
+    def create_technology_growth_chart(
+        self, tech_data: List[Dict], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
         """Create bar chart showing technology growth rates."""
         if not tech_data:
-            return go.Figure()
-
-        df = pd.DataFrame(tech_data)
+            return self._empty_figure(dict_mode)
 
-        # Create mock growth rates if not present
-        if "growth_rate" not in df.columns:
-            df["growth_rate"] = np.random.uniform(-10, 50, len(df))
-
-        colors = [
-            self.tech_colors.get(tech, "#808080") for tech in df["technology_category"]
-        ]
+        labels = [row["technology_category"] for row in tech_data]
+        colors = [self._tech_color_map[tech] for tech in labels]
+        return self._technology_growth(tech_data, labels, colors, dict_mode)
 
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=df["technology_category"],
-                    y=df["growth_rate"],
-                    marker_color=colors,
-                    text=df["growth_rate"].round(1),
-                    textposition="outside",
-                )
-            ]
+    def _technology_pie(
+        self,
+        tech_data: List[Dict],
+        labels: List[str],
+        colors: List[str],
+        dict_mode: bool = False,
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """Build the technology pie chart from precomputed labels and colors."""
+        # Plain dict specs are validated once, when the figure is built,
+        # instead of once per trace object and again for the figure
+        return self._figure(
+            {
+                "data": [
+                    {
+                        "type": "pie",
+                        "labels": labels,
+                        "values": [row["total_funding"] for row in tech_data],
+                        "hole": 0.3,
+                        "marker": {"colors": colors},
+                        "textinfo": "label+percent",
+                        "textposition": "outside",
+                    }
+                ],
+                "layout": self._themed(
+                    {
+                        "title": {"text": "Funding Distribution by Technology"},
+                        "height": 500,
+                        "showlegend": True,
+                        "legend": {"orientation": "v", "yanchor": "middle", "y": 0.5},
+                    }
+                ),
+            },
+            dict_mode,
         )
 
-        fig.update_layout(
-            title="Technology Growth Rates (%)",
-            xaxis_title="Technology",
-            yaxis_title="Growth Rate (%)",
-            height=400,
-            xaxis={"tickangle": 45},
+    def _technology_growth(
+        self,
+        tech_data: List[Dict],
+        labels: List[str],
+        colors: List[str],
+        dict_mode: bool = False,
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """Build the technology growth chart from precomputed labels and colors."""
+        if any("growth_rate" in row for row in tech_data):
+            growth = np.array(
+                [row.get("growth_rate", np.nan) for row in tech_data], dtype=np.float64
+            )
+        else:
+            # Create mock growth rates if not present; they are fixed so
+            # repeated renders, and caches of them, see the same figure
+            growth = _mock_growth_rates(len(tech_data))
+
+        return self._figure(
+            {
+                "data": [
+                    {
+                        "type": "bar",
+                        "x": labels,
+                        "y": growth,
+                        "marker": {"color": colors},
+                        "text": growth.round(1),
+                        "textposition": "outside",
+                    }
+                ],
+                "layout": self._themed(
+                    {
+                        "title": {"text": "Technology Growth Rates (%)"},
+                        "xaxis": {"title": {"text": "Technology"}, "tickangle": 45},
+                        "yaxis": {"title": {"text": "Growth Rate (%)"}},
+                        "height": 400,
+                    }
+                ),
+            },
+            dict_mode,
         )
 
-        return fig
-
-    def create_recipient_scatter(self, recipient_data: List[Dict]) -> go.Figure:
+    def create_recipient_scatter(
+        self, recipient_data: List[Dict], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
         """Create scatter plot of recipients by funding vs award count."""
         if not recipient_data:
-            return go.Figure()
+            return self._empty_figure(dict_mode)
 
         df = pd.DataFrame(recipient_data)
 
-        fig = px.scatter(
-            df,
-            x="award_count",
-            y="total_funding",
-            size="total_funding",
-            color="recipient_type" if "recipient_type" in df.columns else None,
-            hover_name="recipient_name",
-            title="Recipients: Funding vs Award Count",
-            labels={
-                "award_count": "Number of Awards",
-                "total_funding": "Total Funding ($)",
-            },
-        )
-
-        fig.update_layout(height=500)
+        # Award counts and marker sizes do not need double precision, and
+        # float32 halves the arrays embedded in the figure. Funding stays
+        # float64 because the hover shows it: float32 spacing is already $8
+        # at $100M.
+        df["award_count"] = df["award_count"].astype(np.float32)
+        df["total_funding"] = df["total_funding"].astype(np.float64)
+
+        # Marker area scales with funding, as plotly.express sizes it
+        sizeref = df["total_funding"].max() / 20**2
+        hover = "Number of Awards=%{x}<br>Total Funding ($)=%{y}"
+        if "recipient_name" in df.columns:
+            hover = "<b>%{hovertext}</b><br><br>" + hover
+
+        # WebGL markers, one trace per recipient type when types are known
+        if "recipient_type" in df.columns:
+            groups = list(df.groupby("recipient_type", sort=False))
+        else:
+            groups = [(None, df)]
+        palette = plotly.colors.qualitative.Plotly
+        traces = []
+        for i, (recipient_type, group) in enumerate(groups):
+            trace = {
+                "type": "scattergl",
+                "mode": "markers",
+                "x": group["award_count"].to_numpy(),
+                "y": group["total_funding"].to_numpy(),
+                "marker": {
+                    "size": group["total_funding"].to_numpy(dtype=np.float32),
+                    "sizemode": "area",
+                    "sizeref": sizeref,
+                },
+                "hovertemplate": hover + "<extra></extra>",
+                "showlegend": False,
+            }
+            if "recipient_name" in df.columns:
+                trace["hovertext"] = group["recipient_name"].to_numpy()
+            if recipient_type is not None:
+                trace["name"] = str(recipient_type)
+                trace["legendgroup"] = str(recipient_type)
+                trace["showlegend"] = True
+                trace["marker"]["color"] = palette[i % len(palette)]
+            traces.append(trace)
+
+        layout = {
+            "title": {"text": "Recipients: Funding vs Award Count"},
+            "xaxis": {"title": {"text": "Number of Awards"}},
+            "yaxis": {"title": {"text": "Total Funding ($)"}},
+            "legend": {"itemsizing": "constant"},
+            "height": 500,
+        }
+        if "recipient_type" in df.columns:
+            layout["legend"]["title"] = {"text": "recipient_type"}
 
-        return fig
+        return self._figure({"data": traces, "layout": self._themed(layout)}, dict_mode)
 
-    def create_award_size_histogram(self, award_data: List[Dict]) -> go.Figure:
+    def create_award_size_histogram(
+        self, award_data: List[Dict], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
         """Create histogram of award sizes."""
         if not award_data:
-            return go.Figure()
+            return self._empty_figure(dict_mode)
 
         df = pd.DataFrame(award_data)
 
         if "award_amount" not in df.columns:
-            return go.Figure()
-
-        fig = px.histogram(
-            df,
-            x="award_amount",
-            nbins=50,
-            title="Distribution of Award Sizes",
-            labels={"award_amount": "Award Size ($)", "count": "Number of Awards"},
+            return self._empty_figure(dict_mode)
+
+        # Bin here so the browser receives 50 bars instead of every award
+        amounts = df["award_amount"].to_numpy(dtype=np.float64, na_value=np.nan)
+        amounts = amounts[~np.isnan(amounts)]
+        if amounts.size == 0:
+            return self._empty_figure(dict_mode)
+
+        counts, edges = np.histogram(amounts, bins=50)
+
+        return self._figure(
+            {
+                "data": [
+                    {
+                        "type": "bar",
+                        "x": (edges[:-1] + edges[1:]) / 2,
+                        "y": counts,
+                        "width": np.diff(edges),
+                        "marker": {"color": self.colors["primary"]},
+                        "hovertemplate": "Award Size ($)=%{x}<br>count=%{y}<extra></extra>",
+                    }
+                ],
+                "layout": self._themed(
+                    {
+                        "title": {"text": "Distribution of Award Sizes"},
+                        "xaxis": {"title": {"text": "Award Size ($)"}},
+                        "yaxis": {"title": {"text": "count"}},
+                        "height": 400,
+                        "showlegend": False,
+                    }
+                ),
+            },
+            dict_mode,
         )
 
-        fig.update_layout(height=400, showlegend=False)
-
-        return fig
-
     def create_comparison_chart(
-        self, comparison_data: Dict[str, Any], metric: str = "total_funding"
-    ) -> go.Figure:
+        self,
+        comparison_data: Dict[str, Any],
+        metric: str = "total_funding",
+        dict_mode: bool = False,
+    ) -> Union[go.Figure, Dict[str, Any]]:
         """Create comparison chart for different periods or categories."""
         if not comparison_data:
-            return go.Figure()
+            return self._empty_figure(dict_mode)
 
         # Handle period comparison
         if "before_period" in comparison_data and "after_period" in comparison_data:
@@ -402,62 +778,81 @@ class ChartFactory:
             categories = ["Before", "After"]
             values = [before.get(metric, 0), after.get(metric, 0)]
 
-            fig = go.Figure(
-                data=[
-                    go.Bar(
-                        x=categories,
-                        y=values,
-                        marker_color=[self.colors["neutral"], self.colors["primary"]],
-                        text=[
-                            f"${v:,.0f}" if "funding" in metric else f"{v:,.0f}"
-                            for v in values
-                        ],
-                        textposition="outside",
-                    )
-                ]
-            )
-
-            fig.update_layout(
-                title=f'{metric.replace("_", " ").title()} Comparison', height=400
+            return self._figure(
+                {
+                    "data": [
+                        {
+                            "type": "bar",
+                            "x": categories,
+                            "y": values,
+                            "marker": {
+                                "color": [
+                                    self.colors["neutral"],
+                                    self.colors["primary"],
+                                ]
+                            },
+                            # Formatted by plotly.js rather than per value here
+                            "texttemplate": (
+                                "$%{y:,.0f}" if "funding" in metric else "%{y:,.0f}"
+                            ),
+                            "textposition": "outside",
+                        }
+                    ],
+                    "layout": self._themed(
+                        {
+                            "title": {
+                                "text": f'{metric.replace("_", " ").title()} Comparison'
+                            },
+                            "height": 400,
+                        }
+                    ),
+                },
+                dict_mode,
             )
 
-            return fig
+        return self._empty_figure(dict_mode)
 
-        return go.Figure()
-
-    def create_correlation_heatmap(self, correlation_data: Dict[str, Any]) -> go.Figure:
+    def create_correlation_heatmap(
+        self, correlation_data: Dict[str, Any], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
         """Create correlation heatmap."""
         if not correlation_data or "correlations" not in correlation_data:
-            return go.Figure()
+            return self._empty_figure(dict_mode)
 
         correlations = correlation_data["correlations"]
 
         # Convert to matrix format
-        variables = list(correlations.keys())
-        values = [correlations[var]["correlation"] for var in variables]
+        variables = list(correlations)
+        values = np.fromiter(
+            (correlations[var]["correlation"] for var in variables),
+            dtype=np.float64,
+            count=len(variables),
+        )
+        colors = np.where(values > 0, self.colors["primary"], self.colors["neutral"])
 
         # Create simple correlation display
-        fig = go.Figure(
-            data=go.Bar(
-                x=variables,
-                y=values,
-                marker_color=[
-                    self.colors["primary"] if v > 0 else self.colors["neutral"]
-                    for v in values
+        return self._figure(
+            {
+                "data": [
+                    {
+                        "type": "bar",
+                        "x": variables,
+                        "y": values,
+                        "marker": {"color": colors},
+                    }
                 ],
-            )
-        )
-
-        fig.update_layout(
-            title="Correlation with Funding",
-            xaxis_title="Variables",
-            yaxis_title="Correlation Coefficient",
-            height=400,
-            xaxis={"tickangle": 45},
+                "layout": self._themed(
+                    {
+                        "title": {"text": "Correlation with Funding"},
+                        "xaxis": {"title": {"text": "Variables"}, "tickangle": 45},
+                        "yaxis": {"title": {"text": "Correlation Coefficient"}},
+                        "height": 400,
+                    }
+                ),
+            },
+            dict_mode,
         )
 
-        return fig
-
     def create_metric_cards(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create data for metric cards display."""
         cards = []
@@ -501,38 +896,32 @@ class ChartFactory:
         return cards
 
     def apply_theme(self, fig: go.Figure) -> go.Figure:
-        """Apply consistent theme to a figure."""
-        fig.update_layout(
-            plot_bgcolor="white",
-            paper_bgcolor="white",
-            font=dict(color="#1F2937", size=12, family="Arial, sans-serif"),
-            title_font=dict(size=18, color="#111827", family="Arial, sans-serif"),
-            margin=dict(l=60, r=60, t=60, b=60),
-            # Ensure axis labels are dark and readable
-            xaxis=dict(
-                title_font=dict(color="#111827", size=14),
-                tickfont=dict(color="#374151", size=11),
-                gridcolor="#E5E7EB",
-                linecolor="#D1D5DB",
-            ),
-            yaxis=dict(
-                title_font=dict(color="#111827", size=14),
-                tickfont=dict(color="#374151", size=11),
-                gridcolor="#E5E7EB",
-                linecolor="#D1D5DB",
-            ),
-            # Fix legend text color
-            legend=dict(
-                font=dict(color="#1F2937", size=11),
-                bgcolor="rgba(255,255,255,0.8)",
-                bordercolor="#D1D5DB",
-                borderwidth=1,
-            ),
-            # Fix colorbar text color
-            coloraxis_colorbar=dict(
-                title_font=dict(color="#111827", size=12),
-                tickfont=dict(color="#374151", size=10),
-            ),
-        )
+        """
+        Apply consistent theme to a figure.
+
+        Figures from this factory are themed when they are built; this is
+        for figures created elsewhere.
+        """
+        fig.update_layout(self._theme_layout)
 
         return fig
+
+    def _themed(self, layout: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a chart's layout over the theme, for use at construction."""
+        return _merge_layout(self._theme_layout, layout)
+
+    def _figure(
+        self, spec: Dict[str, Any], dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """Wrap a figure spec in go.Figure, or return it as a plain dict."""
+        if dict_mode:
+            # The layout shares nested dicts with the theme and the cached
+            # timeline grid, which go.Figure would otherwise have copied
+            return {**spec, "layout": copy.deepcopy(spec["layout"])}
+        return go.Figure(spec)
+
+    def _empty_figure(
+        self, dict_mode: bool = False
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """Themed figure returned when there is nothing to plot."""
+        return self._figure({"data": [], "layout": self._themed({})}, dict_mode)
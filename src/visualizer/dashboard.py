@@ -8,11 +8,11 @@ comprehensive analysis.
 """
 
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 from datetime import datetime
 from src.visualizer.cached_data_connector import CachedDataConnector as DataConnector
 from src.visualizer.chart_factory import ChartFactory
-from streamlit_folium import st_folium  # type: ignore
 
 
 class CleanEnergyDashboard:
@@ -24,7 +24,12 @@ class CleanEnergyDashboard:
             st.session_state.data_connector = DataConnector()
 
         self.data_connector = st.session_state.data_connector
-        self.chart_factory = ChartFactory()
+
+        # Keep the chart factory too, so its rendered map cache survives reruns
+        if "chart_factory" not in st.session_state:
+            st.session_state.chart_factory = ChartFactory()
+
+        self.chart_factory = st.session_state.chart_factory
         self.setup_page_config()
 
         # Auto-load data on initialization if not already loaded
@@ -205,11 +210,12 @@ class CleanEnergyDashboard:
             st.subheader("Interactive Map")
 
             if "state_summary" in geo_data:
-                # Create map using chart factory
-                map_obj = self.chart_factory.create_geographic_map(
-                    geo_data["state_summary"]  # type: ignore
+                # Create map using chart factory; the rendered page is cached,
+                # so reruns with the same states skip building and rendering
+                map_html = self.chart_factory.create_geographic_map(
+                    geo_data["state_summary"], pre_rendered=True  # type: ignore
                 )
-                map_data = st_folium(map_obj, width=700, height=500)
+                components.html(map_html, width=700, height=500)
             else:
                 st.info(
                     "Map visualization requires folium. Showing data table instead."
@@ -225,7 +231,6 @@ class CleanEnergyDashboard:
                 ranking_chart = self.chart_factory.create_state_ranking_chart(
                     geo_data["state_summary"]
                 )
-                ranking_chart = self.chart_factory.apply_theme(ranking_chart)
                 st.plotly_chart(ranking_chart, use_container_width=True)
 
         # Geographic insights
@@ -253,7 +258,6 @@ class CleanEnergyDashboard:
             timeline_chart = self.chart_factory.create_timeline_chart(
                 timeline_data["monthly_series"]
             )
-            timeline_chart = self.chart_factory.apply_theme(timeline_chart)
             st.plotly_chart(timeline_chart, use_container_width=True)
 
         # Policy impact analysis
@@ -267,7 +271,6 @@ class CleanEnergyDashboard:
                 comparison_chart = self.chart_factory.create_comparison_chart(
                     timeline_data["period_comparison"], "mean"
                 )
-                comparison_chart = self.chart_factory.apply_theme(comparison_chart)
                 st.plotly_chart(comparison_chart, use_container_width=True)
 
             with col2:
@@ -300,7 +303,6 @@ class CleanEnergyDashboard:
                 scatter_chart = self.chart_factory.create_recipient_scatter(
                     recipient_data["recipient_summary"]
                 )
-                scatter_chart = self.chart_factory.apply_theme(scatter_chart)
                 st.plotly_chart(scatter_chart, use_container_width=True)
 
         with col2:
@@ -337,24 +339,21 @@ class CleanEnergyDashboard:
         # Technology breakdown
         col1, col2 = st.columns(2)
 
+        if "technology_summary" in tech_data:
+            pie_chart, growth_chart = self.chart_factory.create_technology_panels(
+                tech_data["technology_summary"]
+            )
+
         with col1:
             st.subheader("Funding by Technology")
 
             if "technology_summary" in tech_data:
-                pie_chart = self.chart_factory.create_technology_pie_chart(
-                    tech_data["technology_summary"]
-                )
-                pie_chart = self.chart_factory.apply_theme(pie_chart)
                 st.plotly_chart(pie_chart, use_container_width=True)
 
         with col2:
             st.subheader("Technology Growth Rates")
 
             if "technology_summary" in tech_data:
-                growth_chart = self.chart_factory.create_technology_growth_chart(
-                    tech_data["technology_summary"]
-                )
-                growth_chart = self.chart_factory.apply_theme(growth_chart)
                 st.plotly_chart(growth_chart, use_container_width=True)
 
         # Technology insights
@@ -403,7 +402,6 @@ class CleanEnergyDashboard:
             comparison_chart = self.chart_factory.create_state_ranking_chart(
                 state_data, value_column=value_column, top_n=15
             )
-            comparison_chart = self.chart_factory.apply_theme(comparison_chart)
             st.plotly_chart(comparison_chart, use_container_width=True)
 
         # Overall insights
@@ -416,6 +414,12 @@ class CleanEnergyDashboard:
 
 def main():
     """Main function to run the dashboard."""
+    # Copy-on-write lets the cached data loader hand out shallow copies of
+    # its frames instead of deep ones. Set here, at the app entry point, so
+    # importing the visualizer does not change pandas semantics elsewhere.
+    # pandas 3 always copies on write and deprecates the option.
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
     dashboard = CleanEnergyDashboard()
     dashboard.run()
 
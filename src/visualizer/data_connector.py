@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Any
 # Add src to path for imports
 
 
+from src.config.data_constants import PROCESSED_CACHE_DIR
 from src.data_processor.core_processor import DataProcessor
 from src.visualizer.cached_data_loader import CachedDataLoader
 
@@ -31,7 +32,7 @@ class DataConnector:
             self.cached_loader = CachedDataLoader()
             self.data_processor = None
         else:
-            self.data_processor = DataProcessor()
+            self.data_processor = DataProcessor(cache_dir=PROCESSED_CACHE_DIR)
             self.cached_loader = None
 
         self._current_data = None
@@ -105,7 +106,9 @@ class DataConnector:
         # Top technology
         top_tech = "N/A"
         if "technology_category" in df.columns:
-            tech_summary = df.groupby("technology_category")["award_amount"].sum()
+            tech_summary = df.groupby("technology_category", observed=True)[
+                "award_amount"
+            ].sum()
             if not tech_summary.empty:
                 top_tech = tech_summary.idxmax()
 
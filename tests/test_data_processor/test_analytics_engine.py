@@ -251,6 +251,20 @@ class TestAnalyticsEngine:
         assert "cluster_sizes" in result
         assert result["n_clusters"] == 2
 
+        # Every record is assigned and each summary covers all features
+        sizes = result["cluster_sizes"]
+        assert sum(sizes.values()) == len(data)
+        for cluster_id, summary in result["cluster_summary"].items():
+            assert set(summary) == {"total_funding", "award_count", "avg_award_size"}
+            assert sizes[cluster_id] > 0
+
+        # Size-weighted cluster means recover the overall feature means
+        weighted_funding = sum(
+            summary["total_funding"] * sizes[cluster_id]
+            for cluster_id, summary in result["cluster_summary"].items()
+        )
+        assert abs(weighted_funding / len(data) - data["total_funding"].mean()) < 1
+
     def test_cluster_recipients_insufficient_data(self):
         """Test clustering with insufficient data."""
         data = pd.DataFrame({"total_funding": [1000000], "award_count": [1]})
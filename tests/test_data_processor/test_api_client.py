@@ -23,6 +23,14 @@ class TestUSASpendingAPIClient:
         assert isinstance(self.client.session, requests.Session)
         assert self.client.session.headers["Content-Type"] == "application/json"
         assert self.client.session.headers["User-Agent"] == "CleanEnergyAnalysis/1.0"
+        assert self.client.session.headers["Accept-Encoding"] == "gzip"
+
+    def test_init_connection_pool(self):
+        """Test that the session mounts a pooled adapter with retries."""
+        adapter = self.client.session.get_adapter("https://api.usaspending.gov")
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
 
     def test_init_custom_url(self):
         """Test client initialization with custom URL."""
@@ -266,6 +274,43 @@ class TestUSASpendingAPIClient:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
 
+    def test_parse_award_rows(self):
+        """Test typed column construction from award records."""
+        from src.data_processor.api_client import _parse_award_rows
+
+        results = [
+            {"Award Amount": 1000000, "Award ID": "TEST001", "extra": 1},
+            {"Award Amount": "invalid", "Award ID": "TEST002", "extra": 2},
+            {"Award ID": "TEST003", "extra": 3},
+        ]
+
+        columns = _parse_award_rows(results)
+
+        # Known fields come first, in DEFAULT_AWARD_FIELDS order
+        assert list(columns) == ["Award ID", "Award Amount", "extra"]
+        assert columns["Award Amount"].dtype == "float64"
+        assert columns["Award Amount"][0] == 1000000
+        assert pd.isna(columns["Award Amount"][1])
+        assert pd.isna(columns["Award Amount"][2])
+        assert list(columns["Award ID"]) == ["TEST001", "TEST002", "TEST003"]
+        assert _parse_award_rows([]) == {}
+
+    def test_parse_award_rows_keeps_late_fields(self):
+        """Test that fields absent from the first record are kept."""
+        from src.data_processor.api_client import _parse_award_rows
+
+        results = [
+            {"Award ID": "TEST001"},
+            {"Award ID": "TEST002", "Award Amount": 500.0, "late": "x"},
+        ]
+
+        columns = _parse_award_rows(results)
+
+        assert list(columns) == ["Award ID", "Award Amount", "late"]
+        assert pd.isna(columns["Award Amount"][0])
+        assert columns["Award Amount"][1] == 500.0
+        assert list(columns["late"]) == [None, "x"]
+
     def test_backward_compatibility_alias(self):
         """Test that the backward compatibility alias works."""
         from src.data_processor.api_client import USASpendingAPIClient
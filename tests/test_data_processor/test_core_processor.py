@@ -3,6 +3,9 @@
 Tests for the Core Data Processor.
 """
 
+import json
+from pathlib import Path
+
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch
@@ -96,6 +99,83 @@ class TestDataProcessor:
         # Results should be identical
         pd.testing.assert_frame_equal(result1, result2)
 
+    def test_collect_clean_energy_data_disk_cache(self, tmp_path):
+        """Test that processed data is reloaded from the parquet cache."""
+        raw_data = self.create_sample_raw_data()
+
+        processor = DataProcessor(cache_dir=str(tmp_path))
+        processor.api_client = Mock()
+        processor.api_client.get_clean_energy_data.return_value = raw_data
+        result1 = processor.collect_clean_energy_data("test_period", max_pages=2)
+
+        assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+        # A fresh processor should read from disk without calling the API
+        processor = DataProcessor(cache_dir=str(tmp_path))
+        processor.api_client = Mock()
+        result2 = processor.collect_clean_energy_data("test_period", max_pages=2)
+
+        processor.api_client.get_clean_energy_data.assert_not_called()
+        # Parquet stores categorical labels without their string dtype
+        pd.testing.assert_frame_equal(
+            result1, result2, check_dtype=False, check_categorical=False
+        )
+
+        processor.clear_cache(include_disk=True)
+        assert processor.get_cache_info()["disk_cache_files"] == 0
+
+    def test_collect_clean_energy_data_disk_cache_utime_fails(self, tmp_path):
+        """Test that failing to touch the cache file does not fail the hit."""
+        processor = DataProcessor(cache_dir=str(tmp_path))
+        processor.api_client = Mock()
+        processor.api_client.get_clean_energy_data.return_value = (
+            self.create_sample_raw_data()
+        )
+        processor.collect_clean_energy_data("test_period", max_pages=2)
+
+        processor = DataProcessor(cache_dir=str(tmp_path))
+        processor.api_client = Mock()
+        with patch(
+            "src.data_processor.core_processor.os.utime", side_effect=OSError
+        ):
+            result = processor.collect_clean_energy_data("test_period", max_pages=2)
+
+        processor.api_client.get_clean_energy_data.assert_not_called()
+        assert len(result) == 3
+
+    def test_collect_clean_energy_data_mixed_column(self, tmp_path):
+        """Test that a column Arrow cannot type only skips the disk cache."""
+        raw_data = self.create_sample_raw_data()
+        raw_data["Notes"] = [1, "two", 3.5]
+
+        processor = DataProcessor(cache_dir=str(tmp_path))
+        processor.api_client = Mock()
+        processor.api_client.get_clean_energy_data.return_value = raw_data
+        result1 = processor.collect_clean_energy_data("test_period", max_pages=2)
+        result2 = processor.collect_clean_energy_data("test_period", max_pages=2)
+
+        assert len(result1) == 3
+        assert list(tmp_path.glob("*.parquet")) == []
+        processor.api_client.get_clean_energy_data.assert_called_once()
+        pd.testing.assert_frame_equal(result1, result2)
+
+    def test_collect_clean_energy_data_cache_isolated(self):
+        """Test that mutating a returned frame does not change the cache."""
+        processor = DataProcessor(cache_dir=None)
+        processor.api_client = Mock()
+        processor.api_client.get_clean_energy_data.return_value = (
+            self.create_sample_raw_data()
+        )
+
+        first = processor.collect_clean_energy_data("test_period", max_pages=2)
+        first["award_amount"] = 0.0
+        first["extra"] = 1
+        second = processor.collect_clean_energy_data("test_period", max_pages=2)
+
+        processor.api_client.get_clean_energy_data.assert_called_once()
+        assert "extra" not in second.columns
+        assert (second["award_amount"] > 0).all()
+
     def test_get_geographic_analysis(self):
         """Test geographic analysis."""
         # Create processed data
@@ -121,6 +201,27 @@ class TestDataProcessor:
             assert "state_code" in result["state_summary"][0]
             assert "total_funding" in result["state_summary"][0]
 
+    def test_get_geographic_analysis_precomputed_summary(self):
+        """Test that a precomputed state summary is not recomputed."""
+        data = pd.DataFrame(
+            {
+                "award_amount": [1000000, 2000000],
+                "state_code": ["CA", "TX"],
+                "recipient_name": ["Corp A", "Corp B"],
+            }
+        )
+        state_summary = self.processor.transformer.aggregate_by_state(data)
+
+        with patch.object(
+            self.processor.transformer, "aggregate_by_state"
+        ) as mock_aggregate:
+            result = self.processor.get_geographic_analysis(
+                data, state_summary=state_summary
+            )
+
+        mock_aggregate.assert_not_called()
+        assert len(result["state_summary"]) == 2
+
     def test_get_geographic_analysis_empty(self):
         """Test geographic analysis with empty data."""
         empty_df = pd.DataFrame()
@@ -240,6 +341,41 @@ class TestDataProcessor:
         assert result["data_summary"]["total_records"] == 2
         assert result["data_summary"]["total_funding"] == 3000000
 
+    @patch.object(DataProcessor, "collect_clean_energy_data")
+    def test_get_comprehensive_analysis_shares_aggregates(self, mock_collect):
+        """Test that each aggregate is computed once and shared."""
+        sample_data = pd.DataFrame(
+            {
+                "award_amount": [1000000, 2000000, 500000],
+                "start_date": pd.to_datetime(
+                    ["2022-01-01", "2022-06-01", "2022-09-01"]
+                ),
+                "state_code": ["CA", "TX", "CA"],
+                "recipient_name": ["Corp A", "Corp B", "Corp A"],
+                "description": ["Solar project", "Wind project", "Solar farm"],
+            }
+        )
+        mock_collect.return_value = sample_data
+        transformer = self.processor.transformer
+
+        with patch.object(
+            transformer, "aggregate_by_state", wraps=transformer.aggregate_by_state
+        ) as by_state, patch.object(
+            transformer,
+            "aggregate_by_technology",
+            wraps=transformer.aggregate_by_technology,
+        ) as by_tech, patch.object(
+            transformer,
+            "aggregate_by_recipient",
+            wraps=transformer.aggregate_by_recipient,
+        ) as by_recipient:
+            result = self.processor.get_comprehensive_analysis()
+
+        assert by_state.call_count == 1
+        assert by_tech.call_count == 1
+        assert by_recipient.call_count == 1
+        assert len(result["geographic"]["state_summary"]) == 2
+
     @patch.object(DataProcessor, "collect_clean_energy_data")
     def test_get_comprehensive_analysis_no_data(self, mock_collect):
         """Test comprehensive analysis with no data."""
@@ -273,20 +409,61 @@ class TestDataProcessor:
         assert result["total_records"] == 3
         assert result["unique_recipients"] == 2
         assert result["unique_states"] == 2
+        assert result["technology_distribution"] == {"Solar": 2, "Wind": 1}
+        assert result["recipient_type_distribution"] == {"Corporation": 3}
+
+    def test_get_summary_statistics_categorical(self):
+        """Test that unused categories are not counted."""
+        data = pd.DataFrame(
+            {
+                "recipient_name": pd.Categorical(
+                    ["Corp A", "Corp A"], categories=["Corp A", "Corp B"]
+                ),
+                "technology_category": pd.Categorical(
+                    ["Wind", "Solar"], categories=["Solar", "Wind", "Other"]
+                ),
+            }
+        )
+
+        result = self.processor.get_summary_statistics(data)
 
-    def test_export_data_csv(self):
+        assert result["unique_recipients"] == 1
+        assert result["technology_distribution"] == {"Wind": 1, "Solar": 1}
+
+    def test_export_data_csv(self, tmp_path, monkeypatch):
         """Test data export to CSV."""
+        monkeypatch.chdir(tmp_path)
         data = pd.DataFrame(
             {"award_amount": [1000000, 2000000], "recipient_name": ["Corp A", "Corp B"]}
         )
 
-        with patch("pandas.DataFrame.to_csv") as mock_to_csv:
-            with patch("pathlib.Path.mkdir") as mock_mkdir:
-                result = self.processor.export_data(data, "test.csv", "csv")
+        result = self.processor.export_data(data, "test.csv", "csv")
+
+        assert "test.csv" in result
+        pd.testing.assert_frame_equal(pd.read_csv(result), data)
+
+    def test_export_data_csv_mixed_types(self, tmp_path, monkeypatch):
+        """Test CSV export of a column Arrow cannot convert."""
+        monkeypatch.chdir(tmp_path)
+        data = pd.DataFrame({"award_id": [1, "A2", 3.5], "award_amount": [1, 2, 3]})
+
+        result = self.processor.export_data(data, "mixed.csv", "csv")
 
-                mock_mkdir.assert_called_once()
-                mock_to_csv.assert_called_once()
-                assert "test.csv" in result
+        exported = pd.read_csv(result, dtype={"award_id": str})
+        assert list(exported["award_id"]) == ["1", "A2", "3.5"]
+        assert list(exported["award_amount"]) == [1, 2, 3]
+
+    def test_export_data_parquet(self, tmp_path, monkeypatch):
+        """Test data export to Parquet."""
+        monkeypatch.chdir(tmp_path)
+        data = pd.DataFrame(
+            {"award_amount": [1000000, 2000000], "recipient_name": ["Corp A", "Corp B"]}
+        )
+
+        result = self.processor.export_data(data, "test.parquet", "parquet")
+
+        assert "test.parquet" in result
+        pd.testing.assert_frame_equal(pd.read_parquet(result), data)
 
     def test_export_data_excel(self):
         """Test data export to Excel."""
@@ -301,18 +478,33 @@ class TestDataProcessor:
                 mock_to_excel.assert_called_once()
                 assert "test.xlsx" in result
 
-    def test_export_data_json(self):
+    def test_export_data_json(self, tmp_path, monkeypatch):
         """Test data export to JSON."""
+        monkeypatch.chdir(tmp_path)
         data = pd.DataFrame(
             {"award_amount": [1000000, 2000000], "recipient_name": ["Corp A", "Corp B"]}
         )
 
         with patch("pandas.DataFrame.to_json") as mock_to_json:
-            with patch("pathlib.Path.mkdir") as mock_mkdir:
-                result = self.processor.export_data(data, "test.json", "json")
+            result = self.processor.export_data(data, "test.json", "json")
+
+            mock_to_json.assert_called_once()
+            assert "test.json" in result
+
+    def test_export_data_json_chunked(self, tmp_path, monkeypatch):
+        """Test that chunked JSON exports match the single-write array."""
+        monkeypatch.chdir(tmp_path)
+        data = pd.DataFrame(
+            {"award_amount": [1, 2, 3], "recipient_name": ["Corp A", "Corp B", "C"]}
+        )
+        expected = Path(self.processor.export_data(data, "whole.json", "json"))
+
+        monkeypatch.setattr("src.data_processor.core_processor.EXPORT_CHUNK_ROWS", 2)
+        result = Path(self.processor.export_data(data, "chunked.json", "json"))
 
-                mock_to_json.assert_called_once()
-                assert "test.json" in result
+        assert result.read_text() == expected.read_text()
+        with open(result) as f:
+            assert json.load(f) == data.to_dict("records")
 
     def test_export_data_empty(self):
         """Test data export with empty DataFrame."""
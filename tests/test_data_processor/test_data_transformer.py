@@ -4,8 +4,9 @@ Tests for the Data Transformer.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
-from src.data_processor.data_transformer import DataTransformer
+from src.data_processor.data_transformer import DataTransformer, to_records
 
 
 class TestDataTransformer:
@@ -66,6 +67,32 @@ class TestDataTransformer:
         # Check data types
         assert pd.api.types.is_numeric_dtype(result["award_amount"])
         assert pd.api.types.is_datetime64_any_dtype(result["start_date"])
+        assert result["award_amount"].dtype == "float64"
+
+    def test_clean_award_data_keeps_exact_amounts(self):
+        """Test that cleaning does not round award amounts."""
+        data = pd.DataFrame({"Award Amount": [123456789.12, 2500000000.37, 10.01]})
+
+        result = self.transformer.clean_award_data(data)
+
+        assert result["award_amount"].tolist() == [123456789.12, 2500000000.37, 10.01]
+
+    def test_aggregate_sums_in_float64(self):
+        """Test that float32 amounts are summed at float64 precision."""
+        data = pd.DataFrame(
+            {
+                "award_amount": pd.Series([16777216.0, 1.0, 1.0], dtype="float32"),
+                "recipient_name": ["Corp A", "Corp A", "Corp A"],
+                "state_code": ["CA", "CA", "CA"],
+                "technology_category": ["Solar", "Solar", "Solar"],
+            }
+        )
+
+        tech = self.transformer.aggregate_by_technology(data)
+        recipients = self.transformer.aggregate_by_recipient(data)
+
+        assert tech["total_funding"].iloc[0] == 16777218.0
+        assert recipients["total_funding"].iloc[0] == 16777218.0
 
     def test_clean_award_data_empty(self):
         """Test cleaning empty DataFrame."""
@@ -104,6 +131,37 @@ class TestDataTransformer:
         wind_mask = result["description"].str.contains("wind", case=False)
         assert result.loc[wind_mask, "technology_category"].iloc[0] == "Wind"
 
+    def test_categorize_shares_input_columns(self):
+        """Test that categorizing adds a column without touching the input."""
+        data = self.transformer.clean_award_data(self.create_sample_data())
+        columns = list(data.columns)
+
+        result = self.transformer.categorize_recipients(
+            self.transformer.categorize_by_technology(data)
+        )
+
+        assert list(data.columns) == columns
+        assert "technology_category" in result.columns
+        assert "recipient_type" in result.columns
+        assert np.shares_memory(
+            result["award_amount"].to_numpy(), data["award_amount"].to_numpy()
+        )
+
+    def test_categorize_by_technology_first_match_wins(self):
+        """Test that the first listed matching technology is assigned."""
+        data = pd.DataFrame(
+            {
+                "description": [
+                    "Solar panel installation and grid integration project",
+                    "Grid-scale battery deployment",
+                ]
+            }
+        )
+
+        result = self.transformer.categorize_by_technology(data)
+
+        assert list(result["technology_category"]) == ["Solar", "Battery Storage"]
+
     def test_categorize_by_technology_empty(self):
         """Test technology categorization with empty data."""
         empty_df = pd.DataFrame()
@@ -116,6 +174,61 @@ class TestDataTransformer:
         result = self.transformer.categorize_by_technology(data)
         assert result.equals(data)  # Should return unchanged
 
+    def test_categorize_regex_fallback_matches_automaton(self):
+        """Test that the regex fallback agrees with the keyword automaton."""
+        from unittest.mock import patch
+        from src.data_processor import data_transformer
+
+        texts = pd.Series(
+            [
+                "Solar panel installation and grid integration project",
+                "Offshore wind turbine farm",
+                "Hydrogen fuel cell research",
+                "Unrelated facilities maintenance",
+                None,
+            ]
+        )
+
+        with patch.object(data_transformer, "ahocorasick", None):
+            fallback = data_transformer._KeywordMatcher(
+                self.transformer.technology_categories
+            )
+
+        automaton = self.transformer._tech_matcher
+        assert list(fallback.match(texts)) == list(automaton.match(texts))
+        assert automaton.match(texts)[3] == -1
+
+        # Threaded scans give the same masks as the serial loop
+        with patch.object(data_transformer.os, "cpu_count", return_value=1):
+            serial = fallback.match_masks(texts)
+        with patch.object(data_transformer.os, "cpu_count", return_value=4):
+            threaded = fallback.match_masks(texts.astype("string[pyarrow]"))
+        assert (serial == threaded).all()
+
+    def test_categorize_compiled_scan_matches_automaton(self):
+        """Test that the numba kernel agrees with the automaton scan."""
+        pytest.importorskip("numba")
+        from unittest.mock import patch
+        from src.data_processor import data_transformer
+
+        texts = pd.Series(
+            [
+                "Solar panel installation and grid integration project",
+                "Offshore WIND turbine farm",
+                "Unrelated facilities maintenance",
+                None,
+                "",
+                "Café hydrogen fuel cell research",
+            ]
+        ).astype("string[pyarrow]")
+        matcher = self.transformer._tech_matcher
+
+        compiled = matcher._match_compiled(texts)
+
+        assert list(compiled) == list(matcher.match(texts))
+        with patch.object(data_transformer, "NUMBA_MIN_ROWS", 1):
+            assert list(matcher.match(texts[1:])) == list(compiled[1:])
+
     def test_categorize_recipients(self):
         """Test recipient categorization."""
         data = self.create_sample_data()
@@ -132,6 +245,43 @@ class TestDataTransformer:
         uni_mask = result["recipient_name"].str.contains("University", case=False)
         assert result.loc[uni_mask, "recipient_type"].iloc[0] == "University"
 
+    def test_categorize_recipients_categorical(self):
+        """Test that categorical names match per category, not per row."""
+        names = ["Tesla Inc.", "Stanford University", "Tesla Inc.", None, "Acme"]
+        plain = pd.DataFrame({"recipient_name": names})
+        categorical = pd.DataFrame(
+            {"recipient_name": pd.Categorical(names, categories=names[:2] + ["Acme"])}
+        )
+
+        expected = self.transformer.categorize_recipients(plain)["recipient_type"]
+        result = self.transformer.categorize_recipients(categorical)["recipient_type"]
+
+        assert list(result) == list(expected)
+        assert list(result) == [
+            "Corporation",
+            "University",
+            "Corporation",
+            "Other",
+            "Other",
+        ]
+
+    def test_transform_pipeline(self):
+        """Test that the pipeline matches the three-step transformation."""
+        raw_data = self.create_sample_data()
+        raw_columns = list(raw_data.columns)
+
+        result = self.transformer.transform_pipeline(raw_data)
+
+        expected = self.transformer.categorize_recipients(
+            self.transformer.categorize_by_technology(
+                self.transformer.clean_award_data(raw_data)
+            )
+        )
+        pd.testing.assert_frame_equal(result, expected)
+        # The caller's frame is left untouched
+        assert list(raw_data.columns) == raw_columns
+        assert self.transformer.transform_pipeline(pd.DataFrame()).empty
+
     def test_aggregate_by_state(self):
         """Test state aggregation."""
         data = self.create_sample_data()
@@ -186,6 +336,40 @@ class TestDataTransformer:
         # Should be sorted by total funding descending
         assert result["total_funding"].is_monotonic_decreasing
 
+    def test_aggregate_by_recipient_top_n(self):
+        """Test that only the top_n recipients are returned, largest first."""
+        data = pd.DataFrame(
+            {
+                "award_amount": [300, 100, 500, 200, 400],
+                "recipient_name": ["Corp C", "Corp A", "Corp E", "Corp B", "Corp D"],
+                "state_code": ["CA", "CA", "TX", "TX", "NY"],
+            }
+        )
+
+        result = self.transformer.aggregate_by_recipient(data, top_n=3)
+
+        assert list(result["recipient_name"]) == ["Corp E", "Corp D", "Corp C"]
+        assert len(self.transformer.aggregate_by_recipient(data, top_n=10)) == 5
+
+    def test_aggregate_by_recipient_primary_technology(self):
+        """Test that primary technology is the most common category per recipient."""
+        data = pd.DataFrame(
+            {
+                "award_amount": [100, 200, 300, 400, 500],
+                "recipient_name": ["Corp A", "Corp A", "Corp A", "Corp B", "Corp B"],
+                "state_code": ["CA", "CA", "CA", "TX", "TX"],
+                "technology_category": ["Wind", "Solar", "Wind", "Solar", "Wind"],
+            }
+        )
+
+        result = self.transformer.aggregate_by_recipient(data).set_index(
+            "recipient_name"
+        )
+
+        assert result.loc["Corp A", "primary_technology"] == "Wind"
+        # Ties resolve to the first category in sorted order, like Series.mode()
+        assert result.loc["Corp B", "primary_technology"] == "Solar"
+
     def test_create_time_series(self):
         """Test time series creation."""
         data = self.create_sample_data()
@@ -210,6 +394,82 @@ class TestDataTransformer:
 
         assert len(result) <= 4  # Should have at most 4 quarters
 
+    def test_create_time_series_fills_empty_periods(self):
+        """Test that periods without awards appear with zero funding."""
+        data = pd.DataFrame(
+            {
+                "start_date": pd.to_datetime(
+                    ["2022-01-10", "2022-01-20", "2022-03-05"]
+                ),
+                "award_amount": [100.0, 50.0, 25.0],
+                "recipient_name": ["Corp A", "Corp A", "Corp B"],
+            }
+        )
+
+        result = self.transformer.create_time_series(data, freq="M")
+
+        assert list(result["start_date"]) == list(
+            pd.to_datetime(["2022-01-31", "2022-02-28", "2022-03-31"])
+        )
+        assert list(result["total_funding"]) == [150.0, 0.0, 25.0]
+        assert list(result["award_count"]) == [2, 0, 1]
+        assert list(result["unique_recipients"]) == [1, 0, 1]
+        assert list(result["cumulative_funding"]) == [150.0, 150.0, 175.0]
+
+    def test_create_time_series_month_start(self):
+        """Test that start-anchored frequencies label periods by their first day."""
+        data = pd.DataFrame(
+            {
+                "start_date": pd.to_datetime(
+                    ["2022-01-10", "2022-01-20", "2022-03-05"]
+                ),
+                "award_amount": [100.0, 50.0, 25.0],
+                "recipient_name": ["Corp A", "Corp A", "Corp B"],
+            }
+        )
+
+        result = self.transformer.create_time_series(data, freq="MS")
+
+        assert list(result["start_date"]) == list(
+            pd.to_datetime(["2022-01-01", "2022-02-01", "2022-03-01"])
+        )
+        assert list(result["total_funding"]) == [150.0, 0.0, 25.0]
+        assert list(result["unique_recipients"]) == [1, 0, 1]
+
+    def test_create_time_series_resample_fallback(self):
+        """Test that frequencies without a period equivalent match resample."""
+        data = pd.DataFrame(
+            {
+                "start_date": pd.to_datetime(
+                    ["2022-01-10", "2022-01-20", "2022-03-05"]
+                ),
+                "award_amount": [100.0, 50.0, 25.0],
+                "recipient_name": ["Corp A", "Corp A", "Corp B"],
+            }
+        )
+
+        result = self.transformer.create_time_series(data, freq="SMS")
+
+        expected = data.set_index("start_date").resample("SMS")["award_amount"].sum()
+        assert list(result["start_date"]) == list(expected.index)
+        assert list(result["total_funding"]) == list(expected)
+
+    def test_to_records(self):
+        """Test conversion of summary frames to row dicts."""
+        data = pd.DataFrame(
+            {
+                "state_code": pd.Categorical(["CA", "TX"]),
+                "total_funding": [1.5, float("nan")],
+                "award_count": [2, 1],
+            }
+        )
+
+        assert to_records(data) == [
+            {"state_code": "CA", "total_funding": 1.5, "award_count": 2},
+            {"state_code": "TX", "total_funding": None, "award_count": 1},
+        ]
+        assert to_records(pd.DataFrame()) == []
+
     def test_calculate_growth_rates(self):
         """Test growth rate calculation."""
         # Create time series data
@@ -240,6 +500,22 @@ class TestDataTransformer:
         assert "total_states" in result
         assert "geographic_distribution" in result
 
+    def test_prepare_for_visualization_reuses_summary(self):
+        """Test that a precomputed aggregate is used instead of recomputed."""
+        from unittest.mock import patch
+
+        data = self.create_sample_data()
+        cleaned_data = self.transformer.clean_award_data(data)
+        state_summary = self.transformer.aggregate_by_state(cleaned_data)
+
+        with patch.object(self.transformer, "aggregate_by_state") as mock_aggregate:
+            result = self.transformer.prepare_for_visualization(
+                cleaned_data, "geographic", summary=state_summary
+            )
+
+        mock_aggregate.assert_not_called()
+        assert result["total_states"] == len(state_summary)
+
     def test_prepare_for_visualization_timeline(self):
         """Test timeline visualization data preparation."""
         data = self.create_sample_data()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached data loader and connector.
+"""
+
+import copy
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from src.visualizer.cached_data_connector import CachedDataConnector
+from src.visualizer.cached_data_loader import (
+    CachedDataLoader,
+    USASpendingCachedClient,
+)
+
+
+def create_sample_awards():
+    """Create awards with repeated categories, zero and missing amounts."""
+    amounts = [0.0, 125.5, np.nan, 5_000.0, 0.0, 75_000.0, np.nan, 1_250_000.0]
+    n = len(amounts) * 3
+    return pd.DataFrame(
+        {
+            "award_id": [f"A{i}" for i in range(n)],
+            "recipient_name": [f"Recipient {i % 5}" for i in range(n)],
+            "award_amount": amounts * 3,
+            "start_date": pd.date_range("2021-01-15", periods=n, freq="MS").strftime(
+                "%Y-%m-%d"
+            ),
+            "end_date": pd.date_range("2022-01-15", periods=n, freq="MS").strftime(
+                "%Y-%m-%d"
+            ),
+            "performance_state_code": ["CA", "TX", "NY", "CA"] * (n // 4),
+            "performance_state": ["California", "Texas", "New York", "California"]
+            * (n // 4),
+            "technology_category": ["Solar", "Wind", "Solar"] * (n // 3),
+            "time_period_category": ["ira_chips_period", "arra_period"] * (n // 2),
+            "fiscal_year": [2021 + i // 12 for i in range(n)],
+            "award_size_category": ["Small", "Medium", "Large"] * (n // 3),
+        }
+    )
+
+
+def write_cache(data_dir, awards):
+    """Write a data catalog and awards file in the cache layout."""
+    (data_dir / "datasets").mkdir(parents=True)
+    (data_dir / "summaries").mkdir()
+    awards.to_parquet(data_dir / "datasets" / "awards.parquet", index=False)
+    dataset = {
+        "file": "datasets/awards.parquet",
+        "description": "awards",
+        "records": len(awards),
+    }
+    catalog = {
+        "datasets": {"main_awards": dataset, "sample_awards": dataset},
+        "geographic": {},
+        "time_series": {},
+        "summary": {"file": "summaries/data_summary.json", "description": "summary"},
+    }
+    (data_dir / "data_catalog.json").write_text(json.dumps(catalog))
+
+
+class TestCachedDataLoader:
+    """Test suite for CachedDataLoader."""
+
+    def create_loader(self, tmp_path):
+        """Create a loader over a freshly written cache."""
+        write_cache(tmp_path / "cache", create_sample_awards())
+        return CachedDataLoader(data_dir=str(tmp_path / "cache"))
+
+    def mask_filter(self, df, **filters):
+        """Filter awards with a plain boolean mask."""
+        mask = pd.Series(True, index=df.index)
+        for column, key in [
+            ("time_period_category", "time_period"),
+            ("technology_category", "technology_category"),
+            ("performance_state_code", "state_code"),
+            ("award_size_category", "award_size_category"),
+        ]:
+            if filters.get(key):
+                mask &= df[column] == filters[key]
+        if filters.get("min_amount") is not None:
+            mask &= df["award_amount"] >= filters["min_amount"]
+        if filters.get("max_amount") is not None:
+            mask &= df["award_amount"] <= filters["max_amount"]
+        return df[mask]
+
+    def assert_same_awards(self, result, expected):
+        """Assert both frames hold the same awards with the same amounts."""
+        result = result.sort_values("award_id").reset_index(drop=True)
+        expected = expected.sort_values("award_id").reset_index(drop=True)
+        assert result["award_id"].tolist() == expected["award_id"].tolist()
+        np.testing.assert_array_equal(
+            result["award_amount"].to_numpy(), expected["award_amount"].to_numpy()
+        )
+
+    def test_get_filtered_awards_matches_mask(self, tmp_path):
+        """Test filtered awards against a boolean mask for every combination."""
+        loader = self.create_loader(tmp_path)
+        awards = loader.get_awards_data()
+
+        for period, tech, state, size, min_amount, max_amount in itertools.product(
+            [None, "arra_period"],
+            [None, "Solar", "Hydro"],
+            [None, "CA"],
+            [None, "Small"],
+            [None, 0, 125.5, 2_000_000.0],
+            [None, 0, 5_000.0],
+        ):
+            filters = {
+                "time_period": period,
+                "technology_category": tech,
+                "state_code": state,
+                "award_size_category": size,
+                "min_amount": min_amount,
+                "max_amount": max_amount,
+            }
+            result = loader.get_filtered_awards(**filters)
+            self.assert_same_awards(result, self.mask_filter(awards, **filters))
+
+    def test_get_filtered_awards_zero_bounds(self, tmp_path):
+        """Test that a bound of 0 filters and drops missing amounts."""
+        loader = self.create_loader(tmp_path)
+
+        at_least_zero = loader.get_filtered_awards(min_amount=0)
+        only_zero = loader.get_filtered_awards(min_amount=0, max_amount=0)
+
+        assert len(at_least_zero) == 18
+        assert at_least_zero["award_amount"].notna().all()
+        assert len(only_zero) == 6
+        assert (only_zero["award_amount"] == 0).all()
+
+    def test_get_filtered_awards_keeps_missing_amounts(self, tmp_path):
+        """Test that missing amounts are kept when no amount bound is set."""
+        loader = self.create_loader(tmp_path)
+
+        result = loader.get_filtered_awards(technology_category="Solar")
+
+        assert len(result) == 16
+        assert result["award_amount"].isna().sum() == 4
+
+    def test_get_filtered_awards_no_filters(self, tmp_path):
+        """Test that no filters return the full dataset."""
+        loader = self.create_loader(tmp_path)
+
+        result = loader.get_filtered_awards()
+
+        self.assert_same_awards(result, loader.get_awards_data())
+
+    def test_get_awards_data_copies_protect_cache(self, tmp_path):
+        """Test that modifying returned awards leaves the cache untouched."""
+        loader = self.create_loader(tmp_path)
+
+        with pd.option_context("mode.copy_on_write", False):
+            awards = loader.get_awards_data()
+            awards.loc[:, "award_amount"] = -1.0
+
+        assert (loader.get_awards_data()["award_amount"] != -1.0).all()
+
+    def test_summaries_follow_a_rewritten_file(self, tmp_path):
+        """Test that a file rewritten after loading is read again once cleared."""
+        loader = self.create_loader(tmp_path)
+        before = loader.get_technology_summary()
+
+        awards = create_sample_awards()
+        awards["technology_category"] = "Hydro"
+        awards.to_parquet(
+            tmp_path / "cache" / "datasets" / "awards.parquet", index=False
+        )
+        loader.clear_cache()
+        after = loader.get_technology_summary()
+
+        assert set(before["technology_category"]) == {"Solar", "Wind"}
+        assert list(after["technology_category"]) == ["Hydro"]
+
+    def test_load_columns_from_many_threads(self, tmp_path):
+        """Test that concurrent projections never race the LRU eviction."""
+        loader = self.create_loader(tmp_path)
+        columns = list(create_sample_awards().columns)
+        projections = [
+            list(cols) for cols in itertools.combinations(columns, 2)
+        ] * 4
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            frames = list(
+                executor.map(
+                    lambda cols: loader._load_columns("main_awards", cols),
+                    projections,
+                )
+            )
+
+        assert [sorted(df.columns) for df in frames] == [
+            sorted(cols) for cols in projections
+        ]
+
+
+class TestUSASpendingCachedClient:
+    """Test suite for USASpendingCachedClient."""
+
+    def test_results_are_lists_like_the_api_client(self, tmp_path):
+        """Test that the API-compatible methods return lists by default."""
+        write_cache(tmp_path / "cache", create_sample_awards())
+        client = USASpendingCachedClient(data_dir=str(tmp_path / "cache"))
+
+        results = client.search_awards()["results"]
+        records = client.collect_paginated_data()
+
+        assert isinstance(results, list)
+        assert isinstance(records, list)
+        assert records == results
+        assert list(client.iter_paginated_data()) == records
+        assert list(client.search_awards(materialize=False)["results"]) == records
+
+
+class TestCachedDataConnector:
+    """Test suite for CachedDataConnector."""
+
+    def test_timeline_period_stats_records(self, tmp_path, monkeypatch):
+        """Test that period stats are one flat record per time period."""
+        awards = create_sample_awards()
+        write_cache(tmp_path / "cache", awards)
+        monkeypatch.chdir(tmp_path)
+        connector = CachedDataConnector()
+        assert connector.load_data("full_period")
+
+        period_stats = connector.get_timeline_data()["period_comparison"][
+            "period_stats"
+        ]
+
+        assert isinstance(period_stats, list)
+        assert all(
+            set(record) == {"time_period_category", "count", "sum", "mean"}
+            for record in period_stats
+        )
+        by_period = {record["time_period_category"]: record for record in period_stats}
+        expected = awards.groupby("time_period_category")["award_amount"]
+        assert set(by_period) == set(expected.groups)
+        for period, amounts in expected:
+            assert by_period[period]["count"] == amounts.count()
+            assert by_period[period]["sum"] == amounts.sum()
+            assert by_period[period]["mean"] == amounts.mean()
+
+    def test_preloaded_results_are_copies(self, tmp_path, monkeypatch):
+        """Test that modifying a preloaded result leaves the cache untouched."""
+        write_cache(tmp_path / "cache", create_sample_awards())
+        (tmp_path / "cache" / "summaries" / "data_summary.json").write_text("{}")
+        monkeypatch.chdir(tmp_path)
+        connector = CachedDataConnector()
+        connector.preload_all_data()
+        assert connector.load_data("full_period")
+
+        timeline = connector.get_timeline_data()
+        expected = copy.deepcopy(timeline)
+        timeline["period_comparison"]["period_stats"].reverse()
+        timeline["extra"] = True
+
+        assert connector.get_timeline_data() == expected
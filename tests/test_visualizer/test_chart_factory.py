@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the Chart Factory.
+"""
+
+import numpy as np
+import pyarrow as pa
+from src.visualizer.chart_factory import ChartFactory
+
+
+class TestChartFactory:
+    """Test suite for ChartFactory."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.factory = ChartFactory()
+
+    def create_state_rows(self):
+        """Create unsorted state summary rows."""
+        return [
+            {"performance_state_code": "NY", "total_funding": 2.5, "award_count": 9},
+            {"performance_state_code": "CA", "total_funding": 9.0, "award_count": 1},
+            {"performance_state_code": "TX", "total_funding": 5.0, "award_count": 4},
+            {"performance_state_code": "WA", "total_funding": 5.0, "award_count": 7},
+        ]
+
+    def ranking_bars(self, fig):
+        """Return the plotted (states, values) of a state ranking chart."""
+        bar = fig.data[0]
+        return list(bar.y), [float(v) for v in bar.x]
+
+    def test_state_ranking_rows(self):
+        """Test that rows are ranked by value before taking the top N."""
+        fig = self.factory.create_state_ranking_chart(self.create_state_rows(), top_n=3)
+
+        assert self.ranking_bars(fig) == (["CA", "TX", "WA"], [9.0, 5.0, 5.0])
+
+    def test_state_ranking_other_column(self):
+        """Test ranking by a column the rows are not sorted by."""
+        fig = self.factory.create_state_ranking_chart(
+            self.create_state_rows(), value_column="award_count", top_n=2
+        )
+
+        assert self.ranking_bars(fig) == (["NY", "WA"], [9.0, 7.0])
+
+    def test_state_ranking_row_without_value(self):
+        """Test that a row missing the value column ranks last."""
+        rows = self.create_state_rows() + [{"performance_state_code": "ZZ"}]
+
+        fig = self.factory.create_state_ranking_chart(rows, top_n=10)
+
+        states, _ = self.ranking_bars(fig)
+        assert states == ["CA", "TX", "WA", "NY", "ZZ"]
+        assert np.isnan(fig.data[0].x[-1])
+
+    def test_state_ranking_columns(self):
+        """Test that a dict of columns matches the row input."""
+        rows = self.create_state_rows()
+        columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+        fig = self.factory.create_state_ranking_chart(columns, top_n=3)
+
+        assert self.ranking_bars(fig) == (["CA", "TX", "WA"], [9.0, 5.0, 5.0])
+
+    def test_state_ranking_arrow_table(self):
+        """Test that an Arrow table matches the row input."""
+        table = pa.Table.from_pylist(
+            self.create_state_rows() + [{"performance_state_code": "ZZ"}]
+        )
+
+        fig = self.factory.create_state_ranking_chart(table, top_n=4)
+
+        assert self.ranking_bars(fig) == (
+            ["CA", "TX", "WA", "NY"],
+            [9.0, 5.0, 5.0, 2.5],
+        )
+
+    def test_state_ranking_empty(self):
+        """Test that empty or state-less input gives an empty figure."""
+        assert len(self.factory.create_state_ranking_chart([]).data) == 0
+        assert len(self.factory.create_state_ranking_chart({}).data) == 0
+        no_state = pa.table({"total_funding": [1.0]})
+        assert len(self.factory.create_state_ranking_chart(no_state).data) == 0
+
+    def test_geographic_map_objects_are_not_shared(self):
+        """Test that map objects are fresh and only rendered HTML is cached."""
+        rows = self.create_state_rows()
+
+        first = self.factory.create_geographic_map(rows)
+        second = self.factory.create_geographic_map(rows)
+        html = self.factory.create_geographic_map(rows, pre_rendered=True)
+
+        assert first is not second
+        assert isinstance(html, str)
+        assert self.factory.create_geographic_map(rows, pre_rendered=True) is html
+
+    def test_recipient_scatter_keeps_exact_funding(self):
+        """Test that hovered funding keeps cents while sizes are narrowed."""
+        rows = [
+            {"recipient_name": "A", "total_funding": 123456789.0, "award_count": 3},
+            {"recipient_name": "B", "total_funding": 5.5, "award_count": 1},
+        ]
+
+        fig = self.factory.create_recipient_scatter(rows, dict_mode=True)
+        trace = fig["data"][0]
+
+        assert list(trace["y"]) == [123456789.0, 5.5]
+        assert trace["marker"]["size"].dtype == np.float32